@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+COMPILED PLAYER POOL
+====================
+Array view of a player pool, built once and shared by every solve
+
+Holds salary/score vectors, a position-eligibility bitmask per player
+(multi-position "1B/OF" sets several bits) and team/game index arrays.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from player_table import PlayerTable
+
+logger = logging.getLogger(__name__)
+
+# DraftKings classic roster
+POSITIONS = ['P', 'C', '1B', '2B', '3B', 'SS', 'OF']
+POSITION_BITS = {pos: 1 << i for i, pos in enumerate(POSITIONS)}
+PITCHER_POSITIONS = {'P', 'SP', 'RP'}
+DK_SLOTS = ['P', 'P', 'C', '1B', '2B', '3B', 'SS', 'OF', 'OF', 'OF']
+
+
+def eligibility_mask(position: str) -> int:
+    """Bitmask of roster positions a DK position string can fill"""
+    if position in PITCHER_POSITIONS:
+        return POSITION_BITS['P']
+
+    mask = 0
+    for pos in position.split('/'):
+        mask |= POSITION_BITS.get(pos, 0)
+    return mask
+
+
+def position_groups(masks) -> List[int]:
+    """
+    Position sets (bitmasks) linked by multi-position eligibility
+
+    A set is returned when the multi-position masks inside it connect all
+    of its positions; every single position is its own group.
+    """
+    multi = {int(m) for m in masks if m & (m - 1)}
+    groups = []
+    for group in range(1, 1 << len(POSITIONS)):
+        reach = group & -group
+        grown = True
+        while grown:
+            grown = False
+            for m in multi:
+                if not m & ~group and m & reach and m & ~reach:
+                    reach |= m
+                    grown = True
+        if reach == group:
+            groups.append(group)
+    return groups
+
+
+def game_key(player) -> str:
+    """Stable game identifier ("NYY@BOS") from game_info or team/opponent"""
+    game_info = getattr(player, 'game_info', '') or ''
+    if game_info:
+        return game_info.split()[0]
+
+    opponent = getattr(player, 'opponent', '') or ''
+    return '@'.join(sorted([player.team, opponent])) if opponent else player.team
+
+
+@dataclass
+class CompiledPool:
+    """Struct-of-arrays snapshot of a player pool"""
+    players: List
+    salary: np.ndarray
+    score: np.ndarray
+    projection: np.ndarray
+    eligibility: np.ndarray  # uint8 bitmask over POSITIONS
+    team_idx: np.ndarray
+    teams: List[str]
+    game_idx: np.ndarray
+    games: List[str]
+
+    @classmethod
+    def from_players(cls, players: List) -> 'CompiledPool':
+        """Compile a list of Player objects (read column-wise when they are PlayerTable rows)"""
+        backing = PlayerTable.backing(players)
+        if backing is not None:
+            return cls._from_table(list(players), *backing)
+
+        team_codes: Dict[str, int] = {}
+        game_codes: Dict[str, int] = {}
+
+        team_idx = np.array([team_codes.setdefault(p.team, len(team_codes)) for p in players],
+                            dtype=np.int32)
+        game_idx = np.array([game_codes.setdefault(game_key(p), len(game_codes)) for p in players],
+                            dtype=np.int32)
+
+        return cls(
+            players=list(players),
+            salary=np.array([p.salary for p in players], dtype=np.int64),
+            score=np.array([p.optimization_score for p in players], dtype=float),
+            projection=np.array([p.projection for p in players], dtype=float),
+            eligibility=np.array([eligibility_mask(p.position) for p in players], dtype=np.uint8),
+            team_idx=team_idx,
+            teams=list(team_codes),
+            game_idx=game_idx,
+            games=list(game_codes),
+        )
+
+    @classmethod
+    def _from_table(cls, players: List, table: PlayerTable, rows: np.ndarray) -> 'CompiledPool':
+        positions = table.column('position', rows).tolist()
+        masks = {pos: eligibility_mask(pos) for pos in set(positions)}
+
+        # Game keys from the few distinct game_info strings; players without one fall back
+        infos = table.column('game_info', rows).tolist()
+        keys = {info: info.split()[0] for info in set(infos) if info}
+
+        team_codes: Dict[str, int] = {}
+        game_codes: Dict[str, int] = {}
+        team_idx = np.array([team_codes.setdefault(team, len(team_codes))
+                             for team in table.column('team', rows).tolist()], dtype=np.int32)
+        game_idx = np.array([game_codes.setdefault(keys.get(info) or game_key(p), len(game_codes))
+                             for info, p in zip(infos, players)], dtype=np.int32)
+
+        return cls(
+            players=players,
+            salary=table.column('salary', rows).astype(np.int64),
+            score=table.column('optimization_score', rows).astype(float),
+            projection=table.column('projection', rows).astype(float),
+            eligibility=np.array([masks[pos] for pos in positions], dtype=np.uint8),
+            team_idx=team_idx,
+            teams=list(team_codes),
+            game_idx=game_idx,
+            games=list(game_codes),
+        )
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    @property
+    def is_pitcher(self) -> np.ndarray:
+        return (self.eligibility & POSITION_BITS['P']) != 0
+
+    @property
+    def eligibility_matrix(self) -> np.ndarray:
+        """Boolean players x POSITIONS matrix"""
+        bits = np.array([POSITION_BITS[pos] for pos in POSITIONS], dtype=np.uint8)
+        return (self.eligibility[:, None] & bits[None, :]) != 0
+
+    def eligible(self, position: str) -> np.ndarray:
+        """Boolean mask of players eligible for a roster position"""
+        return (self.eligibility & POSITION_BITS[position]) != 0
+
+    def team_members(self) -> Dict[str, np.ndarray]:
+        """Player indices grouped by team"""
+        order = np.argsort(self.team_idx, kind='stable')
+        bounds = np.searchsorted(self.team_idx[order], np.arange(len(self.teams) + 1))
+        return {team: order[bounds[t]:bounds[t + 1]] for t, team in enumerate(self.teams)}
+
+    def refresh_scores(self):
+        """Re-read optimization_score after strategy/scoring changed it"""
+        backing = PlayerTable.backing(self.players)
+        if backing is not None:
+            table, rows = backing
+            self.score = table.column('optimization_score', rows).astype(float)
+        else:
+            self.score = np.array([p.optimization_score for p in self.players], dtype=float)
+
+    def with_scores(self, scores) -> 'CompiledPool':
+        """Same pool with a different objective vector (arrays are shared)"""
+        return replace(self, score=np.asarray(scores, dtype=float))
+
+    def subset(self, indices) -> 'CompiledPool':
+        """Pool restricted to the given player indices (team/game codes kept)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        return replace(
+            self,
+            players=[self.players[i] for i in indices],
+            salary=self.salary[indices],
+            score=self.score[indices],
+            projection=self.projection[indices],
+            eligibility=self.eligibility[indices],
+            team_idx=self.team_idx[indices],
+            game_idx=self.game_idx[indices],
+        )
+
+    def assign_slots(self, indices: List[int]) -> Optional[List[int]]:
+        """
+        Order a lineup's player indices by DK slot (P, P, C, 1B, 2B, 3B, SS, OF, OF, OF)
+
+        Backtracks over the eligibility bitmasks so multi-position players
+        land wherever the rest of the roster needs them.
+        """
+        indices = list(indices)
+        slot_bits = [POSITION_BITS[pos] for pos in DK_SLOTS]
+        filled: List[int] = []
+        used = set()
+
+        def place(slot: int) -> bool:
+            if slot == len(slot_bits):
+                return True
+            for i in indices:
+                if i not in used and self.eligibility[i] & slot_bits[slot]:
+                    used.add(i)
+                    filled.append(i)
+                    if place(slot + 1):
+                        return True
+                    used.discard(i)
+                    filled.pop()
+            return False
+
+        return filled if place(0) else None
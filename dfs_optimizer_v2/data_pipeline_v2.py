@@ -7,17 +7,72 @@ Properly handles confirmed player filtering and pool building
 
 import csv
 import logging
+import sys
 from typing import List, Dict, Optional, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from copy import deepcopy
+
+import numpy as np
+
 from strategies_v2 import StrategyManager
 from optimizer_v2 import DFSOptimizer
+from compiled_pool import CompiledPool
+from player_table import PlayerTable
+from slate_loader import STRING_COLUMNS, load_slate
+from solution_pool import SolutionPool
 from lineup_diversity_engine import LineupDiversityEngine, DiversityConfig
+from enrichment_scheduler import EnrichmentScheduler
 
 logger = logging.getLogger(__name__)
 
+# Salary-based default stats: {stat: (top tier, middle tier, bottom tier)}
+BATTER_SALARY_TIERS = (5500, 4500)
+BATTER_DEFAULTS = {
+    'barrel_rate': (10.0, 8.5, 6.5),
+    'xwoba': (0.340, 0.320, 0.300),
+    'hard_hit_rate': (45.0, 40.0, 35.0),
+    'recent_form': (1.05, 1.0, 0.95),
+}
+PITCHER_SALARY_TIERS = (8000, 6000)
+PITCHER_DEFAULTS = {
+    'k_rate': (10.0, 8.5, 7.0),
+    'era': (3.20, 3.80, 4.50),
+    'whip': (1.10, 1.25, 1.40),
+}
+
+
+class CategoryCodes:
+    """Interned values of one categorical Player field and their small-int codes"""
 
-@dataclass
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.shared: Dict[str, str] = {}  # value -> its interned string
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(sys.intern(value))
+            self.shared[value] = self.values[code]
+        return code
+
+    def intern(self, value):
+        """The shared string object for value (non-strings pass through)"""
+        shared = self.shared.get(value)
+        if shared is None:
+            if not isinstance(value, str):
+                return value
+            shared = self.values[self.code(value)]
+        return shared
+
+
+# Lookup tables shared by every Player
+CATEGORIES = {name: CategoryCodes() for name in ('position', 'team', 'opponent', 'game_info')}
+_POSITIONS, _TEAMS, _OPPONENTS, _GAMES = CATEGORIES.values()
+
+
+@dataclass(slots=True)
 class Player:
     """Enhanced Player data structure with all modern DFS metrics"""
     # Core attributes
@@ -62,8 +117,18 @@ class Player:
     ceiling_projection: float = 0.0
     floor_projection: float = 0.0
 
+    # Attributes outside the fields (strategy flags, simulation stats);
+    # read and written with player_table.get_extra / set_extra
+    _extra: Optional[Dict] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """Calculate derived metrics after initialization"""
+        # One shared string per team/position/game across all players
+        self.position = _POSITIONS.intern(self.position)
+        self.team = _TEAMS.intern(self.team)
+        self.opponent = _OPPONENTS.intern(self.opponent)
+        self.game_info = _GAMES.intern(self.game_info)
+
         # Set ownership_projection alias
         self.ownership_projection = self.ownership
 
@@ -77,34 +142,82 @@ class Player:
         if self.optimization_score == 0:
             self.optimization_score = self.projection
 
+    @staticmethod
+    def table_from_slate(records) -> PlayerTable:
+        """PlayerTable for a parsed slate (slate_loader), deriving fields like __post_init__"""
+        columns = {}
+        for name in STRING_COLUMNS:
+            if name in CATEGORIES:
+                uniques, inverse = np.unique(records[name], return_inverse=True)
+                shared = np.empty(len(uniques), dtype=object)
+                shared[:] = [CATEGORIES[name].intern(str(u)) for u in uniques]
+                columns[name] = shared[inverse.reshape(-1)]
+            else:
+                columns[name] = records[name].astype(object)
+        columns['salary'] = records['salary']
+        columns['projection'] = projection = np.asarray(records['projection'], dtype=float)
+
+        # Missing IDs fall back to a name hash
+        ids = columns['player_id']
+        for i in np.flatnonzero(ids == ''):
+            ids[i] = str(hash(columns['name'][i]))
+
+        columns['optimization_score'] = projection
+        columns['ceiling_projection'] = projection * 1.6
+        columns['floor_projection'] = np.maximum(0, projection * 0.6)
+        table = PlayerTable.from_columns(columns, Player)
+        table.set('ownership_projection', table.column('ownership'))
+        return table
+
+    @property
+    def team_code(self) -> int:
+        return CATEGORIES['team'].code(self.team)
+
+    @property
+    def position_code(self) -> int:
+        return CATEGORIES['position'].code(self.position)
+
+    @property
+    def game_code(self) -> int:
+        return CATEGORIES['game_info'].code(self.game_info)
+
 
 class DFSPipeline:
     """Fixed data pipeline with proper confirmation handling"""
 
     def __init__(self):
+        # Players are row views of self.table (the columnar store)
+        self.table: Optional[PlayerTable] = None
         self.all_players: List[Player] = []
         self.player_pool: List[Player] = []
         self.num_games: int = 0
+        self._compiled_pool: Optional[CompiledPool] = None
+        self._compiled_source: Optional[List[Player]] = None
         self.strategy_manager = StrategyManager()
         self.optimizer = DFSOptimizer()
         self.diversity_engine = LineupDiversityEngine()
+        self.enrichment = EnrichmentScheduler()
+        self.solution_pool: Optional[SolutionPool] = None
+        self.strategy_name: Optional[str] = None
+
+    @property
+    def compiled_pool(self) -> CompiledPool:
+        """Array view of player_pool, compiled once per pool build"""
+        if (self._compiled_pool is None or self._compiled_source is not self.player_pool
+                or len(self._compiled_pool) != len(self.player_pool)):
+            self._compiled_pool = CompiledPool.from_players(self.player_pool)
+            self._compiled_source = self.player_pool
+        return self._compiled_pool
 
     def load_csv(self, csv_path: str) -> tuple:
         """Load DraftKings CSV"""
         try:
-            self.all_players = []
-            games_seen = set()
-
-            with open(csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    player = self._create_player_from_csv(row)
-                    if player:
-                        self.all_players.append(player)
-                        if player.game_info:
-                            games_seen.add(player.game_info)
-
-            self.num_games = len(games_seen)
+            # Parsed columns, or a memory-mapped snapshot if this file was seen before
+            records = load_slate(csv_path, self.optimizer.config.cache_dir)
+            self.table = Player.table_from_slate(records)
+            self.all_players = self.table.rows()
+            self.num_games = len(set(self.table.column('game_info').tolist()) - {''})
+            self.enrichment.reset()  # Prefetched sources belong to the previous slate
             logger.info(f"Loaded {len(self.all_players)} players from {self.num_games} games")
             return len(self.all_players), self.num_games
 
@@ -112,33 +225,6 @@ class DFSPipeline:
             logger.error(f"Error loading CSV: {e}")
             return 0, 0
 
-    def _create_player_from_csv(self, row: dict) -> Optional[Player]:
-        """Create a Player object from CSV row"""
-        try:
-            name = row.get('Name', '').strip()
-            position = row.get('Position', '').strip()
-            team = row.get('TeamAbbrev', '').strip()
-            salary = int(row.get('Salary', '0').replace('$', '').replace(',', ''))
-            proj = float(row.get('AvgPointsPerGame', '0') or 10.0)
-
-            player = Player(
-                name=name,
-                position=position,
-                team=team,
-                salary=salary,
-                projection=proj,
-                optimization_score=proj,  # Initialize with projection
-                opponent=row.get('Opponent', ''),
-                game_info=row.get('Game Info', ''),
-                player_id=row.get('ID', '') or row.get('PlayerID', '') or str(hash(name))
-            )
-
-            return player
-
-        except Exception as e:
-            logger.debug(f"Error creating player: {e}")
-            return None
-
     def fetch_confirmations(self) -> tuple:
         """
         FIXED: Properly mark confirmed players based on MLB data
@@ -147,16 +233,12 @@ class DFSPipeline:
         logger.info("Fetching MLB confirmations...")
 
         try:
-            from smart_confirmation import UniversalSmartConfirmation
-
-            # Create confirmation system with current players
-            confirmations = UniversalSmartConfirmation(
-                csv_players=deepcopy(self.all_players),
-                verbose=True
-            )
-
-            # Get confirmations from MLB
-            lineup_count, pitcher_count = confirmations.get_all_confirmations()
+            # Vegas and weather download in the background while this waits
+            self.prefetch_sources()
+            # The snapshot fallback is only needed when nothing was prefetched
+            fetch = None if self.enrichment.pending('confirmations') else self._confirmation_fetch()
+            confirmations, lineup_count, pitcher_count = \
+                self.enrichment.result('confirmations', fetch).unwrap()
 
             # FIXED: Properly mark players as confirmed
             confirmed_pitchers = 0
@@ -200,26 +282,90 @@ class DFSPipeline:
             logger.error(f"Error during confirmation: {e}")
             return (0, 0, 0)
 
+    def prefetch_sources(self):
+        """
+        Start confirmations, Vegas lines and weather in the background
+
+        None of them depend on the player pool; fetch_confirmations and
+        enrich_players collect the results (each within its deadline).
+        """
+        if self.all_players:
+            self.enrichment.submit('confirmations', self._confirmation_fetch())
+        self.enrichment.submit('vegas', self._fetch_vegas)
+        self.enrichment.submit('weather', self._fetch_weather)
+
+    def _confirmation_fetch(self):
+        """Fetch function returning (confirmations, lineup_count, pitcher_count)"""
+        csv_players = deepcopy(self.all_players)  # Snapshot taken on the calling thread
+
+        def fetch():
+            from smart_confirmation import UniversalSmartConfirmation
+
+            # Create confirmation system with current players
+            confirmations = UniversalSmartConfirmation(csv_players=csv_players, verbose=True)
+
+            # Get confirmations from MLB
+            lineup_count, pitcher_count = confirmations.get_all_confirmations()
+            return confirmations, lineup_count, pitcher_count
+
+        return fetch
+
+    @staticmethod
+    def _fetch_vegas() -> Dict:
+        from vegas_lines import VegasLines
+        return VegasLines().get_all_lines()
+
+    @staticmethod
+    def _fetch_weather() -> Dict:
+        from weather_integration import WeatherIntegration
+        return WeatherIntegration().get_all_weather()
+
+    def _statcast_fetch(self):
+        """Fetch function returning {pool index: Statcast stats} for confirmed players (None if disabled)"""
+        targets = [(i, p.name, p.position in ['P', 'SP', 'RP'])
+                   for i, p in enumerate(self.player_pool) if getattr(p, 'confirmed', False)]
+
+        def fetch():
+            from simple_statcast_fetcher import SimpleStatcastFetcher
+            statcast = SimpleStatcastFetcher()
+
+            # One 30-day window for the whole slate from the local Statcast
+            # store (offline without pybaseball); per-player requests otherwise
+            if not statcast.prefetch_slate() and not statcast.enabled:
+                return None
+
+            # Only fetch for confirmed players
+            logger.info(f"Enriching with real Statcast data for {len(targets)} confirmed players...")
+            fetched = {}
+            for i, name, is_pitcher in targets:
+                try:
+                    fetched[i] = statcast.get_pitcher_stats(name) if is_pitcher \
+                        else statcast.get_batter_stats(name)
+                except Exception as e:
+                    logger.debug(f"Statcast failed for {name}: {e}")
+            return fetched
+
+        return fetch
+
     def build_player_pool(self, confirmed_only: bool = False,
                           manual_selections: List[str] = None) -> int:
         """Build the player pool for optimization"""
         self.player_pool = []
-
-        for player in self.all_players:
-            include = False
-
-            # Check manual selections first (always include)
-            if manual_selections and player.name in manual_selections:
-                include = True
-                logger.debug(f"Including manual selection: {player.name}")
-            # Then check confirmed status
-            elif not confirmed_only:
-                include = True  # Include all if not filtering
-            elif player.confirmed:
-                include = True  # Include only confirmed
-
-            if include:
-                self.player_pool.append(player)
+        self._compiled_pool = None
+
+        # Players assigned directly (not via load_csv) move into a table first
+        if self.all_players and PlayerTable.backing(self.all_players) is None:
+            self.table = PlayerTable.from_players(self.all_players)
+            self.all_players = self.table.rows()
+
+        if self.all_players:
+            _, rows = PlayerTable.backing(self.all_players)
+            # Manual selections always included, then everyone or confirmed only
+            include = np.full(len(rows), not confirmed_only)
+            include |= self.table.column('confirmed', rows)
+            if manual_selections:
+                include |= np.isin(self.table.column('name', rows), list(manual_selections))
+            self.player_pool = self.table.rows(rows[include])
 
         logger.info(f"Built pool: {len(self.player_pool)} players (confirmed_only={confirmed_only})")
 
@@ -270,6 +416,7 @@ class DFSPipeline:
             self.player_pool, strategy_name
         )
 
+        self.strategy_name = strategy_name
         logger.info(f"Applied strategy: {strategy_name}")
         return strategy_name
 
@@ -283,151 +430,58 @@ class DFSPipeline:
             'ownership': 0
         }
 
-        # Try Vegas lines
+        # Network sources run concurrently; prefetched ones are already underway
+        fetches = {'vegas': self._fetch_vegas, 'weather': self._fetch_weather}
+        if not skip_statcast:
+            fetches['statcast'] = self._statcast_fetch()
+        results = self.enrichment.gather(fetches)
+
+        # Vegas lines
         try:
-            from vegas_lines import VegasLines
-            vegas = VegasLines()
-            vegas_data = vegas.get_all_lines()
-
-            for player in self.player_pool:
-                if player.team in vegas_data:
-                    team_data = vegas_data[player.team]
-                    team_total = team_data.get('total', 4.5)
-                    game_total = team_data.get('game_total', 8.5)
-
-                    # Set team context
-                    player.implied_team_score = team_total
-                    player.game_total = game_total
-
-                    # Apply scoring boost (moved to scoring engine)
-                    stats['vegas'] += 1
-                    logger.debug(f"✅ Vegas data for {player.name}: Team {team_total}, Game {game_total}")
+            vegas_data = results['vegas'].unwrap()
+
+            table, rows = self._pool_backing()
+            teams = table.column('team', rows)
+            for team, team_data in vegas_data.items():
+                on_team = rows[teams == team]
+                if not len(on_team):
+                    continue
+
+                # Set team context (scoring boost happens in the scoring engine)
+                table.set('implied_team_score', team_data.get('total', 4.5), on_team)
+                table.set('game_total', team_data.get('game_total', 8.5), on_team)
+                stats['vegas'] += len(on_team)
+                logger.debug(f"✅ Vegas data for {team} ({len(on_team)} players): "
+                             f"Team {team_data.get('total', 4.5)}, Game {team_data.get('game_total', 8.5)}")
         except Exception as e:
             logger.debug(f"Vegas enrichment failed: {e}")
 
-        # Try real Statcast data for confirmed players (unless skipped)
-        if not skip_statcast:
+        # Real Statcast data for confirmed players over the salary-based defaults
+        self._set_default_stats()
+        if skip_statcast:
+            # Fast mode - defaults only
+            logger.info("Fast mode: Using default stats (skipping Statcast)")
+            stats['statcast'] += len(self.player_pool)
+        else:
             try:
-                from simple_statcast_fetcher import SimpleStatcastFetcher
-                statcast = SimpleStatcastFetcher()
-
-                if statcast.enabled:
-                    confirmed_players = [p for p in self.player_pool if getattr(p, 'confirmed', False)]
-                    logger.info(f"Enriching with real Statcast data for {len(confirmed_players)} confirmed players...")
-
-                    statcast_fetched = 0
-                    for i, player in enumerate(self.player_pool):
-                        if player.position not in ['P', 'SP', 'RP']:
-                            # BATTER ENRICHMENT
-                            # Only fetch for confirmed players to save API calls
-                            if getattr(player, 'confirmed', False):
-                                try:
-                                    real_stats = statcast.get_batter_stats(player.name)
-                                    if real_stats:
-                                        # Set all Statcast metrics
-                                        player.barrel_rate = real_stats.get('barrel%', 8.5)
-                                        player.xwoba = real_stats.get('xwoba', 0.320)
-                                        player.hard_hit_rate = real_stats.get('hard_hit%', 40.0)
-                                        player.avg_exit_velo = real_stats.get('avg_exit_velo', 88.0)
-
-                                        # Calculate recent form from xwOBA
-                                        if player.xwoba > 0.350:
-                                            player.recent_form = 1.15
-                                        elif player.xwoba > 0.320:
-                                            player.recent_form = 1.05
-                                        else:
-                                            player.recent_form = 0.95
-
-                                        stats['statcast'] += 1
-                                        statcast_fetched += 1
-                                        logger.info(f"✅ Statcast {statcast_fetched}/{len(confirmed_players)}: {player.name} - {player.barrel_rate:.1f}% barrel")
-                                        logger.debug(f"✅ Real Statcast for {player.name}: {player.barrel_rate:.1f}% barrel, {player.xwoba:.3f} xwOBA")
-                                    else:
-                                        self._set_default_batter_stats(player)
-                                except Exception as e:
-                                    logger.debug(f"Statcast failed for {player.name}: {e}")
-                                    self._set_default_batter_stats(player)
-                            else:
-                                # Use defaults for unconfirmed players
-                                self._set_default_batter_stats(player)
-                        else:
-                            # PITCHER ENRICHMENT
-                            if getattr(player, 'confirmed', False):
-                                # Try real pitcher Statcast data for confirmed pitchers
-                                try:
-                                    real_pitcher_stats = statcast.get_pitcher_stats(player.name)
-                                    if real_pitcher_stats and real_pitcher_stats.get('has_recent_data', False):
-                                        # Use real data if available (with validation)
-                                        k_rate = real_pitcher_stats.get('k_rate', 8.0)
-                                        era = real_pitcher_stats.get('era', 4.00)
-                                        whip = real_pitcher_stats.get('whip', 1.30)
-
-                                        # Validate K-rate (reject if too low)
-                                        if k_rate >= 6.0:  # Minimum reasonable K-rate
-                                            player.k_rate = k_rate
-                                        else:
-                                            # Use salary-based default for bad data
-                                            self._set_default_pitcher_stats(player)
-
-                                        player.era = era
-                                        player.whip = whip
-                                        player.recent_form = real_pitcher_stats.get('quality_score', 1.0)
-                                        stats['statcast'] += 1
-                                        statcast_fetched += 1
-                                        logger.info(f"✅ Pitcher Statcast {statcast_fetched}: {player.name} - K/9 {player.k_rate:.1f}")
-                                        logger.debug(f"✅ Real pitcher Statcast for {player.name}: K/9 {player.k_rate:.1f}, ERA {player.era:.2f}")
-                                    else:
-                                        # Fall back to salary-based defaults
-                                        self._set_default_pitcher_stats(player)
-                                except Exception as e:
-                                    logger.debug(f"Pitcher Statcast failed for {player.name}: {e}")
-                                    self._set_default_pitcher_stats(player)
-                            else:
-                                # Use defaults for unconfirmed pitchers
-                                self._set_default_pitcher_stats(player)
+                fetched = results['statcast'].unwrap()
+                if fetched is None:
+                    stats['statcast'] += len(self.player_pool)  # Fetcher disabled: defaults
                 else:
-                    # Fallback to defaults
-                    for player in self.player_pool:
-                        if player.position not in ['P', 'SP', 'RP']:
-                            self._set_default_batter_stats(player)
-                        else:
-                            self._set_default_pitcher_stats(player)
-                        stats['statcast'] += 1
-
+                    stats['statcast'] += self._apply_statcast(fetched)
             except Exception as e:
                 logger.debug(f"Statcast enrichment failed: {e}")
-                # Fallback to defaults
-                for player in self.player_pool:
-                    if player.position not in ['P', 'SP', 'RP']:
-                        self._set_default_batter_stats(player)
-                    else:
-                        self._set_default_pitcher_stats(player)
-                    stats['statcast'] += 1
-        else:
-            # Fast mode - use defaults immediately
-            logger.info("Fast mode: Using default stats (skipping Statcast)")
-            for player in self.player_pool:
-                if player.position not in ['P', 'SP', 'RP']:
-                    self._set_default_batter_stats(player)
-                else:
-                    self._set_default_pitcher_stats(player)
-                stats['statcast'] += 1
+                stats['statcast'] += len(self.player_pool)
 
-        # Try weather data
+        # Weather data
         try:
-            from weather_integration import WeatherIntegration
-            weather = WeatherIntegration()
-            weather_data = weather.get_all_weather()
+            weather_data = results['weather'].unwrap()
 
-            for player in self.player_pool:
-                # Simple weather scoring (wind/temp effects)
-                weather_score = 1.0
-                if weather_data:
-                    # Positive weather = higher scoring
-                    weather_score = 1.05 if len(weather_data) > 0 else 1.0
-
-                player.weather_score = weather_score
-                stats['weather'] += 1
+            # Simple weather scoring (wind/temp effects): positive weather = higher scoring
+            weather_score = 1.05 if weather_data else 1.0
+            table, rows = self._pool_backing()
+            table.set('weather_score', weather_score, rows)
+            stats['weather'] += len(rows)
 
         except Exception as e:
             logger.debug(f"Weather enrichment failed: {e}")
@@ -437,51 +491,82 @@ class DFSPipeline:
             from ownership_calculator import OwnershipCalculator
             ownership_calc = OwnershipCalculator()
 
-            for player in self.player_pool:
-                ownership = ownership_calc.get_ownership(player)
-                player.ownership = ownership
-                player.ownership_projection = ownership  # Alias for scoring engine
-                stats['ownership'] += 1
+            table, rows = self._pool_backing()
+            ownership = ownership_calc.ownership_array(table, rows)
+            table.set('ownership', ownership, rows)
+            table.set('ownership_projection', ownership, rows)  # Alias for scoring engine
+            stats['ownership'] += len(rows)
 
         except Exception as e:
             logger.debug(f"Ownership enrichment failed: {e}")
 
         return stats
 
-    def _set_default_batter_stats(self, player):
-        """Set default stats for batters"""
-        # Salary-based defaults (higher salary = better stats)
-        if player.salary >= 5500:
-            player.barrel_rate = 10.0
-            player.xwoba = 0.340
-            player.hard_hit_rate = 45.0
-            player.recent_form = 1.05
-        elif player.salary >= 4500:
-            player.barrel_rate = 8.5
-            player.xwoba = 0.320
-            player.hard_hit_rate = 40.0
-            player.recent_form = 1.0
-        else:
-            player.barrel_rate = 6.5
-            player.xwoba = 0.300
-            player.hard_hit_rate = 35.0
-            player.recent_form = 0.95
-
-    def _set_default_pitcher_stats(self, player):
-        """Set default stats for pitchers"""
-        # Salary-based defaults
-        if player.salary >= 8000:
-            player.k_rate = 10.0
-            player.era = 3.20
-            player.whip = 1.10
-        elif player.salary >= 6000:
-            player.k_rate = 8.5
-            player.era = 3.80
-            player.whip = 1.25
-        else:
-            player.k_rate = 7.0
-            player.era = 4.50
-            player.whip = 1.40
+    def _apply_statcast(self, fetched: Dict) -> int:
+        """Overlay fetched Statcast stats on pool players; returns how many were used"""
+        applied = 0
+        for i, real_stats in sorted(fetched.items()):
+            player = self.player_pool[i]
+            if player.position in ['P', 'SP', 'RP']:
+                # Pitchers keep their defaults without recent data
+                if not real_stats or not real_stats.get('has_recent_data', False):
+                    continue
+
+                # Validate K-rate (too low = bad data, keep the salary-based default)
+                k_rate = real_stats.get('k_rate', 8.0)
+                if k_rate >= 6.0:
+                    player.k_rate = k_rate
+                player.era = real_stats.get('era', 4.00)
+                player.whip = real_stats.get('whip', 1.30)
+                player.recent_form = real_stats.get('quality_score', 1.0)
+                applied += 1
+                logger.info(f"✅ Pitcher Statcast {applied}: {player.name} - K/9 {player.k_rate:.1f}")
+                logger.debug(f"✅ Real pitcher Statcast for {player.name}: K/9 {player.k_rate:.1f}, ERA {player.era:.2f}")
+            else:
+                if not real_stats:
+                    continue
+
+                # Set all Statcast metrics
+                player.barrel_rate = real_stats.get('barrel%', 8.5)
+                player.xwoba = real_stats.get('xwoba', 0.320)
+                player.hard_hit_rate = real_stats.get('hard_hit%', 40.0)
+                player.avg_exit_velo = real_stats.get('avg_exit_velo', 88.0)
+
+                # Calculate recent form from xwOBA
+                if player.xwoba > 0.350:
+                    player.recent_form = 1.15
+                elif player.xwoba > 0.320:
+                    player.recent_form = 1.05
+                else:
+                    player.recent_form = 0.95
+
+                applied += 1
+                logger.info(f"✅ Statcast {applied}/{len(fetched)}: {player.name} - {player.barrel_rate:.1f}% barrel")
+                logger.debug(f"✅ Real Statcast for {player.name}: {player.barrel_rate:.1f}% barrel, {player.xwoba:.3f} xwOBA")
+        return applied
+
+    def _pool_backing(self):
+        """(table, rows) behind player_pool, moving a plain Player list into a table if needed"""
+        backing = PlayerTable.backing(self.player_pool)
+        if backing is None and not self.player_pool:
+            return PlayerTable.from_players([], Player), np.zeros(0, dtype=np.int64)
+        if backing is None:
+            self.table = PlayerTable.from_players(self.player_pool, Player)
+            self.player_pool = self.table.rows()
+            self._compiled_pool = None
+            backing = self.table, np.arange(len(self.table))
+        return backing
+
+    def _set_default_stats(self):
+        """Salary-based default stats for the whole pool, a column at a time"""
+        table, rows = self._pool_backing()
+        pitcher = table.is_pitcher(rows)
+        for group, thresholds, defaults in ((rows[~pitcher], BATTER_SALARY_TIERS, BATTER_DEFAULTS),
+                                            (rows[pitcher], PITCHER_SALARY_TIERS, PITCHER_DEFAULTS)):
+            salary = table.column('salary', group)
+            tiers = [salary >= t for t in thresholds]
+            for stat, values in defaults.items():
+                table.set(stat, np.select(tiers, values[:-1], default=values[-1]), group)
 
     def score_players(self, contest_type: str = 'gpp') -> Dict:
         """Score players using the unified scoring engine"""
@@ -512,11 +597,21 @@ class DFSPipeline:
             return {}
 
     def optimize_lineups(self, contest_type: str = 'gpp',
-                         num_lineups: int = 1, use_diversity: bool = None) -> List[Dict]:
-        """Generate optimized lineups with optional diversity"""
+                         num_lineups: int = 1, use_diversity: bool = None,
+                         workers: Optional[int] = None) -> List[Dict]:
+        """
+        Generate optimized lineups with optional diversity
+
+        workers > 1 spreads diverse-lineup solves over a process pool for this
+        call (OptimizerConfig.workers when None); results are deterministic.
+        """
         logger.info(f"Optimizing {num_lineups} {contest_type} lineups...")
         logger.info(f"Pool has {len(self.player_pool)} players")
 
+        # Scores may have changed since the pool was compiled
+        pool = self.compiled_pool
+        pool.refresh_scores()
+
         # Auto-enable diversity for multiple lineups in tournaments
         if use_diversity is None:
             use_diversity = (num_lineups > 1 and contest_type == 'gpp')
@@ -525,19 +620,122 @@ class DFSPipeline:
             # Use diversity engine for multiple tournament lineups
             logger.info(f"Using diversity engine for {num_lineups} lineups")
             lineups = self.diversity_engine.generate_diverse_lineups(
-                self.optimizer, self.player_pool, contest_type, num_lineups
+                self.optimizer, pool, contest_type, num_lineups, workers
             )
         else:
             # Use standard optimizer
             lineups = self.optimizer.optimize(
-                self.player_pool,
+                pool,
                 contest_type,
-                num_lineups
+                num_lineups,
+                workers=workers
             )
 
         logger.info(f"Generated {len(lineups)} lineups")
         return lineups
 
+    def optimize_stacked_lineups(self, contest_type: str = 'gpp', num_lineups: int = 1,
+                                 strategy: Optional[str] = None) -> List[Dict]:
+        """
+        Lineups built around the strategy's preferred team stacks
+
+        Falls back to optimize_lineups when the strategy does not stack.
+        """
+        from stack_catalog import StackCatalog
+
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        catalog = StackCatalog(pool)
+        stacks = self.strategy_manager.select_stacks(catalog, strategy or self.strategy_name,
+                                                     max(num_lineups * 2, 10))
+        if not stacks:
+            return self.optimize_lineups(contest_type, num_lineups)
+        return self.optimizer.optimize_stacked(pool, contest_type, num_lineups,
+                                               stacks=stacks, catalog=catalog)
+
+    def sweep(self, grid, contest_type: str = 'gpp') -> List[Dict]:
+        """Best lineup for every what-if setting combination (see DFSOptimizer.sweep)"""
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        return self.optimizer.sweep(pool, contest_type, grid)
+
+    def optimize_randomized(self, contest_type: str = 'gpp', num_lineups: int = 20,
+                            spread: float = 1.0, seed: Optional[int] = None) -> List[Dict]:
+        """
+        GPP lineups from sampled projections (one solve per sample)
+
+        seed defaults to the diversity engine's seed.
+        """
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        if seed is None:
+            seed = self.diversity_engine.config.seed
+        lineups = self.optimizer.optimize_randomized(pool, contest_type, num_lineups,
+                                                     spread=spread, seed=seed)
+        logger.info(f"Generated {len(lineups)} randomized lineups")
+        return lineups
+
+    def pareto_front(self, contest_type: str = 'gpp', num_points: int = 20):
+        """Projection vs. ownership frontier lineups (see DFSOptimizer.pareto_front)"""
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        front = self.optimizer.pareto_front(pool, contest_type, num_points)
+        logger.info(f"Pareto front holds {len(front)} lineups")
+        return front
+
+    def optimize_portfolio(self, contest_type: str = 'gpp', num_lineups: int = 20,
+                           portfolio_config=None) -> List[Dict]:
+        """
+        Choose num_lineups lineups jointly (PortfolioOptimizer)
+
+        Exposure and overlap rules default to the diversity engine's config.
+        """
+        from portfolio_optimizer import PortfolioConfig
+
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        if portfolio_config is None:
+            portfolio_config = PortfolioConfig.from_diversity(self.diversity_engine.config)
+        lineups = self.optimizer.optimize_portfolio(pool, contest_type, num_lineups,
+                                                    portfolio_config)
+        logger.info(f"Generated portfolio of {len(lineups)} lineups")
+        return lineups
+
+    def late_swap(self, lineups: List[Dict], locked_games,
+                  contest_type: str = 'gpp') -> List[Dict]:
+        """
+        Update lineups after some games locked, re-solving only open slots
+
+        locked_games holds game keys ("NYY@BOS") or team abbreviations.
+        """
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        return self.optimizer.late_swap(lineups, locked_games, pool, contest_type)
+
+    def build_solution_pool(self, contest_type: str = 'gpp', size: int = 500,
+                            path: Optional[str] = None) -> SolutionPool:
+        """Solve the `size` best lineups once, for instant late-scratch recovery"""
+        pool = self.compiled_pool
+        pool.refresh_scores()
+        self.solution_pool = self.optimizer.solution_pool(pool, contest_type, size)
+        if path:
+            self.solution_pool.save(path)
+        return self.solution_pool
+
+    def load_solution_pool(self, path: str) -> Optional[SolutionPool]:
+        """Reload a saved solution pool if it matches the current player pool"""
+        self.solution_pool = SolutionPool.load(path, self.compiled_pool)
+        return self.solution_pool
+
+    def recover_lineups(self, scratched, num_lineups: int = 1) -> List[Dict]:
+        """Best pooled lineups without any scratched player (names or Players), no re-solve"""
+        if self.solution_pool is None:
+            logger.error("No solution pool - call build_solution_pool first")
+            return []
+        lineups = self.solution_pool.best(num_lineups, scratched)
+        logger.info(f"Recovered {len(lineups)} lineups from the solution pool")
+        return lineups
+
     def export_lineups(self, lineups: List[Dict], output_path: str) -> bool:
         """Export lineups to CSV"""
         try:
@@ -545,32 +743,14 @@ class DFSPipeline:
                 writer = csv.writer(f)
 
                 for lineup in lineups:
-                    row = []
                     # DraftKings order: P, P, C, 1B, 2B, 3B, SS, OF, OF, OF
-                    position_order = ['P', 'P', 'C', '1B', '2B', '3B', 'SS', 'OF', 'OF', 'OF']
-                    position_filled = {pos: 0 for pos in ['P', 'C', '1B', '2B', '3B', 'SS', 'OF']}
-
-                    for target_pos in position_order:
-                        found = False
-                        for player in lineup['players']:
-                            player_pos = player.position
-                            # Normalize pitcher position
-                            if player_pos in ['SP', 'RP']:
-                                player_pos = 'P'
-
-                            # Check if this player fits this slot
-                            if player_pos == target_pos:
-                                current_count = position_filled[target_pos]
-                                max_count = 2 if target_pos == 'P' else 3 if target_pos == 'OF' else 1
-
-                                if current_count < max_count and player.name not in row:
-                                    row.append(player.name)
-                                    position_filled[target_pos] += 1
-                                    found = True
-                                    break
-
-                        if not found:
-                            row.append("")  # Empty slot
+                    pool, indices = self._lineup_pool(lineup)
+                    slots = pool.assign_slots(indices)
+                    if slots is None:
+                        logger.warning("Lineup does not fill every DK slot")
+                        slots = indices
+                    row = [pool.players[i].name for i in slots]
+                    row += [""] * (10 - len(row))  # Empty slots
 
                     writer.writerow(row)
 
@@ -579,4 +759,14 @@ class DFSPipeline:
 
         except Exception as e:
             logger.error(f"Export error: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def _lineup_pool(self, lineup: Dict) -> tuple:
+        """(CompiledPool, indices) for a lineup, reusing the compiled pool when it matches"""
+        indices = lineup.get('indices')
+        pool = self._compiled_pool
+        if (pool is not None and indices is not None
+                and all(i < len(pool) and pool.players[i] is p
+                        for i, p in zip(indices, lineup['players']))):
+            return pool, list(indices)
+        return CompiledPool.from_players(lineup['players']), list(range(len(lineup['players'])))
\ No newline at end of file
@@ -228,6 +228,26 @@ def test_full_system():
         except Exception as e:
             print(f"❌ Export error: {e}")
 
+    # Test 8: Diverse lineups must not depend on the worker count
+    print("\n🔀 TEST 8: Seeded diverse lineups, workers=1 vs workers=3...")
+    try:
+        from dataclasses import replace
+        from lineup_diversity_engine import LineupDiversityEngine, DiversityConfig
+        # Cheaper copies so the small mock slate fits the cap several times over
+        pool = [replace(p, salary=p.salary * 3 // 4) for p in create_mock_players()]
+        runs = {}
+        for workers in (1, 3):
+            engine = LineupDiversityEngine(DiversityConfig(seed=7))
+            diverse = engine.generate_diverse_lineups(pipeline.optimizer, pool, 'gpp', 5, workers)
+            runs[workers] = [sorted(p.name for p in l['players']) for l in diverse]
+        if runs[1] == runs[3]:
+            print(f"✅ Same {len(runs[1])} lineups for both worker counts")
+        else:
+            print("❌ Worker count changed the lineups")
+            lineups = []
+    except Exception as e:
+        print(f"❌ Diversity error: {e}")
+
     print("\n" + "=" * 60)
     print("TEST COMPLETE")
     print("=" * 60)
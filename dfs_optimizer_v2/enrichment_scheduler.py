@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+ENRICHMENT SCHEDULER
+====================
+Run independent data sources concurrently with per-source deadlines
+
+Vegas lines, weather, Statcast and lineup confirmations all block on
+network I/O and do not depend on each other's results. Each source is a
+no-argument fetch function submitted to a small thread pool; callers
+collect results when they need them, so total latency is the slowest
+source instead of the sum. A source that misses its deadline is reported
+as timed out and the pipeline carries on with defaults (the thread
+itself cannot be interrupted and finishes in the background).
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds each source may take, counted from when it was submitted
+DEFAULT_DEADLINES = {
+    'confirmations': 30.0,
+    'vegas': 10.0,
+    'weather': 10.0,
+    'statcast': 180.0,
+}
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one source fetch"""
+    name: str
+    value: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+    def unwrap(self):
+        """The fetched value, re-raising the source's error or a TimeoutError"""
+        if self.timed_out:
+            raise TimeoutError(f"{self.name} missed its deadline ({self.elapsed:.1f}s)")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class EnrichmentScheduler:
+    """Bounded thread pool of named source fetches"""
+
+    def __init__(self, max_workers: int = 4, deadlines: Optional[Dict[str, float]] = None):
+        self.max_workers = max_workers
+        self.deadlines = dict(DEFAULT_DEADLINES)
+        self.deadlines.update(deadlines or {})
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, tuple] = {}  # name -> (future, start time)
+
+    def submit(self, name: str, fetch: Callable[[], Any]):
+        """Start a source now unless it is already pending"""
+        if name in self._jobs:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='enrich')
+        self._jobs[name] = (self._executor.submit(fetch), time.monotonic())
+
+    def pending(self, name: str) -> bool:
+        return name in self._jobs
+
+    def result(self, name: str, fetch: Optional[Callable[[], Any]] = None) -> SourceResult:
+        """
+        Wait for a source (up to its deadline) and hand over its result
+
+        A source that was never submitted is started with fetch first.
+        Each submission is collected once.
+        """
+        if name not in self._jobs:
+            if fetch is None:
+                raise KeyError(f"Source '{name}' was not submitted")
+            self.submit(name, fetch)
+
+        future, start = self._jobs.pop(name)
+        deadline = self.deadlines.get(name)
+        wait = None if deadline is None else max(0.0, start + deadline - time.monotonic())
+        try:
+            value = future.result(timeout=wait)
+            return SourceResult(name, value, elapsed=time.monotonic() - start)
+        except FutureTimeout:
+            future.cancel()
+            logger.warning(f"{name} missed its {deadline:g}s deadline - using defaults")
+            return SourceResult(name, elapsed=time.monotonic() - start, timed_out=True)
+        except Exception as e:
+            return SourceResult(name, error=e, elapsed=time.monotonic() - start)
+
+    def gather(self, fetches: Dict[str, Callable[[], Any]]) -> Dict[str, SourceResult]:
+        """Start every source not already pending, then collect them all"""
+        for name, fetch in fetches.items():
+            self.submit(name, fetch)
+        results = {name: self.result(name) for name in fetches}
+        timings = ', '.join(f"{r.name} {r.elapsed:.1f}s{'' if r.ok else ' (failed)'}"
+                            for r in results.values())
+        logger.info(f"Enrichment sources: {timings}")
+        return results
+
+    def reset(self):
+        """Forget submitted sources (their results are dropped)"""
+        for future, _ in self._jobs.values():
+            future.cancel()
+        self._jobs.clear()
+
+    def close(self):
+        self.reset()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
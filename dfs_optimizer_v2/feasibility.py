@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+PRE-SOLVE FEASIBILITY CHECK
+===========================
+Fail fast on pools that cannot produce a legal lineup
+
+Runs before the MILP is built so an impossible pool (e.g. confirmed-only
+with no catcher) is reported in milliseconds instead of after a solver
+timeout. Checks:
+- position coverage with multi-eligibility (bipartite matching)
+- cheapest legal roster fits under the salary cap
+- most expensive legal roster can reach the minimum salary
+- a roster exists within the per-team cap (max flow through teams)
+
+Salary checks use scipy's linear_sum_assignment when available and
+per-position bounds otherwise; the bounds can only miss problems, never
+report false ones.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from compiled_pool import CompiledPool, POSITION_BITS
+
+logger = logging.getLogger(__name__)
+
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+@dataclass
+class FeasibilityReport:
+    """Outcome of a pre-solve check"""
+    feasible: bool = True
+    problems: List[str] = field(default_factory=list)
+    min_salary: Optional[int] = None  # Cheapest legal roster (ignoring team caps)
+    max_salary: Optional[int] = None  # Most expensive legal roster (ignoring team caps)
+
+    def fail(self, problem: str):
+        self.feasible = False
+        self.problems.append(problem)
+
+
+def _roster_flow(pool: CompiledPool, positions: Dict[str, int],
+                 max_team: Optional[int] = None) -> int:
+    """
+    Players that can be placed in distinct roster slots at once
+
+    Max flow source -> team (cap max_team) -> player (1) -> position (req)
+    -> sink. Without max_team this is plain bipartite matching.
+    """
+    n, num_teams = len(pool), len(pool.teams)
+    pos_names = list(positions)
+    source, sink = 0, 1
+    team_node = 2
+    player_node = team_node + num_teams
+    pos_node = player_node + n
+
+    graph: List[List[int]] = [[] for _ in range(pos_node + len(pos_names))]
+    cap: Dict = {}
+
+    def edge(u: int, v: int, c: int):
+        graph[u].append(v)
+        graph[v].append(u)
+        cap[(u, v)] = cap.get((u, v), 0) + c
+        cap.setdefault((v, u), 0)
+
+    team_cap = max_team if max_team is not None else n
+    for t in range(num_teams):
+        edge(source, team_node + t, team_cap)
+    for i in range(n):
+        edge(team_node + int(pool.team_idx[i]), player_node + i, 1)
+        for k, pos in enumerate(pos_names):
+            if pool.eligibility[i] & POSITION_BITS[pos]:
+                edge(player_node + i, pos_node + k, 1)
+    for k, pos in enumerate(pos_names):
+        edge(pos_node + k, sink, positions[pos])
+
+    flow = 0
+    need = sum(positions.values())
+    while flow < need:
+        parent = {source: None}
+        queue = deque([source])
+        while queue and sink not in parent:
+            u = queue.popleft()
+            for v in graph[u]:
+                if v not in parent and cap[(u, v)] > 0:
+                    parent[v] = u
+                    queue.append(v)
+        if sink not in parent:
+            break
+        v = sink
+        while parent[v] is not None:
+            u = parent[v]
+            cap[(u, v)] -= 1
+            cap[(v, u)] += 1
+            v = u
+        flow += 1
+    return flow
+
+
+def _salary_extremes(pool: CompiledPool, positions: Dict[str, int]):
+    """(cheapest, most expensive) legal roster salary, or bounds on them"""
+    slots = [pos for pos, req in positions.items() for _ in range(req)]
+    if SCIPY_AVAILABLE:
+        eligible = np.stack([(pool.eligibility & POSITION_BITS[pos]) != 0 for pos in slots], axis=1)
+        big = float(pool.salary.sum() + 1)
+        salary = pool.salary.astype(float)[:, None]
+        extremes = []
+        for sign in (1.0, -1.0):
+            cost = np.where(eligible, sign * salary, big)
+            rows, cols = linear_sum_assignment(cost)
+            extremes.append(int(pool.salary[rows].sum()))
+        return extremes[0], extremes[1]
+
+    # Per-position bounds (a multi-position player may be counted twice)
+    low = high = 0
+    for pos, req in positions.items():
+        salaries = np.sort(pool.salary[pool.eligible(pos)])
+        low += int(salaries[:req].sum())
+        high += int(salaries[::-1][:req].sum())
+    return low, high
+
+
+def check_feasibility(pool: CompiledPool, config, contest_type: str = 'gpp') -> FeasibilityReport:
+    """Check a pool against roster, salary and team-cap rules"""
+    report = FeasibilityReport()
+    positions = config.positions
+    roster_size = sum(positions.values())
+
+    # Plain counts first: gives the clearest message for a missing position
+    for pos, req in positions.items():
+        count = int(pool.eligible(pos).sum())
+        if count < req:
+            report.fail(f"Only {count} players eligible for {pos} (need {req})")
+    if not report.feasible:
+        return report
+
+    placed = _roster_flow(pool, positions)
+    if placed < roster_size:
+        report.fail(f"Multi-position players cannot cover every slot at once "
+                    f"(only {placed}/{roster_size} slots fillable)")
+        return report
+
+    report.min_salary, report.max_salary = _salary_extremes(pool, positions)
+    min_salary = config.min_salary_cash if contest_type == 'cash' else config.min_salary_gpp
+    if report.min_salary > config.salary_cap:
+        report.fail(f"Cheapest legal roster costs ${report.min_salary:,} "
+                    f"(cap ${config.salary_cap:,})")
+    if report.max_salary < min_salary:
+        report.fail(f"Most expensive legal roster costs ${report.max_salary:,} "
+                    f"(minimum ${min_salary:,})")
+
+    max_team = config.max_per_team_cash if contest_type == 'cash' else config.max_per_team_gpp
+    placed = _roster_flow(pool, positions, max_team)
+    if placed < roster_size:
+        report.fail(f"No roster fits the {max_team}-per-team limit "
+                    f"(only {placed}/{roster_size} slots fillable)")
+
+    return report
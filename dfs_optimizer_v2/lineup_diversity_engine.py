@@ -7,12 +7,22 @@ Maximizes tournament coverage without changing core strategies
 """
 
 import logging
-from typing import List, Dict, Set, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+from dataclasses import asdict, dataclass
 import random
 
+import numpy as np
+
+from compiled_pool import CompiledPool
+from optimizer_v2 import SolveClock
+from projection_sampler import ProjectionSampler
+from solve_cache import solve_key
+
 logger = logging.getLogger(__name__)
 
+# Set bits per byte value, for popcounts over packed lineup bitsets
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
 
 @dataclass
 class DiversityConfig:
@@ -21,12 +31,24 @@ class DiversityConfig:
     min_overlap: int = 3          # Min players shared (for some correlation)
     position_lock_rate: float = 0.7  # % chance to lock elite players
     salary_variance: int = 2000   # Allow ±$2000 salary variance
-    max_attempts: int = 1000      # Max attempts to find diverse lineup
+    max_attempts: int = 1000      # Unused: uniqueness is a MILP constraint, one solve per lineup
+    
+    # Exposure caps (fraction of lineups), enforced as MILP constraints
+    max_player_exposure: float = 1.0  # Max share of lineups any player appears in
+    max_team_exposure: float = 1.0    # Max share of lineups stacking any team
+    team_stack_size: int = 3          # Players from one team that count as a stack
     
     # Diversity strategies
     force_different_stacks: bool = True    # Force different team stacks
     force_different_pitchers: bool = True  # Force different pitchers
     salary_tier_mixing: bool = True        # Mix salary tiers
+    projection_spread: float = 0.2         # Share of each player's floor-ceiling spread used as noise
+    
+    # Reproducibility (None = fresh random seed per run)
+    seed: Optional[int] = None
+    # Lineups whose objectives share one exposure snapshot; also the most
+    # lineups solved at once, whatever the worker count
+    objective_block: int = 8
 
 
 class LineupDiversityEngine:
@@ -34,52 +56,64 @@ class LineupDiversityEngine:
     
     def __init__(self, config: Optional[DiversityConfig] = None):
         self.config = config or DiversityConfig()
-        self.generated_lineups = []
-        
-    def generate_diverse_lineups(self, optimizer, players: List, contest_type: str, 
-                                num_lineups: int = 20) -> List[Dict]:
+        self._seed = self.config.seed
+        # Running counters, updated once per accepted lineup
+        self.player_exposure = np.zeros(0, dtype=np.int64)
+        self.team_stacks = np.zeros(0, dtype=np.int64)
+        # Accepted lineups as packed player bitsets (one row per lineup)
+        self.lineup_bits = np.zeros((0, 0), dtype=np.uint8)
+        self.num_generated = 0
+        self._sampler: Optional[ProjectionSampler] = None
+        
+    def generate_diverse_lineups(self, optimizer, players, contest_type: str, 
+                                num_lineups: int = 20, workers: Optional[int] = None) -> List[Dict]:
         """
         Generate multiple diverse lineups for tournament coverage
         
-        Uses your proven strategies but creates variety for better coverage
+        Uses your proven strategies but creates variety for better coverage.
+        Uniqueness (at most max_overlap shared players with every earlier
+        lineup) and exposure caps are MILP constraints, so each lineup costs
+        exactly one solve. Accepts a Player list or a CompiledPool;
+        workers defaults to the optimizer config's.
         """
         
+        if not isinstance(players, CompiledPool):
+            players = CompiledPool.from_players(players)
+        
         if num_lineups == 1:
             # Single lineup - use standard optimization
-            return optimizer.optimize(players, contest_type, 1)
+            return optimizer.optimize(players, contest_type, 1, workers=workers)
         
         logger.info(f"Generating {num_lineups} diverse lineups for {contest_type}")
         
-        self.generated_lineups = []
-        diverse_lineups = []
-        
-        # Generate first lineup (optimal)
-        base_lineups = optimizer.optimize(players, contest_type, 1)
-        if not base_lineups:
+        self.player_exposure = np.zeros(len(players), dtype=np.int64)
+        self.team_stacks = np.zeros(len(players.teams), dtype=np.int64)
+        self.lineup_bits = np.zeros((num_lineups, (len(players) + 7) // 8), dtype=np.uint8)
+        self.num_generated = 0
+        self._seed = self.config.seed if self.config.seed is not None else random.randrange(2 ** 32)
+        self._sampler = ProjectionSampler(players, self.config.projection_spread)
+        
+        # Seeded runs are reproducible, so their lineups can be cached
+        key = None
+        if self.config.seed is not None and getattr(optimizer, 'cache', None) is not None:
+            key = solve_key(players, contest_type, optimizer.config, num_lineups,
+                            mode='diverse', run_settings=asdict(self.config))
+            cached = optimizer.cached_run(key, players, contest_type)
+            if cached is not None:
+                for lineup in cached:
+                    self._record_lineup(players, lineup['indices'])
+                self._analyze_diversity(cached)
+                return cached
+        
+        if workers is None:
+            workers = getattr(optimizer.config, 'workers', 1)
+        if not optimizer.check_feasibility(players, contest_type).feasible:
             logger.error("Failed to generate base lineup")
             return []
-        
-        base_lineup = base_lineups[0]
-        diverse_lineups.append(base_lineup)
-        self.generated_lineups.append(set(p.name for p in base_lineup['players']))
-        
-        logger.info(f"Generated base lineup: {base_lineup['projection']:.1f} points")
-        
-        # Generate diverse lineups
-        for i in range(1, num_lineups):
-            diverse_lineup = self._generate_diverse_lineup(
-                optimizer, players, contest_type, i
-            )
-            
-            if diverse_lineup:
-                diverse_lineups.append(diverse_lineup)
-                player_names = set(p.name for p in diverse_lineup['players'])
-                self.generated_lineups.append(player_names)
-                
-                if i % 5 == 0:
-                    logger.info(f"Generated {i}/{num_lineups} diverse lineups")
-            else:
-                logger.warning(f"Failed to generate diverse lineup {i}")
+        diverse_lineups = self._generate(optimizer, players, contest_type, num_lineups,
+                                         max(1, int(workers)))
+        if key is not None:
+            optimizer.store_run(key, diverse_lineups)
         
         logger.info(f"Successfully generated {len(diverse_lineups)}/{num_lineups} diverse lineups")
         
@@ -88,112 +122,168 @@ class LineupDiversityEngine:
         
         return diverse_lineups
     
-    def _generate_diverse_lineup(self, optimizer, players: List, contest_type: str, 
-                                lineup_num: int) -> Optional[Dict]:
-        """Generate a single diverse lineup"""
-        
-        for attempt in range(self.config.max_attempts):
-            # Create modified player pool for diversity
-            modified_players = self._create_diverse_player_pool(
-                players, lineup_num, attempt
-            )
-            
-            # Generate lineup with modified pool
-            lineups = optimizer.optimize(modified_players, contest_type, 1)
-            
-            if lineups and len(lineups) > 0:
-                lineup = lineups[0]
-                player_names = set(p.name for p in lineup['players'])
-                
-                # Check diversity constraints
-                if self._is_sufficiently_diverse(player_names):
-                    return lineup
-            
-            # If too many attempts, relax constraints
-            if attempt > self.config.max_attempts // 2:
-                self.config.max_overlap += 1
-        
-        logger.warning(f"Could not generate diverse lineup after {self.config.max_attempts} attempts")
-        return None
+    def _exposure_limits(self, num_lineups: int) -> Tuple[int, int]:
+        """(max lineups per player, max stacked lineups per team)"""
+        player_limit = max(1, int(self.config.max_player_exposure * num_lineups))
+        team_limit = max(1, int(self.config.max_team_exposure * num_lineups))
+        return player_limit, team_limit
     
-    def _create_diverse_player_pool(self, players: List, lineup_num: int, 
-                                   attempt: int) -> List:
-        """Create modified player pool to encourage diversity"""
-        
-        modified_players = []
-        
-        for player in players:
-            # Copy player
-            modified_player = type(player)(
-                player.name, player.position, player.team, 
-                player.salary, player.projection
-            )
-            
-            # Copy all attributes
-            for attr, value in player.__dict__.items():
-                if not hasattr(modified_player, attr):
-                    setattr(modified_player, attr, value)
-            
-            # Apply diversity modifications
-            modified_player = self._apply_diversity_modifications(
-                modified_player, lineup_num, attempt
-            )
-            
-            modified_players.append(modified_player)
-        
-        return modified_players
+    def _record_lineup(self, pool: CompiledPool, selected: List[int]):
+        """Update exposure counters and lineup bitsets with an accepted lineup"""
+        if self.num_generated == len(self.lineup_bits):
+            self.lineup_bits = np.vstack([self.lineup_bits, np.zeros_like(self.lineup_bits)])
+        self.lineup_bits[self.num_generated] = self._pack(pool, selected)
+        self.num_generated += 1
+        self.player_exposure[selected] += 1
+        team_counts = np.bincount(pool.team_idx[selected], minlength=len(pool.teams))
+        self.team_stacks += team_counts >= self.config.team_stack_size
+    
+    @staticmethod
+    def _pack(pool: CompiledPool, selected: List[int]) -> np.ndarray:
+        """Packed bitset of a lineup's player indices"""
+        mask = np.zeros(len(pool), dtype=bool)
+        mask[selected] = True
+        return np.packbits(mask)
+    
+    def _overlaps(self, pool: CompiledPool, selected: List[int], since: int = 0) -> np.ndarray:
+        """Players shared with every accepted lineup from index since on"""
+        shared = self.lineup_bits[since:self.num_generated] & self._pack(pool, selected)
+        return _POPCOUNT[shared].sum(axis=1, dtype=np.int64)
+    
+    def _capped(self, model, num_lineups: int) -> Tuple[np.ndarray, List[Tuple[int, float]]]:
+        """Players over their exposure cap and team rows limited to a non-stack"""
+        player_limit, team_limit = self._exposure_limits(num_lineups)
+        capped_players = np.flatnonzero(self.player_exposure >= player_limit)
+        team_caps = [(model.team_rows[model.pool.teams[t]], self.config.team_stack_size - 1)
+                     for t in np.flatnonzero(self.team_stacks >= team_limit)]
+        return capped_players, team_caps
+    
+    def _exceeds_exposure(self, pool: CompiledPool, selected: List[int], num_lineups: int) -> bool:
+        """Would accepting this lineup break a player or team exposure cap?"""
+        player_limit, team_limit = self._exposure_limits(num_lineups)
+        if (self.player_exposure[selected] >= player_limit).any():
+            return True
+        team_counts = np.bincount(pool.team_idx[selected], minlength=len(pool.teams))
+        stacked = team_counts >= self.config.team_stack_size
+        return bool((self.team_stacks[stacked] >= team_limit).any())
     
-    def _apply_diversity_modifications(self, player, lineup_num: int, attempt: int):
-        """Apply modifications to encourage diversity"""
+    def _lineup_rng(self, lineup_num: int) -> np.random.Generator:
+        """Independent RNG per lineup, so its noise only depends on the seed and index"""
+        return np.random.default_rng([self._seed, lineup_num])
+    
+    def _diverse_scores(self, pool: CompiledPool, lineup_num: int) -> np.ndarray:
+        """
+        Objective vector for one lineup (from the current exposure counters)
         
-        # Check if player is in previous lineups
-        times_used = sum(1 for lineup in self.generated_lineups 
-                        if player.name in lineup)
+        An overlay on pool.score built with array operations; the Player
+        objects are never copied or modified.
+        """
+        scores = pool.score.astype(float)
+        times_used = self.player_exposure
+        used = times_used > 0
         
-        # Penalize overused players
-        if times_used > 0:
-            penalty = 1.0 - (times_used * 0.15)  # 15% penalty per use
-            player.optimization_score *= max(penalty, 0.5)  # Min 50% score
+        # Penalize overused players: 15% per use, min 50% score
+        scores[used] *= np.maximum(1.0 - 0.15 * times_used[used], 0.5)
         
         # Boost underused players
-        if times_used == 0 and lineup_num > 2:
-            player.optimization_score *= 1.10  # 10% boost for unused
+        if lineup_num > 2:
+            scores[~used] *= 1.10
         
         # Force different team stacks
         if self.config.force_different_stacks:
-            team_usage = sum(1 for lineup in self.generated_lineups
-                           for name in lineup
-                           if any(p.name == name and p.team == player.team 
-                                 for p in [player]))  # Simplified team check
-            
-            if team_usage > lineup_num // 3:  # Team used too much
-                player.optimization_score *= 0.85
+            scores[self.team_stacks[pool.team_idx] > lineup_num // 3] *= 0.85
         
         # Force different pitchers
-        if (self.config.force_different_pitchers and 
-            player.position in ['P', 'SP', 'RP']):
-            if times_used > 0:
-                player.optimization_score *= 0.70  # Strong pitcher penalty
-        
-        # Add randomness for variety
-        randomness = random.uniform(0.95, 1.05)  # ±5% random variance
-        player.optimization_score *= randomness
+        if self.config.force_different_pitchers:
+            scores[used & pool.is_pitcher] *= 0.70
         
-        return player
+        # Projection noise scaled to each player's floor-ceiling spread
+        scores *= self._sampler.factors(1, self._lineup_rng(lineup_num))[0]
+        return scores
     
-    def _is_sufficiently_diverse(self, player_names: Set[str]) -> bool:
-        """Check if lineup is sufficiently diverse from previous lineups"""
+    def _generate(self, optimizer, pool: CompiledPool, contest_type: str,
+                  num_lineups: int, workers: int) -> List[Dict]:
+        """
+        Lineups in order, up to one speculative solve per worker at a time
+
+        Lineup k is solved with the uniqueness cuts and exposure caps of every
+        lineup before it, like one-at-a-time solving. A round solves the next
+        lineups of the current objective block against the lineups accepted so
+        far; results are taken in order, and a later lineup that also meets
+        the cuts and caps of the ones accepted ahead of it in the round is
+        still optimal for its full model. The first one that does not is
+        solved again next round. Objectives only depend on the lineup index,
+        the seed and the block start, so any worker count gives the same
+        lineups.
+        """
+        from parallel_optimizer import ParallelLineupGenerator, SolveTask
         
-        for existing_lineup in self.generated_lineups:
-            overlap = len(player_names.intersection(existing_lineup))
-            
-            if overlap > self.config.max_overlap:
-                return False
+        diverse_lineups = []
+        cuts = []
+        optimizer.last_run_exact = False  # Until every lineup is found
+        block_scores = {}
+        block = max(1, self.config.objective_block)
+        clock = SolveClock(optimizer.config, num_lineups)
+        
+        with ParallelLineupGenerator(pool, optimizer.config, contest_type, workers) as generator:
+            model = generator.local_model()
+            while len(diverse_lineups) < num_lineups:
+                start = len(diverse_lineups)
+                block_end = min((start // block + 1) * block, num_lineups)
+                if start % block == 0:
+                    # Every lineup of a block shares one exposure snapshot
+                    block_scores = {num: pool.score if num == 0 else self._diverse_scores(pool, num)
+                                    for num in range(start, block_end)}
+                nums = list(range(start, min(start + workers, block_end)))
+                
+                capped_players, team_caps = self._capped(model, num_lineups)
+                fix_out = tuple(int(i) for i in capped_players)
+                tasks = [SolveTask(objective=tuple(block_scores[num].tolist()), fix_out=fix_out,
+                                   cuts=tuple(cuts), row_caps=tuple(team_caps))
+                         for num in nums]
+                
+                tasks = generator.timed(tasks, clock)
+                if tasks is None:
+                    logger.warning(f"Portfolio deadline reached after "
+                                   f"{len(diverse_lineups)}/{num_lineups} lineups")
+                    break
+                
+                for num, selected in zip(nums, generator.solve_many(tasks)):
+                    if selected is None:
+                        # Its model only gets tighter, so no later round can solve it
+                        if num == 0:
+                            logger.error("Failed to generate base lineup")
+                        else:
+                            logger.warning(f"No lineup satisfies the diversity constraints "
+                                           f"after {num} lineups")
+                        return diverse_lineups
+                    if num > start and (not self._is_sufficiently_diverse(pool, selected, since=start)
+                                        or self._exceeds_exposure(pool, selected, num_lineups)):
+                        break  # Solved again next round with the lineups before it
+                    
+                    # Reported at the players' own scores, not the diversity objective
+                    lineup = optimizer.build_lineup(pool, selected, contest_type)
+                    diverse_lineups.append(lineup)
+                    self._record_lineup(pool, selected)
+                    # Every later lineup shares at most max_overlap players with this one
+                    cuts.append((tuple(selected), self.config.max_overlap))
+                    clock.tick()
+                    
+                    if num == 0:
+                        logger.info(f"Generated base lineup: {lineup['projection']:.1f} points")
+                    elif num % 5 == 0:
+                        logger.info(f"Generated {num}/{num_lineups} diverse lineups")
             
-            if overlap < self.config.min_overlap:
-                continue  # Too different is also bad (no correlation)
+            optimizer.last_run_exact = (generator.all_optimal
+                                        and len(diverse_lineups) == num_lineups)
         
-        return True
+        return diverse_lineups
+    
+    def _is_sufficiently_diverse(self, pool: CompiledPool, selected: List[int],
+                                 since: int = 0) -> bool:
+        """Check if lineup is sufficiently diverse from previous lineups"""
+        # Too different is fine here; min_overlap is not enforced
+        return bool((self._overlaps(pool, selected, since) <= self.config.max_overlap).all())
     
     def _analyze_diversity(self, lineups: List[Dict]):
         """Analyze and log diversity statistics"""
@@ -5,22 +5,51 @@ DFS OPTIMIZER V2 - CLEAN MILP IMPLEMENTATION
 Simple, working optimizer with no complex constraints
 """
 
-import pulp
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import logging
+import math
+import time
+
+from compiled_pool import CompiledPool, POSITION_BITS, eligibility_mask, game_key, position_groups
+from feasibility import FeasibilityReport, check_feasibility
+from pool_pruning import PruneReport, prune_dominated
+from solve_cache import SolveCache, solve_key
+from solver_backends import SolverBackend, get_backend
 
 logger = logging.getLogger(__name__)
 
+# What-if settings DFSOptimizer.sweep can vary
+SWEEP_SETTINGS = ('min_salary', 'salary_cap', 'max_team')
+
 
 @dataclass
 class OptimizerConfig:
+    """
+    Solver settings shared by every optimize/sweep/portfolio run
+
+    prune_dominated is opt-in: the pass is exact (same lineups) and with a
+    binding floor it drops about 15-60% of a slate for one lineup, but it
+    takes ~0.1 s on a 400-player slate while CBC solves that slate in
+    ~0.08 s, and for 20 lineups it drops under 5%. It pays off for slow
+    solves (larger pools, time-limited or scipy runs), not by default.
+    """
     salary_cap: int = 50000
     min_salary_cash: int = 47500
     min_salary_gpp: int = 45000
     max_per_team_gpp: int = 5
     max_per_team_cash: int = 3
     timeout_seconds: int = 30
+    mip_rel_gap: float = 0.0  # Stop once within this relative gap of optimal (0 = prove optimal)
+    mip_abs_gap: float = 0.0  # Stop once within this many points of optimal (0 = prove optimal)
+    lineup_time_limit: Optional[float] = None  # Seconds per lineup solve (None = timeout_seconds)
+    portfolio_deadline: Optional[float] = None  # Seconds for a whole multi-lineup run (None = no limit)
+    solver: str = 'cbc'  # 'cbc', 'highs', 'scipy' or 'auto' (first available in-process)
+    prune_dominated: bool = False  # Drop dominated players before top-N solves (see above)
+    workers: int = 1  # Processes for sweeps and diverse lineups; top-N ignores it below 11
+    cache_size: int = 128  # Solve results kept in memory (0 disables the cache)
+    cache_dir: Optional[str] = '.dfs_cache'  # On-disk cache tier (None = memory only)
 
     def __post_init__(self):
         self.positions = {
@@ -34,101 +63,618 @@ class OptimizerConfig:
         }
 
 
+class SolveClock:
+    """
+    Time limits for a run of solves under a portfolio deadline
+
+    Each solve gets the per-lineup budget, capped at an equal share of the
+    time left for the solves still to come, so the run always finishes
+    by the deadline with whatever incumbents were found.
+    """
+
+    def __init__(self, config: OptimizerConfig, num_solves: int):
+        self.budget = config.lineup_time_limit or config.timeout_seconds
+        self.deadline = (time.monotonic() + config.portfolio_deadline
+                         if config.portfolio_deadline else None)
+        self.remaining = max(num_solves, 1)
+
+    def next_limit(self) -> Optional[float]:
+        """Time limit for the next solve, or None once the deadline has passed"""
+        if self.deadline is None:
+            return self.budget
+        left = self.deadline - time.monotonic()
+        if left <= 0:
+            return None
+        return min(self.budget, left / self.remaining)
+
+    def round_limit(self, num_tasks: int, workers: int,
+                    rounds: Optional[int] = None) -> Optional[float]:
+        """
+        Time limit for each solve of a round run over `workers` processes
+
+        Without a deadline every solve gets the per-lineup budget. With one,
+        the time left is split once: over the rounds still to come (the
+        remaining solves in rounds of this size, unless `rounds` is given),
+        then over the solves each worker runs back to back in this round.
+        None once the deadline has passed.
+        """
+        if self.deadline is None:
+            return self.budget
+        left = self.deadline - time.monotonic()
+        if left <= 0:
+            return None
+        if rounds is None:
+            rounds = math.ceil(self.remaining / max(num_tasks, 1))
+        return min(self.budget, left / max(rounds, 1) / math.ceil(num_tasks / workers))
+
+    def tick(self, solves: int = 1):
+        self.remaining = max(self.remaining - solves, 1)
+
+
+class LineupModel:
+    """
+    Persistent lineup MILP for one player pool and contest type
+
+    Built once, then re-solved after each exclusion cut instead of
+    rebuilding the whole problem for every lineup. Constraints are kept
+    as sparse rows so any solver backend can consume them.
+    """
+
+    ROSTER_SIZE = 10
+
+    def __init__(self, pool: CompiledPool, config: OptimizerConfig, contest_type: str = 'gpp',
+                 backend: Optional[SolverBackend] = None, source_indices=None):
+        self.pool = pool
+        self.players = pool.players
+        # Model column -> index in the caller's pool (differs after pruning)
+        self.source_indices = (np.arange(len(pool)) if source_indices is None
+                               else np.asarray(source_indices))
+        self.config = config
+        self.contest_type = contest_type
+        self.feasible = True
+        self.num_cuts = 0
+        self.last_status: Optional[str] = None
+
+        n = len(pool)
+        everyone = np.arange(n)
+
+        # Objective and variable bounds
+        self.objective = pool.score.astype(float)
+        self.lb = np.zeros(n)
+        self.ub = np.ones(n)
+
+        # Constraint rows: (cols, coefs) with lo <= row <= hi
+        self.rows = []
+        self.row_lo = []
+        self.row_hi = []
+
+        # Salary cap / min salary share one row
+        min_salary = (config.min_salary_cash if contest_type == 'cash'
+                      else config.min_salary_gpp)
+        self.salary_row = self.add_row(everyone, pool.salary.astype(float),
+                                       min_salary, config.salary_cap)
+
+        # Exactly 10 players
+        self.add_row(everyone, np.ones(n), self.ROSTER_SIZE, self.ROSTER_SIZE)
+
+        # Position requirements: enough players for every position...
+        for pos, req in config.positions.items():
+            eligible = np.flatnonzero(pool.eligible(pos))
+            if len(eligible) < req:
+                logger.warning(f"Only {len(eligible)} players eligible for {pos} (need {req})")
+                self.feasible = False
+            self.add_row(eligible, np.ones(len(eligible)), req, np.inf)
+
+        # ...and no group of positions gets more players than it has slots,
+        # counting players eligible only inside the group. With 10 players
+        # that is Hall's condition, so the lineup always fills distinct slots
+        # (a "1B/OF" player takes one slot, not two).
+        no_position = np.flatnonzero(pool.eligibility == 0)
+        if len(no_position):
+            self.add_row(no_position, np.ones(len(no_position)), -np.inf, 0)
+        for group in position_groups(np.unique(pool.eligibility)):
+            slots = sum(req for pos, req in config.positions.items() if group & POSITION_BITS[pos])
+            inside = np.flatnonzero((pool.eligibility != 0) & (pool.eligibility | group == group))
+            self.add_row(inside, np.ones(len(inside)), -np.inf, slots)
+
+        # Team limits
+        max_team = (config.max_per_team_cash if contest_type == 'cash'
+                    else config.max_per_team_gpp)
+        self.team_rows = {}
+        for t, idxs in pool.team_members().items():
+            self.team_rows[t] = self.add_row(idxs, np.ones(len(idxs)), -np.inf, max_team)
+
+        self.backend = backend or get_backend(config.solver)
+        self._session = self.backend.create_session(self)
+
+    def add_row(self, cols: List[int], coefs: List[float],
+                lo: float = -np.inf, hi: float = np.inf) -> int:
+        """Append a constraint row and return its index"""
+        self.rows.append(([int(c) for c in cols], [float(c) for c in coefs]))
+        self.row_lo.append(float(lo))
+        self.row_hi.append(float(hi))
+        return len(self.rows) - 1
+
+    def add_exclusion(self, indices: List[int], max_shared: Optional[int] = None):
+        """Cut off a lineup: at most max_shared (default 9) of its players again"""
+        if max_shared is None:
+            max_shared = len(indices) - 1
+        self.add_row(indices, [1.0] * len(indices), -np.inf, max_shared)
+        self.num_cuts += 1
+
+    def solve(self, time_limit: Optional[float] = None) -> Optional[List[int]]:
+        """
+        Re-solve the current model, returning selected player indices
+
+        A solve stopped by the time limit or MIP gap still returns its
+        incumbent; last_status tells 'optimal' from 'feasible'.
+        """
+        self.last_status = None
+        if not self.feasible:
+            return None
+
+        result = self._session.solve(time_limit)
+        self.last_status = result.status
+        if result.status not in ('optimal', 'feasible'):
+            return None
+
+        selected = [int(i) for i in np.flatnonzero(result.x > 0.5)]
+        if len(selected) != self.ROSTER_SIZE:
+            return None
+        return selected
+
+
 class DFSOptimizer:
     def __init__(self, config: Optional[OptimizerConfig] = None):
         self.config = config or OptimizerConfig()
+        self.last_prune_report: Optional[PruneReport] = None
+        self.last_feasibility: Optional[FeasibilityReport] = None
+        self.last_run_exact = True  # Every lineup of the last run proven optimal
+        self.cache = (SolveCache(self.config.cache_size, self.config.cache_dir)
+                      if self.config.cache_size > 0 else None)
+
+    def build_model(self, players, contest_type: str = 'gpp', prune_depth: int = 0) -> LineupModel:
+        """
+        Build the reusable MILP for a pool (Player list or CompiledPool)
+
+        prune_depth > 0 drops players dominated for that many lineups first.
+        A pool that fails the pre-solve check gives a model marked
+        infeasible, so solve() returns None without calling the solver.
+        """
+        pool = self._compile(players)
+        feasible = self.check_feasibility(pool, contest_type).feasible
+
+        model = None
+        if prune_depth > 0 and self.config.prune_dominated and feasible:
+            min_salary = (self.config.min_salary_cash if contest_type == 'cash'
+                          else self.config.min_salary_gpp)
+            max_team = (self.config.max_per_team_cash if contest_type == 'cash'
+                        else self.config.max_per_team_gpp)
+            kept, report = prune_dominated(pool, self.config.positions, prune_depth,
+                                           min_salary, max_team, self.config.salary_cap)
+            self.last_prune_report = report
+            logger.info(report.summary())
+            for removed in report.removed:
+                logger.debug(f"  Pruned {removed['name']} ({removed['position']}, "
+                             f"${removed['salary']}): {removed['reason']}")
+            if report.num_removed:
+                model = LineupModel(pool.subset(kept), self.config, contest_type,
+                                    source_indices=kept)
+
+        if model is None:
+            model = LineupModel(pool, self.config, contest_type)
+        model.feasible = model.feasible and feasible
+        return model
+
+    def check_feasibility(self, players, contest_type: str = 'gpp') -> FeasibilityReport:
+        """Pre-solve check of a pool (logged and kept as last_feasibility)"""
+        report = check_feasibility(self._compile(players), self.config, contest_type)
+        self.last_feasibility = report
+        for problem in report.problems:
+            logger.error(f"Infeasible player pool: {problem}")
+        return report
+
+    @staticmethod
+    def _compile(players) -> CompiledPool:
+        if isinstance(players, CompiledPool):
+            return players
+        return CompiledPool.from_players(players)
 
     def optimize(self,
-                 players: List,
+                 players,
                  contest_type: str = 'gpp',
-                 num_lineups: int = 1) -> List[Dict]:
-        """Main optimization method"""
+                 num_lineups: int = 1,
+                 workers: Optional[int] = None) -> List[Dict]:
+        """
+        Main optimization method (accepts a Player list or a CompiledPool)
+
+        workers overrides config.workers for this call only. Top-N lineups
+        are solved one at a time unless workers is above the roster size
+        (10): with 10 workers or fewer this method uses a single process.
+        """
         if not players:
             logger.error("No players to optimize")
             return []
 
+        pool = self._compile(players)
+        if workers is None:
+            workers = self.config.workers
+        if self.cache is None:
+            return self._optimize(pool, contest_type, num_lineups, workers)
+
+        key = solve_key(pool, contest_type, self.config, num_lineups)
+        cached = self.cached_run(key, pool, contest_type)
+        if cached is not None:
+            return cached
+
+        lineups = self._optimize(pool, contest_type, num_lineups, workers)
+        self.store_run(key, lineups)
+        return lineups
+
+    def cached_run(self, key: str, pool: CompiledPool, contest_type: str) -> Optional[List[Dict]]:
+        """Lineups cached under key (None on a miss); restores last_run_exact"""
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is None:
+            return None
+        logger.info(f"Using cached result for {len(cached['lineups'])} lineups")
+        self.last_run_exact = cached['exact']
+        return [self.build_lineup(pool, selected, contest_type) for selected in cached['lineups']]
+
+    def store_run(self, key: str, lineups: List[Dict]):
+        """Cache the last run's lineups under key"""
+        # Time-limited incumbents depend on machine load; only cache proven results
+        if self.cache is not None and lineups and self.last_run_exact:
+            self.cache.put(key, {'lineups': [lineup['indices'] for lineup in lineups],
+                                 'exact': self.last_run_exact})
+
+    def _optimize(self, pool: CompiledPool, contest_type: str, num_lineups: int,
+                  workers: int = 1) -> List[Dict]:
+        """Solve num_lineups best distinct lineups (no cache)"""
+        model = self.build_model(pool, contest_type, prune_depth=num_lineups)
+        if not model.feasible:
+            logger.error("Player pool cannot produce a legal lineup")
+            return []
+
+        clock = SolveClock(self.config, num_lineups)
+        self.last_run_exact = True
+        # Partitioning spends about one solve per roster player per lineup,
+        # so it only beats sequential cuts with more workers than that
+        if workers > model.ROSTER_SIZE and num_lineups > 1:
+            return self._optimize_parallel(model, num_lineups, clock, workers)
+
         lineups = []
-        used_lineups = set()
 
         for _ in range(num_lineups):
-            lineup = self._optimize_single(players, contest_type, used_lineups)
-            if lineup:
-                lineups.append(lineup)
-                used_lineups.add(frozenset(p.name for p in lineup['players']))
-            else:
+            limit = clock.next_limit()
+            if limit is None:
+                logger.warning(f"Portfolio deadline reached after {len(lineups)}/{num_lineups} lineups")
+                self.last_run_exact = False
+                break
+
+            selected = model.solve(limit)
+            if selected is None and not lineups and model.pool is not pool:
+                # Pruning is exact, so this is only a safety net; retry on the full pool
+                logger.warning("Pruned pool infeasible - retrying with the full pool")
+                model = self.build_model(pool, contest_type)
+                selected = model.solve(clock.next_limit() or limit)
+
+            if model.last_status != 'optimal':
+                self.last_run_exact = False
+            if selected is None:
                 logger.warning("Could not generate lineup")
                 break
 
+            lineups.append(self._build_lineup(model, selected))
+            clock.tick()
+            # Every later lineup must differ by at least one player
+            model.add_exclusion(selected)
+
         return lineups
 
-    def _optimize_single(self, players, contest_type, exclude_lineups):
-        """Run one MILP solve"""
-        prob = pulp.LpProblem("DFS_Lineup", pulp.LpMaximize)
+    def solution_pool(self, players, contest_type: str = 'gpp', size: int = 500):
+        """
+        The `size` best distinct lineups as a SolutionPool
 
-        player_vars = pulp.LpVariable.dicts("players", range(len(players)), cat="Binary")
+        Late scratches are then handled by SolutionPool.best(n, scratched)
+        without new solves.
+        """
+        from solution_pool import SolutionPool
 
-        # Objective
-        prob += pulp.lpSum([players[i].optimization_score * player_vars[i]
-                            for i in range(len(players))])
+        pool = self._compile(players)
+        lineups = self.optimize(pool, contest_type, size)
+        logger.info(f"Solution pool holds {len(lineups)} lineups")
+        return SolutionPool(pool, [lineup['indices'] for lineup in lineups], contest_type)
 
-        # Salary cap
-        salary_cap = self.config.salary_cap
-        prob += pulp.lpSum([players[i].salary * player_vars[i]
-                            for i in range(len(players))]) <= salary_cap
+    def optimize_stacked(self, players, contest_type: str = 'gpp', num_lineups: int = 1,
+                         stacks: Optional[List[int]] = None, catalog=None,
+                         sizes=(4, 5)) -> List[Dict]:
+        """
+        Best lineups built around team stacks from a StackCatalog
 
-        # Min salary
-        min_salary = (self.config.min_salary_cash if contest_type == 'cash'
-                      else self.config.min_salary_gpp)
-        prob += pulp.lpSum([players[i].salary * player_vars[i]
-                            for i in range(len(players))]) >= min_salary
+        Each stack's players are fixed in, so every solve only fills the
+        remaining slots. stacks defaults to the catalog's best of the given
+        sizes; the best distinct lineups over all stacks are returned.
+        """
+        from stack_catalog import StackCatalog
 
-        # Exactly 10 players
-        prob += pulp.lpSum(player_vars.values()) == 10
+        if not players:
+            logger.error("No players to optimize")
+            return []
 
-        # Position requirements
-        for pos, req in self.config.positions.items():
-            eligible = [i for i, p in enumerate(players)
-                        if self._eligible(p, pos)]
-            if len(eligible) < req:
-                return None
-            prob += pulp.lpSum(player_vars[i] for i in eligible) == req
+        pool = self._compile(players)
+        if catalog is None:
+            catalog = StackCatalog(pool, sizes)
+        if stacks is None:
+            stacks = catalog.best(max(num_lineups * 2, 10), sizes)
 
-        # Team limits
+        model = self.build_model(pool, contest_type)
         max_team = (self.config.max_per_team_cash if contest_type == 'cash'
                     else self.config.max_per_team_gpp)
-        teams = {}
-        for i, p in enumerate(players):
-            teams.setdefault(p.team, []).append(i)
-        for t, idxs in teams.items():
-            prob += pulp.lpSum(player_vars[i] for i in idxs) <= max_team
 
-        # Solve
-        solver = pulp.PULP_CBC_CMD(msg=0, timeLimit=self.config.timeout_seconds)
-        prob.solve(solver)
+        lineups = {}
+        for stack in stacks:
+            members = catalog.players(stack)
+            if len(members) > max_team:
+                continue
+            model.lb[members] = 1.0
+            selected = model.solve()
+            model.lb[members] = 0.0
+            if selected is None or tuple(selected) in lineups:
+                continue
+            lineup = self._build_lineup(model, selected)
+            lineup['stack'] = catalog.team(stack)
+            lineups[tuple(selected)] = lineup
 
-        if prob.status != pulp.LpStatusOptimal:
-            return None
+        best = sorted(lineups.values(), key=lambda lineup: -lineup['projection'])[:num_lineups]
+        if len(best) < num_lineups:
+            logger.warning(f"Only {len(best)}/{num_lineups} distinct stacked lineups")
+        return best
 
-        lineup_players = [players[i] for i, v in player_vars.items()
-                          if v.varValue == 1]
-        if len(lineup_players) != 10:
-            return None
+    def sweep(self, players, contest_type: str = 'gpp', grid=None) -> List[Dict]:
+        """
+        Best lineup at every point of a what-if grid, on one shared model
+
+        grid maps setting -> values and is expanded to every combination,
+        e.g. {'min_salary': range(44000, 50000, 500), 'max_team': [3, 4, 5]};
+        a list of setting dicts is used as is. Settings are SWEEP_SETTINGS;
+        any not given keep the config's values.
+        Each point only changes constraint bounds of the warm model, and
+        points are spread over config.workers processes. Returns one dict
+        per point: {'settings': {...}, 'lineup': lineup or None, 'exact':
+        False when the lineup is a time-limited incumbent}.
+        """
+        from itertools import product
+        from parallel_optimizer import ParallelLineupGenerator, SolveTask
+
+        if not players:
+            logger.error("No players to optimize")
+            return []
+
+        grid = grid or {}
+        if isinstance(grid, dict):
+            names = list(grid)
+            points = [dict(zip(names, values)) for values in product(*grid.values())]
+        else:
+            points = [dict(point) for point in grid]
+        unknown = {name for point in points for name in point} - set(SWEEP_SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown sweep settings: {sorted(unknown)} "
+                             f"(expected {', '.join(SWEEP_SETTINGS)})")
+
+        # No pruning: dominance ignores min salary and team caps
+        pool = self._compile(players)
+        clock = SolveClock(self.config, len(points))
+        selections, statuses = [], []
+
+        with ParallelLineupGenerator(pool, self.config, contest_type,
+                                     self.config.workers) as generator:
+            model = generator.local_model()
+            tasks = []
+            for point in points:
+                salary_lo = point.get('min_salary', model.row_lo[model.salary_row])
+                salary_hi = point.get('salary_cap', model.row_hi[model.salary_row])
+                bounds = [(model.salary_row, float(salary_lo), float(salary_hi))]
+                if 'max_team' in point:
+                    bounds += [(row, -np.inf, float(point['max_team']))
+                               for row in model.team_rows.values()]
+                tasks.append(SolveTask(row_bounds=tuple(bounds)))
+
+            tasks = generator.timed(tasks, clock)
+            if tasks is None:
+                logger.warning("Portfolio deadline reached before the sweep started")
+            else:
+                selections = generator.solve_many(tasks)
+                statuses = generator.last_statuses
+        self.last_run_exact = generator.all_optimal
+
+        results = []
+        for i, point in enumerate(points):
+            selected = selections[i] if i < len(selections) else None
+            lineup = None if selected is None else self.build_lineup(pool, selected, contest_type)
+            exact = selected is not None and statuses[i] == 'optimal'
+            results.append({'settings': point, 'lineup': lineup, 'exact': exact})
+        solved = sum(result['lineup'] is not None for result in results)
+        logger.info(f"Sweep solved {solved}/{len(points)} points")
+        if not self.last_run_exact:
+            logger.warning("Some sweep points hit their time limit - "
+                           "those lineups are not proven optimal")
+        return results
+
+    def optimize_randomized(self, players, contest_type: str = 'gpp', num_lineups: int = 20,
+                            spread: float = 1.0, seed: Optional[int] = None,
+                            max_rounds: int = 5) -> List[Dict]:
+        """
+        Distinct lineups, each optimal for one sampled projection vector
+
+        All samples are drawn up front (ProjectionSampler); every solve then
+        reuses the same warm constraint model with only the objective
+        swapped, across config.workers processes. Duplicate lineups are
+        dropped and replaced from a fresh batch, up to max_rounds batches.
+        Lineup projections are reported at the unperturbed scores; a
+        lineup's 'exact' is False when its solve hit the time limit.
+        """
+        from parallel_optimizer import ParallelLineupGenerator, SolveTask
+        from projection_sampler import ProjectionSampler
+
+        if not players:
+            logger.error("No players to optimize")
+            return []
+
+        # No pruning: dominance under the mean scores does not hold per sample
+        pool = self._compile(players)
+        if not self.check_feasibility(pool, contest_type).feasible:
+            logger.error("Player pool cannot produce a legal lineup")
+            return []
+
+        sampler = ProjectionSampler(pool, spread, seed)
+        clock = SolveClock(self.config, num_lineups)
+        lineups = {}
+
+        with ParallelLineupGenerator(pool, self.config, contest_type,
+                                     self.config.workers) as generator:
+            for _ in range(max_rounds):
+                missing = num_lineups - len(lineups)
+                if missing <= 0:
+                    break
+                tasks = generator.timed([SolveTask(objective=tuple(scores.tolist()))
+                                         for scores in sampler.sample(missing)], clock)
+                if tasks is None:
+                    logger.warning(f"Portfolio deadline reached after {len(lineups)}/{num_lineups} lineups")
+                    break
+                selections = generator.solve_many(tasks)
+                for selected, status in zip(selections, generator.last_statuses):
+                    if selected is None or tuple(selected) in lineups:
+                        continue
+                    lineup = self.build_lineup(pool, selected, contest_type)
+                    lineup['exact'] = status == 'optimal'
+                    lineups[tuple(selected)] = lineup
+                    clock.tick()
+        self.last_run_exact = generator.all_optimal
+
+        if len(lineups) < num_lineups:
+            logger.warning(f"Only {len(lineups)}/{num_lineups} distinct lineups "
+                           f"after {max_rounds} sample batches")
+        return sorted(lineups.values(), key=lambda lineup: -lineup['projection'])[:num_lineups]
+
+    def pareto_front(self, players, contest_type: str = 'gpp', num_points: int = 20,
+                     ownership=None):
+        """
+        Projection vs. ownership frontier as a ParetoFront
+
+        ownership defaults to OwnershipCalculator projections; the bound on
+        total ownership is swept over num_points solves of one model.
+        """
+        from pareto_front import ParetoFront, trace_pareto_front
+
+        if not players:
+            logger.error("No players to optimize")
+            return ParetoFront()
+        return trace_pareto_front(self, self._compile(players), contest_type, ownership, num_points)
+
+    def optimize_portfolio(self, players, contest_type: str = 'gpp', num_lineups: int = 20,
+                           portfolio_config=None) -> List[Dict]:
+        """N lineups chosen jointly under global exposure/uniqueness rules (PortfolioConfig)"""
+        from portfolio_optimizer import PortfolioOptimizer
+
+        if not players:
+            logger.error("No players to optimize")
+            return []
+        return PortfolioOptimizer(self, portfolio_config).optimize(players, contest_type, num_lineups)
+
+    def late_swap(self, lineups: List[Dict], locked_games, players,
+                  contest_type: str = 'gpp') -> List[Dict]:
+        """
+        Re-optimize only the unlocked slots of existing lineups
+
+        Players whose game (or team) is in locked_games stay fixed; every
+        other player from a locked game is out. One warm model over the
+        unlocked players plus the portfolio's locked players serves every
+        lineup; only bounds change between solves. Lineups that share a
+        locked core get distinct completions. A lineup that cannot be
+        completed is returned unchanged.
+        """
+        locked_games = set(locked_games)
+        pool = self._compile(players)
+
+        def is_locked(player) -> bool:
+            return game_key(player) in locked_games or player.team in locked_games
+
+        # Locked players must be in the model even if the update dropped them
+        index = {p.name: i for i, p in enumerate(pool.players)}
+        missing = {p.name: p for lineup in lineups for p in lineup['players']
+                   if is_locked(p) and p.name not in index}
+        if missing:
+            pool = CompiledPool.from_players(pool.players + list(missing.values()))
+            index = {p.name: i for i, p in enumerate(pool.players)}
+
+        locked_names = {p.name for lineup in lineups for p in lineup['players'] if is_locked(p)}
+        columns = [i for i, p in enumerate(pool.players)
+                   if not is_locked(p) or p.name in locked_names]
+        model = LineupModel(pool.subset(columns), self.config, contest_type,
+                            source_indices=columns)
+        column_of = {pool.players[i].name: c for c, i in enumerate(columns)}
+        locked_columns = [column_of[name] for name in locked_names]
+
+        swapped = []
+        for lineup in lineups:
+            fixed = [column_of[p.name] for p in lineup['players'] if is_locked(p)]
+            model.lb[:] = 0.0
+            model.ub[:] = 1.0
+            model.ub[locked_columns] = 0.0
+            model.lb[fixed] = 1.0
+            model.ub[fixed] = 1.0
+
+            selected = model.solve()
+            if selected is None:
+                logger.warning("Late swap found no valid completion - keeping lineup as is")
+                swapped.append(lineup)
+                continue
+
+            swapped.append(self._build_lineup(model, selected))
+            # Only lineups with this exact locked core can reach it again
+            model.add_exclusion(selected)
+
+        logger.info(f"Late swap re-optimized {len(lineups)} lineups "
+                    f"({len(locked_names)} locked players)")
+        return swapped
+
+    def _optimize_parallel(self, model: LineupModel, num_lineups: int,
+                           clock: Optional[SolveClock] = None, workers: int = 2) -> List[Dict]:
+        """Top-N lineups across a worker pool (exact, deterministic per worker count)"""
+        from parallel_optimizer import ParallelLineupGenerator
+
+        with ParallelLineupGenerator(model.pool, self.config, model.contest_type,
+                                     workers) as generator:
+            selections = generator.top_lineups(num_lineups, clock)
+        self.last_run_exact = generator.all_optimal and len(selections) == num_lineups
+
+        if len(selections) < num_lineups:
+            logger.warning(f"Could only generate {len(selections)}/{num_lineups} lineups")
+        return [self._build_lineup(model, selected) for selected in selections]
+
+    def _build_lineup(self, model: LineupModel, selected: List[int]) -> Dict:
+        """Package selected model columns as a lineup dict"""
+        return self.build_lineup(model.pool, selected, model.contest_type,
+                                 source_indices=model.source_indices)
+
+    @staticmethod
+    def build_lineup(pool: CompiledPool, selected: List[int], contest_type: str,
+                     source_indices=None, scores=None) -> Dict:
+        """Lineup dict for selected pool indices (scores default to pool.score)"""
+        sel = np.asarray(selected)
+        scores = pool.score if scores is None else np.asarray(scores)
+        indices = sel if source_indices is None else np.asarray(source_indices)[sel]
 
         return {
-            'players': lineup_players,
-            'salary': sum(p.salary for p in lineup_players),
-            'projection': sum(p.optimization_score for p in lineup_players),
+            'players': [pool.players[i] for i in selected],
+            'indices': [int(i) for i in indices],
+            'salary': int(pool.salary[sel].sum()),
+            'projection': float(scores[sel].sum()),
             'contest_type': contest_type,
-            'max_stack': max([sum(1 for p in lineup_players if p.team == t)
-                              for t in set(p.team for p in lineup_players)]),
+            'max_stack': int(np.bincount(pool.team_idx[sel]).max()),
         }
 
-    def _eligible(self, player, position: str) -> bool:
+    @staticmethod
+    def _eligible(player, position: str) -> bool:
         """Check positional eligibility with proper pitcher handling"""
-        if position == 'P':
-            # Accept P, SP, RP for pitcher position
-            return player.position in {'P', 'SP', 'RP'}
-
-        # Handle multi-position eligibility (e.g., "1B/OF")
-        player_positions = player.position.split('/')
-        return position in player_positions
\ No newline at end of file
+        return bool(eligibility_mask(player.position) & POSITION_BITS[position])
@@ -7,6 +7,8 @@ Complete replacement that works with all call signatures
 
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,6 +113,22 @@ class OwnershipCalculator:
 
         return max(1.0, min(60.0, ownership))
 
+    def ownership_array(self, table, rows=None):
+        """Ownership for PlayerTable rows as one array (same rules as _calculate_from_values)"""
+        salary = table.column('salary', rows)
+        position = table.column('position', rows)
+
+        ownership = np.select(
+            [salary >= 10000, salary >= 8000, salary >= 6000, salary >= 4500],
+            [35.0, 25.0, 18.0, 12.0],
+            default=5.0,
+        )
+        ownership[np.isin(position, ['P', 'SP', 'RP'])] *= 1.15
+        ownership[position == 'C'] *= 0.85
+        ownership[np.isin(table.column('team', rows), ['NYY', 'LAD', 'HOU', 'ATL'])] *= 1.1
+
+        return np.clip(ownership, 1.0, 60.0)
+
     def _calculate_for_player(self, player):
         """Calculate for a player object"""
         return self._calculate_from_values(
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+PARALLEL LINEUP GENERATION
+==========================
+Spread lineup solves over a process pool of warm lineup models
+
+Every worker builds the LineupModel for the pool once (initializer) and
+then only applies per-task changes: objective vector, fixed players,
+constraint bounds and uniqueness cuts. The coordinator (this process) decides which tasks to
+run and merges results in task order, so results never depend on which
+worker finished first. Diverse lineups and sweeps are also the same for
+any worker count (workers=1 included) given the same seed.
+"""
+
+import heapq
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SolveTask:
+    """One solve on a warm model"""
+    objective: Optional[Tuple[float, ...]] = None  # None = pool scores
+    fix_in: Tuple[int, ...] = ()
+    fix_out: Tuple[int, ...] = ()
+    cuts: Tuple[Tuple[Tuple[int, ...], int], ...] = ()  # (lineup, max_shared), append-only
+    row_caps: Tuple[Tuple[int, float], ...] = ()  # (row, upper bound) for this solve only
+    row_bounds: Tuple[Tuple[int, float, float], ...] = ()  # (row, lo, hi) for this solve only
+    time_limit: Optional[float] = None  # None = the config's per-lineup limit
+
+
+# =====================================
+# WORKER SIDE
+# =====================================
+
+_worker_model = None
+_worker_cuts = 0
+
+
+def _init_worker(pool, config, contest_type):
+    """Build the warm model once per worker process"""
+    global _worker_model, _worker_cuts
+    from optimizer_v2 import LineupModel
+    _worker_model = LineupModel(pool, config, contest_type)
+    _worker_cuts = 0
+
+
+def _solve_task(task: SolveTask) -> Tuple[Optional[List[int]], Optional[str]]:
+    """Apply a task to the warm model, solve, and restore it; returns (lineup, status)"""
+    global _worker_cuts
+    model = _worker_model
+
+    # Cut lists only grow, so just add the ones this worker has not seen
+    for lineup, max_shared in task.cuts[_worker_cuts:]:
+        model.add_exclusion(list(lineup), max_shared)
+    _worker_cuts = max(_worker_cuts, len(task.cuts))
+
+    base_objective = model.objective
+    if task.objective is not None:
+        model.objective = np.asarray(task.objective, dtype=float)
+    fix_in, fix_out = list(task.fix_in), list(task.fix_out)
+    model.lb[fix_in] = 1.0
+    model.ub[fix_out] = 0.0
+    touched = {row for row, _ in task.row_caps} | {row for row, _, _ in task.row_bounds}
+    saved_rows = [(row, model.row_lo[row], model.row_hi[row]) for row in touched]
+    for row, lo, hi in task.row_bounds:
+        model.row_lo[row], model.row_hi[row] = lo, hi
+    for row, cap in task.row_caps:
+        model.row_hi[row] = min(model.row_hi[row], cap)
+
+    try:
+        return model.solve(task.time_limit), model.last_status
+    finally:
+        model.objective = base_objective
+        model.lb[fix_in] = 0.0
+        model.ub[fix_out] = 1.0
+        for row, lo, hi in saved_rows:
+            model.row_lo[row], model.row_hi[row] = lo, hi
+
+
+# =====================================
+# COORDINATOR SIDE
+# =====================================
+
+class ParallelLineupGenerator:
+    """
+    Coordinator for a pool of warm lineup-model workers
+
+    Use as a context manager. workers <= 1 solves in this process with the
+    same code path, which keeps results identical for debugging.
+    """
+
+    def __init__(self, pool, config, contest_type: str = 'gpp', workers: int = 2):
+        self.pool = pool
+        self.config = config
+        self.contest_type = contest_type
+        self.workers = max(1, int(workers))
+        self._executor = None
+        self._local_model = None
+        self.all_optimal = True  # False once any solve returned a time-limited incumbent
+        self.last_statuses: List[Optional[str]] = []  # Solver status per task of the last solve_many
+
+    def __enter__(self):
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.pool, self.config, self.contest_type),
+            )
+        else:
+            _init_worker(self.pool, self.config, self.contest_type)
+        return self
+
+    def __exit__(self, *exc):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def local_model(self):
+        """Coordinator-side model with the workers' row layout (e.g. team_rows)"""
+        if self._local_model is None:
+            if self._executor is None:
+                self._local_model = _worker_model
+            else:
+                from optimizer_v2 import LineupModel
+                self._local_model = LineupModel(self.pool, self.config, self.contest_type)
+        return self._local_model
+
+    def solve_many(self, tasks: List[SolveTask]) -> List[Optional[List[int]]]:
+        """Solve tasks concurrently; results come back in task order"""
+        if self._executor is None:
+            results = [_solve_task(task) for task in tasks]
+        else:
+            chunksize = max(1, len(tasks) // (self.workers * 4))
+            results = list(self._executor.map(_solve_task, tasks, chunksize=chunksize))
+        self.last_statuses = [status for _, status in results]
+        if any(status == 'feasible' for status in self.last_statuses):
+            self.all_optimal = False
+        return [selected for selected, _ in results]
+
+    def timed(self, tasks: List[SolveTask], clock,
+              rounds: Optional[int] = None) -> Optional[List[SolveTask]]:
+        """
+        Give a round of tasks their share of the clock (None: deadline passed)
+
+        rounds is how many rounds, this one included, the clock's remaining
+        solves stand for (default: the remaining solves in rounds of this size).
+        """
+        if clock is None:
+            return tasks
+        limit = clock.round_limit(len(tasks), self.workers, rounds)
+        if limit is None:
+            self.all_optimal = False
+            return None
+        return [replace(task, time_limit=limit) for task in tasks]
+
+    def _entry(self, selected, fix_in, fix_out):
+        """Heap entry ordered by score, then player indices (deterministic ties)"""
+        score = round(float(self.pool.score[selected].sum()), 9)
+        return (-score, tuple(selected), fix_in, fix_out)
+
+    def top_lineups(self, num_lineups: int, clock=None) -> List[List[int]]:
+        """
+        The num_lineups best distinct lineups (same set sequential exclusion cuts find)
+
+        Lawler-style partitioning: the best known lineup is accepted, and the
+        rest of its region splits into disjoint child regions (player k
+        excluded, players before k fixed in), solved concurrently. Only the
+        accepted region is expanded, so no solve is spent on regions that
+        never reach the output. That is still about one solve per roster
+        player per lineup against one for sequential cuts, so this only wins
+        with more workers than that; the optimizer defaults to sequential.
+        A SolveClock (optional) stops the search at its deadline.
+        """
+        tasks = self.timed([SolveTask()], clock)
+        first = self.solve_many(tasks)[0] if tasks else None
+        if first is None:
+            return []
+
+        heap = [self._entry(first, (), ())]
+        results = []
+
+        while heap and len(results) < num_lineups:
+            _, selected, fix_in, fix_out = heapq.heappop(heap)
+            results.append(list(selected))
+            if clock is not None:
+                clock.tick()
+            if len(results) >= num_lineups:
+                break
+
+            free = [i for i in selected if i not in fix_in]
+            tasks = [SolveTask(fix_in=fix_in + tuple(free[:k]), fix_out=fix_out + (player,))
+                     for k, player in enumerate(free)]
+
+            # The clock counts lineups, and every lineup is one round
+            tasks = self.timed(tasks, clock, rounds=clock.remaining if clock else None)
+            if tasks is None:
+                # Lineups already found are valid, just not proven next-best
+                logger.warning(f"Deadline reached after {len(results)}/{num_lineups} "
+                               f"proven lineups - filling from known ones")
+                while heap and len(results) < num_lineups:
+                    results.append(list(heapq.heappop(heap)[1]))
+                break
+            for task, child in zip(tasks, self.solve_many(tasks)):
+                if child is not None:
+                    heapq.heappush(heap, self._entry(child, task.fix_in, task.fix_out))
+
+        return results
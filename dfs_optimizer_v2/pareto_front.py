@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+PROJECTION / OWNERSHIP PARETO FRONT
+===================================
+Efficient frontier between total projection and total ownership
+
+Epsilon-constraint method on one warm lineup model:
+1. Best projection with no ownership limit (the high-ownership end)
+2. Lowest total ownership of any legal lineup (the low end)
+3. A cumulative-ownership row whose bound is swept between the two ends;
+   each point maximizes projection under the bound
+
+Only the row bound changes between solves. Dominated and duplicate
+lineups are dropped, so the front is strictly increasing in both.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from compiled_pool import CompiledPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParetoFront:
+    """Frontier lineups ordered from lowest to highest ownership"""
+    lineups: List[Dict] = field(default_factory=list)
+    projection: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    ownership: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    def __len__(self) -> int:
+        return len(self.lineups)
+
+    def best(self, max_ownership: Optional[float] = None) -> Optional[Dict]:
+        """Highest-projection frontier lineup within an ownership budget"""
+        fits = np.flatnonzero(self.ownership <= max_ownership) if max_ownership is not None \
+            else np.arange(len(self))
+        return self.lineups[fits[-1]] if len(fits) else None
+
+    def spread(self, num_lineups: int) -> List[Dict]:
+        """num_lineups frontier lineups evenly spaced along the ownership range"""
+        if num_lineups >= len(self):
+            return list(self.lineups)
+        picks = np.unique(np.round(np.linspace(0, len(self) - 1, num_lineups)).astype(int))
+        return [self.lineups[i] for i in picks]
+
+
+def player_ownership(pool: CompiledPool, contest_type: str = 'gpp') -> np.ndarray:
+    """Projected ownership (%) per pool player from OwnershipCalculator"""
+    from ownership_calculator import OwnershipCalculator
+
+    calculator = OwnershipCalculator()
+    ownership = np.array([calculator.get_ownership(p) for p in pool.players], dtype=float)
+    if contest_type == 'cash':
+        ownership = np.minimum(ownership * 1.3, 60)  # Same adjustment as calculate_ownership
+    return ownership
+
+
+def trace_pareto_front(optimizer, pool: CompiledPool, contest_type: str = 'gpp',
+                       ownership: Optional[np.ndarray] = None,
+                       num_points: int = 20) -> ParetoFront:
+    """Frontier from num_points epsilon-constraint solves (plus the two ends)"""
+    ownership = player_ownership(pool, contest_type) if ownership is None \
+        else np.asarray(ownership, dtype=float)
+
+    model = optimizer.build_model(pool, contest_type)
+    if not model.feasible:
+        logger.error("Player pool cannot produce a legal lineup")
+        return ParetoFront()
+
+    top = model.solve()
+    if top is None:
+        logger.error("No legal lineup for the Pareto front")
+        return ParetoFront()
+
+    # Lowest reachable ownership: same model, ownership as the objective
+    model.objective = -ownership
+    low = model.solve()
+    model.objective = pool.score.astype(float)
+    high_own = float(ownership[top].sum())
+    low_own = float(ownership[low].sum()) if low is not None else high_own
+
+    own_row = model.add_row(np.arange(len(pool)), ownership)
+    found = {tuple(top)}
+    for eps in np.linspace(high_own, low_own, num_points)[1:]:
+        model.row_hi[own_row] = float(eps)
+        selected = model.solve()
+        if selected is not None:
+            found.add(tuple(selected))
+
+    selections = [list(selected) for selected in found]
+    proj = np.array([pool.score[s].sum() for s in selections])
+    own = np.array([ownership[s].sum() for s in selections])
+
+    # Keep lineups no other lineup beats on both axes; ascending ownership
+    order = np.lexsort((-proj, own))
+    keep, best_proj = [], -np.inf
+    for i in order:
+        if proj[i] > best_proj + 1e-9:
+            keep.append(i)
+            best_proj = proj[i]
+
+    lineups = []
+    for i in keep:
+        lineup = optimizer.build_lineup(pool, selections[i], contest_type)
+        lineup['ownership'] = float(own[i])
+        lineups.append(lineup)
+
+    logger.info(f"Pareto front: {len(lineups)} lineups, ownership {own[keep[0]]:.0f}-"
+                f"{own[keep[-1]]:.0f}%, projection {proj[keep[0]]:.1f}-{proj[keep[-1]]:.1f}")
+    return ParetoFront(lineups, proj[keep], own[keep])
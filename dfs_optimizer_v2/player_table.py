@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+COLUMNAR PLAYER TABLE
+=====================
+Struct-of-arrays store for a slate's players
+
+One NumPy array per Player field; the pipeline stages that touch every
+player (default stats, Vegas, ownership, scoring) update whole columns.
+PlayerRow objects are lightweight views of one row, so code written for
+Player objects (strategies, GUI, lineups) keeps working and its writes
+land in the table. Each table's rows get a class with one property per
+column, so a field read is a normal attribute lookup.
+"""
+
+import logging
+from dataclasses import MISSING, fields
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PITCHER_POSITIONS = ['P', 'SP', 'RP']
+_DTYPES = {int: np.int64, float: np.float64, bool: np.bool_,
+           'int': np.int64, 'float': np.float64, 'bool': np.bool_}
+EXTRA_FIELD = '_extra'  # Row type field holding attributes that are not columns
+
+
+def get_extra(player, name: str, default=None):
+    """Attribute stored with set_extra on a Player or PlayerRow (default if unset)"""
+    extra = player._extra
+    if extra is None:
+        return default
+    return extra.get(name, default)
+
+
+def set_extra(player, name: str, value):
+    """Store an attribute that is not a field (strategy flag, simulation stat)"""
+    extra = player._extra
+    if extra is None:
+        extra = {}
+        object.__setattr__(player, EXTRA_FIELD, extra)
+    extra[name] = value
+
+
+def _check_integral(column: np.ndarray, name: str, values):
+    """Refuse to write non-integral numbers into an integer column (NumPy would truncate)"""
+    if column.dtype.kind not in 'iu':
+        return
+    values = np.asarray(values)
+    if values.dtype.kind in 'fc' and not np.all(np.mod(values, 1) == 0):
+        raise ValueError(f"Column '{name}' holds integers; got non-integral value(s) "
+                         f"{values[np.mod(values, 1) != 0].ravel()[:3].tolist()}")
+
+
+def _columns(row_type) -> list:
+    """row_type fields stored as columns"""
+    return [f for f in fields(row_type) if f.name != EXTRA_FIELD]
+
+
+def _make_player(row_type, values: Dict):
+    """Detached row_type instance with exactly these values (no __post_init__)"""
+    player = row_type.__new__(row_type)
+    names = {f.name for f in fields(row_type)}
+    extra = {}
+    for name, value in values.items():
+        if name in names:
+            object.__setattr__(player, name, value)
+        else:
+            extra[name] = value
+    if EXTRA_FIELD in names:
+        object.__setattr__(player, EXTRA_FIELD, extra or None)
+    return player
+
+
+def _extra_attributes(player) -> Optional[Dict]:
+    """Copy of a player's non-field attributes (None if there are none)"""
+    extra = getattr(player, EXTRA_FIELD, None)
+    return dict(extra) if extra else None
+
+
+class PlayerRow:
+    """
+    View of one PlayerTable row that behaves like a Player
+
+    Field reads and writes go to the table's columns, and the row type's
+    properties (team_code, ...) work as on a Player; attributes that are
+    not columns (e.g. strategy flags, see set_extra) live on the view.
+    Copies and pickles turn into detached Player objects.
+    """
+
+    __slots__ = ('_table', '_row', '_extra')
+
+    def __init__(self, table: 'PlayerTable', row: int):
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_row', row)
+        object.__setattr__(self, '_extra', None)
+
+    def __getattr__(self, name):
+        column = self._table.columns.get(name)
+        if column is not None:
+            return column.item(self._row)
+        extra = self._extra
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(f"'{self._table.row_type.__name__}' row has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        column = self._table.columns.get(name)
+        if column is not None:
+            if isinstance(value, float) and not value.is_integer():
+                _check_integral(column, name, value)
+            column[self._row] = value
+            return
+        if isinstance(getattr(type(self), name, None), property):
+            object.__setattr__(self, name, value)  # Derived property: its setter or an error
+            return
+        if self._extra is None:
+            object.__setattr__(self, '_extra', {})
+        self._extra[name] = value
+
+    def to_dict(self) -> Dict:
+        values = self._table.row_values(self._row)
+        if self._extra:
+            values.update(self._extra)
+        return values
+
+    def to_player(self):
+        """Detached copy as the table's row type"""
+        return _make_player(self._table.row_type, self.to_dict())
+
+    def __copy__(self):
+        return self.to_player()
+
+    def __deepcopy__(self, memo):
+        return self.to_player()
+
+    def __reduce__(self):
+        return _make_player, (self._table.row_type, self.to_dict())
+
+    def __repr__(self):
+        return (f"{self._table.row_type.__name__}(name={self.name!r}, position={self.position!r}, "
+                f"team={self.team!r}, salary={self.salary})")
+
+
+def _column_property(name: str) -> property:
+    def get(self):
+        return self._table.columns[name].item(self._row)
+    return property(get, doc=f"'{name}' column of this row")
+
+
+_row_classes: Dict[Tuple, type] = {}
+
+
+def _row_class(row_type, names: Tuple[str, ...]) -> type:
+    """
+    PlayerRow subclass with a property per column
+
+    Properties of row_type (e.g. Player.team_code) are shared too; they
+    read the row's columns like they read a Player's fields. Writes still
+    go through PlayerRow.__setattr__.
+    """
+    key = (row_type, names)
+    if key not in _row_classes:
+        namespace = {'__slots__': ()}
+        for cls in reversed(row_type.__mro__):
+            namespace.update((name, value) for name, value in vars(cls).items()
+                             if isinstance(value, property))
+        namespace.update((name, _column_property(name)) for name in names)
+        _row_classes[key] = type(f"{row_type.__name__}Row", (PlayerRow,), namespace)
+    return _row_classes[key]
+
+
+class PlayerTable:
+    """Columns for every field of a Player dataclass, one row per player"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], row_type):
+        self.columns = columns
+        self.row_type = row_type
+        n = len(next(iter(columns.values()))) if columns else 0
+        row_class = _row_class(row_type, tuple(columns))
+        self._rows = [row_class(self, i) for i in range(n)]
+
+    @classmethod
+    def from_players(cls, players: List, row_type=None) -> 'PlayerTable':
+        """Table with one row per player (row_type defaults to the first player's class)"""
+        if row_type is None:
+            if not players:
+                raise ValueError("row_type is required for an empty table")
+            first = players[0]
+            row_type = first._table.row_type if isinstance(first, PlayerRow) else type(first)
+
+        columns = {}
+        for f in _columns(row_type):
+            values = [getattr(p, f.name, None) for p in players]
+            dtype = _DTYPES.get(f.type, object)
+            if dtype is not object and any(v is None for v in values):
+                default = f.default if f.default is not MISSING else 0
+                values = [default if v is None else v for v in values]
+            column = np.empty(len(values), dtype=dtype)
+            _check_integral(column, f.name, values)
+            column[:] = values
+            columns[f.name] = column
+        table = cls(columns, row_type)
+
+        # Attributes set outside the fields (strategy flags, simulation stats) move along
+        for row, player in zip(table._rows, players):
+            extra = _extra_attributes(player)
+            if extra:
+                object.__setattr__(row, EXTRA_FIELD, extra)
+        return table
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], row_type) -> 'PlayerTable':
+        """Table from column arrays; row_type fields not given get their defaults"""
+        n = len(next(iter(columns.values()))) if columns else 0
+        full = {}
+        for f in _columns(row_type):
+            dtype = _DTYPES.get(f.type, object)
+            column = np.empty(n, dtype=dtype)
+            if f.name in columns:
+                _check_integral(column, f.name, columns[f.name])
+                column[:] = columns[f.name]
+            elif f.default is not MISSING:
+                column[:] = f.default
+            elif f.default_factory is not MISSING:
+                column[:] = [f.default_factory() for _ in range(n)]
+            else:
+                raise ValueError(f"Missing column '{f.name}' (no default)")
+            full[f.name] = column
+        return cls(full, row_type)
+
+    @staticmethod
+    def backing(players) -> Optional[Tuple['PlayerTable', np.ndarray]]:
+        """(table, row indices) when every player is a row of one table, else None"""
+        if not players or not isinstance(players[0], PlayerRow):
+            return None
+        table = players[0]._table
+        rows = []
+        for p in players:
+            if not isinstance(p, PlayerRow) or p._table is not table:
+                return None
+            rows.append(p._row)
+        return table, np.array(rows, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rows(self, indices=None) -> List[PlayerRow]:
+        """Row views (all rows, or the given indices)"""
+        if indices is None:
+            return list(self._rows)
+        return [self._rows[i] for i in indices]
+
+    def column(self, name: str, rows=None) -> np.ndarray:
+        """A column (a copy when rows is given)"""
+        column = self.columns[name]
+        return column if rows is None else column[rows]
+
+    def set(self, name: str, values, rows=None):
+        """Write a column, or just the given rows of it (ValueError: fractions into an int column)"""
+        _check_integral(self.columns[name], name, values)
+        if rows is None:
+            self.columns[name][:] = values
+        else:
+            self.columns[name][rows] = values
+
+    def is_pitcher(self, rows=None) -> np.ndarray:
+        return np.isin(self.column('position', rows), PITCHER_POSITIONS)
+
+    def row_values(self, row: int) -> Dict:
+        return {name: column.item(row) for name, column in self.columns.items()}
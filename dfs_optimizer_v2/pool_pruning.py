@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+DOMINANCE POOL PRUNING
+======================
+Pre-solve pass that drops players who cannot appear in an optimal lineup
+
+A player is dominated when enough players with the SAME eligibility are
+no more expensive and score at least as well (strictly better on one of
+the two). "Enough" is every roster slot the eligibility can fill (a
+1B/OF player can take 1 + 3 slots), capped at roster size, so a lineup
+always leaves one dominator unused. Swapping a dominated player for that
+dominator keeps positions, stays under the cap and never scores less.
+
+Dominators on other teams only count when the team cap is known: the
+rest of a lineup can fill at most (roster - 1) // max_team teams to the
+cap, so the dominators of that many other teams (the best-stocked ones)
+are set aside. Without max_team only same-team dominators count.
+
+When the salary floor can bind, a cheaper swap may drop a lineup below
+it. The pass then splits the cap - floor window into a band below and a
+band above the player's salary that add up to at most the window: a
+lineup within `down` of the floor is at least `up` under the cap, so
+either every dominator in the lower band fits or every higher-scoring
+player in the upper band does. The player goes when both bands hold
+enough of them (or enough cost exactly the same). Each swap raises the
+score or keeps it and lowers the salary, so repeated swaps end on a
+lineup of kept players.
+
+When N lineups are generated with exclusion cuts, N - 1 extra dominators
+are required so a swap always leads to a lineup that was not cut off.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+from compiled_pool import CompiledPool, POSITIONS, POSITION_BITS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PruneReport:
+    """Audit trail for one pruning pass"""
+    original: int = 0
+    kept: int = 0
+    removed: List[Dict] = field(default_factory=list)
+
+    @property
+    def num_removed(self) -> int:
+        return len(self.removed)
+
+    def summary(self) -> str:
+        return f"Pruned {self.num_removed}/{self.original} dominated players ({self.kept} kept)"
+
+
+def required_dominators(mask: int, positions: Dict[str, int], depth: int = 1) -> int:
+    """Dominators needed to drop a player with this eligibility mask"""
+    slots = sum(req for pos, req in positions.items() if mask & POSITION_BITS[pos])
+    if not slots:
+        return 0
+    return min(slots, sum(positions.values())) + max(depth, 1) - 1
+
+
+def prune_dominated(pool: CompiledPool, positions: Dict[str, int], depth: int = 1,
+                    min_salary: float = 0, max_team: Optional[int] = None,
+                    salary_cap: Optional[float] = None) -> Tuple[np.ndarray, PruneReport]:
+    """
+    Find the players that survive dominance pruning
+
+    max_team (the lineup's per-team cap) lets players on other teams
+    dominate. salary_cap enables the two-band rule when the floor binds
+    (without it only equal-salary dominators count). Returns (kept
+    indices into pool, PruneReport).
+    """
+    n = len(pool)
+    keep = np.ones(n, dtype=bool)
+    report = PruneReport(original=n)
+
+    # Cheapest conceivable roster; above it the salary floor can bind
+    roster_size = sum(positions.values())
+    floor_binds = min_salary > np.sort(pool.salary)[:roster_size].sum()
+    window = salary_cap - min_salary if salary_cap is not None else -1
+
+    # Teams the rest of a lineup can fill to the cap (their dominators may not fit)
+    if max_team:
+        full_teams = (roster_size - 1) // max_team
+        num_teams = int(pool.team_idx.max()) + 1 if n else 0
+
+    # Dominators share eligibility, so a swap keeps positions
+    for mask in np.unique(pool.eligibility):
+        need = required_dominators(int(mask), positions, depth)
+        group = np.flatnonzero(pool.eligibility == mask)
+        if need == 0 or len(group) <= need:
+            continue
+
+        salary = pool.salary[group]
+        score = pool.score[group]
+        team = pool.team_idx[group]
+
+        def usable(dominates: np.ndarray) -> np.ndarray:
+            """Dominators of each group member a lineup cannot use up"""
+            if not max_team:
+                dominates = dominates & (team[:, None] == team[None, :])
+            counts = dominates.sum(axis=0)
+            if max_team and full_teams:
+                # by_team[b, t]: dominators of group[b] on team t (other than b's own)
+                by_team = dominates.T.astype(np.int64) @ np.eye(num_teams, dtype=np.int64)[team]
+                by_team[np.arange(len(group)), team] = 0
+                by_team.sort(axis=1)
+                counts = counts - by_team[:, -full_teams:].sum(axis=1)
+            return counts
+
+        # dominates[a, b]: group[a] dominates group[b]
+        # diff[a, b]: how much more group[a] costs than group[b]
+        diff = salary[:, None] - salary[None, :]
+        better = score[:, None] >= score[None, :]
+        strict = (diff < 0) | (score[:, None] > score[None, :])
+        dominates = (diff <= 0) & better & strict
+        num_dominators = usable(dominates)
+        pruned = num_dominators >= need
+
+        if floor_binds:
+            num_dominators = usable(dominates & (diff == 0))
+            pruned = num_dominators >= need
+            if window >= 0:
+                # The smallest bands with enough usable players, tried per salary gap
+                gaps = np.unique(np.abs(diff))
+                upgrades = (diff >= 0) & (score[:, None] > score[None, :])
+                down_gap = np.full(len(group), np.inf)
+                up_gap = np.full(len(group), np.inf)
+                for gap in gaps[gaps <= window]:
+                    in_band = np.abs(diff) <= gap
+                    down_gap[np.isinf(down_gap) & (usable(dominates & in_band) >= need)] = gap
+                    up_gap[np.isinf(up_gap) & (usable(upgrades & in_band) >= need)] = gap
+                pruned |= down_gap + up_gap <= window
+                num_dominators = np.where(pruned, usable(dominates | upgrades), num_dominators)
+
+        slots = '/'.join(pos for pos in POSITIONS if mask & POSITION_BITS[pos])
+        for b in np.flatnonzero(pruned):
+            i = int(group[b])
+            keep[i] = False
+            examples = [pool.players[int(group[a])].name
+                        for a in np.flatnonzero(dominates[:, b])[:3]]
+            where = 'usable' if max_team else f"on {pool.players[i].team}"
+            report.removed.append({
+                'name': pool.players[i].name,
+                'position': pool.players[i].position,
+                'salary': int(pool.salary[i]),
+                'score': float(pool.score[i]),
+                'reason': (f"{int(num_dominators[b])} cheaper/higher-scoring {slots} players "
+                           f"{where} (need {need}), e.g. {', '.join(examples)}"),
+            })
+
+    kept = np.flatnonzero(keep)
+    report.kept = len(kept)
+    return kept, report
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+PORTFOLIO OPTIMIZER
+===================
+Choose N lineups jointly instead of one after another
+
+Column generation over candidate lineups:
+1. Seed columns: a greedy portfolio that already satisfies the
+   uniqueness and exposure rules (so the master is always feasible)
+2. Pricing rounds: new columns from the lineup model with player
+   scores reduced by the exposure-row duals of the master LP relaxation
+3. Master MILP: pick exactly N columns maximizing total score, with
+   player/team exposure caps, pairwise uniqueness and stack quotas as
+   global constraints
+
+The master is solved with the same backends as single lineups.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from compiled_pool import CompiledPool
+from solver_backends import SCIPY_AVAILABLE, get_backend
+
+if SCIPY_AVAILABLE:
+    from scipy.optimize import linprog
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PortfolioConfig:
+    """Global rules for a joint portfolio"""
+    max_overlap: int = 6              # Max players shared between any two lineups
+    max_player_exposure: float = 1.0  # Max share of lineups any player appears in
+    max_team_exposure: float = 1.0    # Max share of lineups stacking any team
+    team_stack_size: int = 3          # Players from one team that count as a stack
+    stack_quotas: Dict[int, int] = field(default_factory=dict)  # {stack size: min lineups}
+    pricing_rounds: int = 3           # Column generation rounds after the seed
+
+    @classmethod
+    def from_diversity(cls, config, **overrides) -> 'PortfolioConfig':
+        """Portfolio rules matching a DiversityConfig"""
+        values = dict(max_overlap=config.max_overlap,
+                      max_player_exposure=config.max_player_exposure,
+                      max_team_exposure=config.max_team_exposure,
+                      team_stack_size=config.team_stack_size)
+        values.update(overrides)
+        return cls(**values)
+
+
+class _MasterModel:
+    """Column-selection MILP in the shape solver backends consume"""
+
+    def __init__(self, num_columns: int, config):
+        self.config = config
+        self.objective = np.zeros(num_columns)
+        self.lb = np.zeros(num_columns)
+        self.ub = np.ones(num_columns)
+        self.rows = []
+        self.row_lo = []
+        self.row_hi = []
+
+    def add_row(self, cols, coefs, lo=-np.inf, hi=np.inf):
+        self.rows.append(([int(c) for c in cols], [float(c) for c in coefs]))
+        self.row_lo.append(float(lo))
+        self.row_hi.append(float(hi))
+
+
+class PortfolioOptimizer:
+    """Joint N-lineup portfolio on top of a DFSOptimizer"""
+
+    def __init__(self, optimizer, config: Optional[PortfolioConfig] = None):
+        self.optimizer = optimizer
+        self.config = config or PortfolioConfig()
+
+    def optimize(self, players, contest_type: str = 'gpp', num_lineups: int = 20) -> List[Dict]:
+        """The best portfolio of num_lineups lineups found over the generated columns"""
+        pool = self.optimizer._compile(players)
+        model = self.optimizer.build_model(pool, contest_type)
+        if not model.feasible:
+            logger.error("Player pool cannot produce a legal lineup")
+            return []
+
+        player_limit = max(1, int(self.config.max_player_exposure * num_lineups))
+        team_limit = max(1, int(self.config.max_team_exposure * num_lineups))
+
+        columns = self._seed_columns(pool, contest_type, num_lineups, player_limit, team_limit)
+        if not columns:
+            logger.error("Failed to generate seed portfolio")
+            return []
+        if len(columns) < num_lineups:
+            logger.warning(f"Only {len(columns)}/{num_lineups} lineups satisfy the portfolio rules")
+            return self._lineups(pool, columns, contest_type)
+
+        # Pricing model: known columns are cut off so every solve adds a new one
+        for selected in columns:
+            model.add_exclusion(selected)
+
+        chosen = list(range(len(columns)))
+        sizes = sorted(self.config.stack_quotas)
+        teams = self._stack_teams(pool)
+        for round_num in range(1, self.config.pricing_rounds + 1):
+            # Players the portfolio is short of cost more in the pricing objective
+            model.objective = pool.score - self._prices(pool, columns, chosen, num_lineups,
+                                                        player_limit)
+            added = 0
+            for k in range(num_lineups):
+                selected = None
+                if sizes and k % 2:
+                    # Every other column carries a quota stack
+                    t = teams[(k // 2) % len(teams)]
+                    selected = self._solve_with_stack(model, pool, t, sizes[(k // 2) % len(sizes)])
+                if selected is None:
+                    selected = model.solve()
+                if selected is None:
+                    break
+                columns.append(selected)
+                model.add_exclusion(selected)
+                added += 1
+
+            result = self._solve_master(pool, columns, num_lineups, player_limit, team_limit)
+            # A time-limited master may return a worse incumbent; keep the best
+            before = self._total(pool, columns, chosen)
+            if result is not None and self._total(pool, columns, result) > before + 1e-6:
+                chosen = result
+            logger.info(f"Portfolio round {round_num}: {len(columns)} columns, "
+                        f"score {self._total(pool, columns, chosen):.1f}")
+            if added == 0:
+                break
+
+        return self._lineups(pool, [columns[c] for c in chosen], contest_type)
+
+    def _seed_columns(self, pool: CompiledPool, contest_type: str, num_lineups: int,
+                      player_limit: int, team_limit: int) -> List[List[int]]:
+        """Greedy portfolio built under the same rules as the master"""
+        model = self.optimizer.build_model(pool, contest_type)
+        player_use = np.zeros(len(pool), dtype=np.int64)
+        team_stacks = np.zeros(len(pool.teams), dtype=np.int64)
+        columns = []
+
+        # Stack sizes the seed must contain, largest first
+        required = sorted((size for size, quota in self.config.stack_quotas.items()
+                           for _ in range(min(quota, num_lineups))), reverse=True)
+        teams = self._stack_teams(pool)
+
+        for k in range(num_lineups):
+            model.ub[player_use >= player_limit] = 0.0
+            for t in np.flatnonzero(team_stacks >= team_limit):
+                row = model.team_rows[pool.teams[t]]
+                model.row_hi[row] = min(model.row_hi[row], self.config.team_stack_size - 1)
+
+            selected = None
+            if k < len(required):
+                # Rotate through stack teams until one can host the stack
+                for t in teams[k % len(teams):] + teams[:k % len(teams)]:
+                    selected = self._solve_with_stack(model, pool, t, required[k])
+                    if selected is not None:
+                        break
+            if selected is None:
+                selected = model.solve()
+            if selected is None:
+                break
+            columns.append(selected)
+            player_use[selected] += 1
+            team_stacks += np.bincount(pool.team_idx[selected],
+                                       minlength=len(pool.teams)) >= self.config.team_stack_size
+            model.add_exclusion(selected, self.config.max_overlap)
+
+        return columns
+
+    def _prices(self, pool: CompiledPool, columns: List[List[int]], chosen: List[int],
+                num_lineups: int, player_limit: int) -> np.ndarray:
+        """
+        Per-player price of exposure for the pricing objective
+
+        Duals of the exposure rows in the master LP relaxation when scipy is
+        available; otherwise players at their cap in the current portfolio
+        are priced at the score share they would have to give up.
+        """
+        incidence = self._incidence(pool, columns)
+        if SCIPY_AVAILABLE:
+            scores = incidence.astype(float) @ pool.score
+            capped = np.flatnonzero(incidence.sum(axis=0) > player_limit)
+            a_ub = incidence[:, capped].T.astype(float)
+            res = linprog(-scores,
+                          A_ub=a_ub if len(capped) else None,
+                          b_ub=np.full(len(capped), player_limit) if len(capped) else None,
+                          A_eq=np.ones((1, len(columns))), b_eq=[num_lineups],
+                          bounds=(0, 1), method='highs')
+            if res.status == 0:
+                prices = np.zeros(len(pool))
+                if len(capped):
+                    prices[capped] = -res.ineqlin.marginals
+                return prices
+
+        usage = incidence[chosen].sum(axis=0)
+        return np.where(usage >= player_limit, 0.5 * pool.score, 0.0)
+
+    @staticmethod
+    def _stack_teams(pool: CompiledPool) -> List[int]:
+        """Team indices by the score of their five best hitters"""
+        hitters = ~pool.is_pitcher
+        strength = []
+        for t in range(len(pool.teams)):
+            scores = np.sort(pool.score[hitters & (pool.team_idx == t)])[::-1]
+            strength.append(scores[:5].sum())
+        return [int(t) for t in np.argsort(strength, kind='stable')[::-1]]
+
+    @staticmethod
+    def _solve_with_stack(model, pool: CompiledPool, team: int, size: int) -> Optional[List[int]]:
+        """Solve with at least `size` players from one team"""
+        row = model.team_rows[pool.teams[team]]
+        if model.row_hi[row] < size:
+            return None
+        saved = model.row_lo[row]
+        model.row_lo[row] = size
+        try:
+            return model.solve()
+        finally:
+            model.row_lo[row] = saved
+
+    def _solve_master(self, pool: CompiledPool, columns: List[List[int]], num_lineups: int,
+                      player_limit: int, team_limit: int) -> Optional[List[int]]:
+        """Column indices of the best feasible N-lineup selection, or None"""
+        incidence = self._incidence(pool, columns)
+        team_counts = np.stack([np.bincount(pool.team_idx[c], minlength=len(pool.teams))
+                                for c in columns])
+        master = _MasterModel(len(columns), self.optimizer.config)
+        master.objective = incidence.astype(float) @ pool.score
+
+        everyone = np.arange(len(columns))
+        master.add_row(everyone, np.ones(len(columns)), num_lineups, num_lineups)
+
+        # Exposure caps (only rows that can bind)
+        for i in np.flatnonzero(incidence.sum(axis=0) > player_limit):
+            cols = np.flatnonzero(incidence[:, i])
+            master.add_row(cols, np.ones(len(cols)), hi=player_limit)
+        stacks = team_counts >= self.config.team_stack_size
+        for t in np.flatnonzero(stacks.sum(axis=0) > team_limit):
+            cols = np.flatnonzero(stacks[:, t])
+            master.add_row(cols, np.ones(len(cols)), hi=team_limit)
+
+        # Stack-type quotas: at least q lineups with a stack of this size
+        max_stack = team_counts.max(axis=1)
+        for size, quota in self.config.stack_quotas.items():
+            cols = np.flatnonzero(max_stack >= size)
+            master.add_row(cols, np.ones(len(cols)), lo=min(quota, num_lineups))
+
+        # Uniqueness: columns sharing too many players exclude each other
+        overlap = incidence.astype(np.int32) @ incidence.T.astype(np.int32)
+        for a, b in zip(*np.nonzero(np.triu(overlap > self.config.max_overlap, k=1))):
+            master.add_row([a, b], [1.0, 1.0], hi=1)
+
+        result = get_backend(self.optimizer.config.solver).create_session(master).solve()
+        if result.status not in ('optimal', 'feasible'):
+            logger.warning("Portfolio master problem has no feasible selection")
+            return None
+        chosen = [int(c) for c in np.flatnonzero(result.x > 0.5)]
+        return chosen if len(chosen) == num_lineups else None
+
+    @staticmethod
+    def _total(pool: CompiledPool, columns: List[List[int]], chosen: List[int]) -> float:
+        return float(sum(pool.score[columns[c]].sum() for c in chosen))
+
+    @staticmethod
+    def _incidence(pool: CompiledPool, columns: List[List[int]]) -> np.ndarray:
+        """columns x players boolean matrix"""
+        incidence = np.zeros((len(columns), len(pool)), dtype=bool)
+        for r, selected in enumerate(columns):
+            incidence[r, selected] = True
+        return incidence
+
+    def _lineups(self, pool: CompiledPool, columns: List[List[int]], contest_type: str) -> List[Dict]:
+        lineups = [self.optimizer.build_lineup(pool, selected, contest_type) for selected in columns]
+        lineups.sort(key=lambda lineup: -lineup['projection'])
+        return lineups
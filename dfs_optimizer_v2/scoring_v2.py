@@ -8,6 +8,10 @@ One simple scoring system that drives natural stacking
 from typing import List, Optional
 import logging
 
+import numpy as np
+
+from player_table import PlayerTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,13 +49,17 @@ class ScoringEngine:
         """
         logger.info(f"Scoring {len(players)} players for {contest_type}")
 
-        for player in players:
-            player.optimization_score = self.score_player(player, contest_type)
+        backing = PlayerTable.backing(players)
+        if backing is not None:
+            scores = self.score_table(*backing, contest_type).tolist()
+        else:
+            for player in players:
+                player.optimization_score = self.score_player(player, contest_type)
+            scores = [p.optimization_score for p in players]
 
         self.players_scored = len(players)
 
         # Log scoring distribution
-        scores = [p.optimization_score for p in players]
         avg_score = sum(scores) / len(scores) if scores else 0
         max_score = max(scores) if scores else 0
         min_score = min(scores) if scores else 0
@@ -60,6 +68,39 @@ class ScoringEngine:
 
         return players
 
+    def score_table(self, table: PlayerTable, rows, contest_type: str = 'gpp') -> np.ndarray:
+        """
+        Score table rows as column operations (same rules as score_player)
+
+        Writes optimization_score for the rows and returns the scores.
+        """
+        def col(name):
+            return table.column(name, rows).astype(float)
+
+        score = col('projection')
+        score[score <= 0] = 10.0
+        pitcher = table.is_pitcher(rows)
+        team_total = col('implied_team_score')
+        batting_order = col('batting_order')
+
+        if contest_type == 'gpp':
+            params = self.GPP_PARAMS
+            score[team_total >= params['high_total_threshold']] *= params['team_total_boost']
+            score[~pitcher & (batting_order <= 4)] *= params['batting_order_boost']
+            score[col('ownership_projection') < params['low_ownership_threshold']] *= params['ownership_boost']
+            score[pitcher & (col('k_rate') >= params['k_rate_threshold'])] *= params['pitcher_k_boost']
+        else:
+            params = self.CASH_PARAMS
+            score[team_total >= params['team_total_threshold']] *= params['team_total_boost']
+            score[~pitcher & (batting_order <= 5)] *= params['batting_order_boost']
+            score[col('consistency_score') >= params['consistency_threshold']] *= params['consistency_boost']
+            recent_form = col('recent_form')
+            hot = recent_form > 1.0
+            score[hot] *= np.minimum(params['recent_form_boost'], recent_form[hot])
+
+        table.set('optimization_score', score, rows)
+        return score
+
     def score_player(self, player, contest_type: str = 'gpp') -> float:
         """
         Score a single player
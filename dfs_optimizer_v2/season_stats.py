@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+SEASON PITCHING STATS
+=====================
+The FanGraphs season pitching table, loaded once per season
+
+pitching_stats(season, season, qual=1) returns every pitcher in the
+league, so one download serves a whole slate. The table is kept in
+memory per season, saved as "pitching_stats_<season>.pkl" in the cache
+directory (the current season is re-downloaded once a day, past seasons
+never, a failed download is retried after a few minutes), and indexed by FanGraphs ID, MLBAM ID and name key. Looking up a
+pitcher is a dictionary access.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from statcast_bulk import dk_name_key
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pybaseball import pitching_stats, playerid_reverse_lookup
+    PYBASEBALL_AVAILABLE = True
+except ImportError:
+    PYBASEBALL_AVAILABLE = False
+
+CURRENT_SEASON_TTL = 86400.0  # Seconds before the in-progress season is re-downloaded
+FAILURE_RETRY = 300.0  # Seconds before a failed download is tried again
+
+
+def current_season(today: Optional[date] = None) -> int:
+    """The season with stats to use (last year's until April)"""
+    today = today or date.today()
+    return today.year if today.month >= 4 else today.year - 1
+
+
+class SeasonPitchingStats:
+    """One season's pitching table with ID and name indexes"""
+
+    def __init__(self, season: int, table: pd.DataFrame):
+        self.season = season
+        self.table = table
+        rows = table.to_dict('records')
+        self.by_fangraphs: Dict[int, Dict] = {int(r['IDfg']): r for r in rows if pd.notna(r.get('IDfg'))}
+        self.by_mlbam: Dict[int, Dict] = {int(r['key_mlbam']): r for r in rows
+                                          if pd.notna(r.get('key_mlbam'))}
+        # Most innings wins a shared name key
+        self.by_name: Dict[str, Dict] = {}
+        for r in sorted(rows, key=lambda r: r.get('IP') or 0):
+            self.by_name[dk_name_key(str(r.get('Name', '')))] = r
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def pitcher(self, player_name: Optional[str] = None, mlbam: Optional[int] = None) -> Optional[Dict]:
+        """Season row by MLBAM ID, falling back to the name"""
+        if mlbam is not None and int(mlbam) in self.by_mlbam:
+            return self.by_mlbam[int(mlbam)]
+        if player_name:
+            return self.by_name.get(dk_name_key(player_name))
+        return None
+
+    @classmethod
+    def download(cls, season: int) -> 'SeasonPitchingStats':
+        table = pitching_stats(season, season, qual=1)
+        try:
+            ids = playerid_reverse_lookup(table['IDfg'].dropna().astype(int).tolist(), key_type='fangraphs')
+            mlbam = dict(zip(ids['key_fangraphs'].astype(int), ids['key_mlbam'].astype(int)))
+            table['key_mlbam'] = table['IDfg'].map(mlbam)
+        except Exception as e:
+            logger.debug(f"FanGraphs -> MLBAM mapping failed (name lookups only): {e}")
+        return cls(season, table)
+
+
+_seasons: Dict[int, Tuple[SeasonPitchingStats, float]] = {}  # season -> (stats, expires at)
+_seasons_lock = threading.Lock()
+
+
+def season_pitching_stats(season: Optional[int] = None,
+                          cache_dir: Optional[str] = '.dfs_cache') -> SeasonPitchingStats:
+    """Memoized season table: memory, then the disk snapshot, then FanGraphs"""
+    season = season or current_season()
+    with _seasons_lock:
+        previous, expires = _seasons.get(season, (None, 0.0))
+        if time.time() < expires:
+            return previous
+
+        past = season < current_season()
+        path = os.path.join(cache_dir, f"pitching_stats_{season}.pkl") if cache_dir else None
+        stats = stale = None
+        if path and os.path.exists(path):
+            expires = float('inf') if past else os.path.getmtime(path) + CURRENT_SEASON_TTL
+            try:
+                snapshot = SeasonPitchingStats(season, pd.read_pickle(path))
+                if time.time() < expires or not PYBASEBALL_AVAILABLE:
+                    stats = snapshot
+                else:
+                    stale = snapshot  # Served only if the download fails
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable season stats snapshot: {e}")
+            if not PYBASEBALL_AVAILABLE:
+                expires = float('inf')  # Nothing newer can be fetched
+
+        if stats is None:
+            if not PYBASEBALL_AVAILABLE:
+                raise ImportError("pybaseball is required to download season stats")
+            logger.info(f"Downloading {season} season pitching stats...")
+            try:
+                stats = SeasonPitchingStats.download(season)
+                expires = float('inf') if past else time.time() + CURRENT_SEASON_TTL
+            except Exception as e:
+                # Keep the last table or expired snapshot (if any) and retry
+                # later, not once per pitcher
+                logger.warning(f"Season pitching stats unavailable: {e}")
+                stats = previous or stale or SeasonPitchingStats(season, pd.DataFrame())
+                expires = time.time() + FAILURE_RETRY
+                path = None
+            if path:
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    stats.table.to_pickle(path + '.tmp')
+                    os.replace(path + '.tmp', path)
+                except OSError as e:
+                    logger.debug(f"Could not write season stats snapshot: {e}")
+
+        logger.info(f"{season} season pitching stats: {len(stats)} pitchers")
+        _seasons[season] = (stats, expires)
+        return stats
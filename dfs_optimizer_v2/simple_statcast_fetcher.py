@@ -4,11 +4,16 @@ Real Statcast Fetcher - Gets actual Baseball Savant data
 """
 
 import logging
+import os
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 import time
 
+from statcast_bulk import SlateStatcast, dk_name_key, load_window
+from statcast_store import StatcastStore
+from season_stats import season_pitching_stats
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -23,20 +28,48 @@ except ImportError:
 class SimpleStatcastFetcher:
     """Real Statcast fetcher using pybaseball"""
 
-    def __init__(self):
-        """Initialize fetcher"""
+    def __init__(self, store_path: Optional[str] = os.path.join('.dfs_cache', 'statcast.sqlite')):
+        """Initialize fetcher (store_path=None: no local Statcast store)"""
         self.enabled = PYBASEBALL_AVAILABLE
+        self.store_path = store_path
         self.player_cache = {}
         self.last_fetch_time = {}
         self.rate_limit_delay = 0.5  # Seconds between API calls (reduced for faster processing)
+        self.slate: Optional[SlateStatcast] = None  # Bulk aggregates (see prefetch_slate)
 
         if self.enabled:
             logger.info("SimpleStatcastFetcher initialized (REAL DATA MODE)")
         else:
             logger.info("SimpleStatcastFetcher initialized (fallback mode)")
 
+    def prefetch_slate(self, teams: Optional[Iterable[str]] = None, days: int = 30,
+                       offline: bool = False) -> bool:
+        """
+        Switch to bulk mode: one Statcast pull for the last days
+
+        League-wide by default, or only games of the given teams. Batter
+        and pitcher lookups are then served from the pull's aggregates
+        without per-player requests. With a local store only the days it
+        is missing are downloaded; offline (or without pybaseball) the
+        store is used as is.
+        """
+        offline = offline or not self.enabled
+        if offline and not (self.store_path and os.path.exists(self.store_path)):
+            return False  # Nothing stored, and opening the store would create an empty one
+        try:
+            store = StatcastStore(self.store_path) if self.store_path else None
+            self.slate = load_window(days, teams, store, offline)
+            return True
+        except Exception as e:
+            logger.warning(f"Bulk Statcast pull failed - fetching per player: {e}")
+            return False
+
     def get_batter_stats(self, player_name: str) -> Dict:
         """Get real batter stats from Statcast"""
+        if self.slate is not None:
+            # No batted balls in the window = no recent data
+            return self.slate.batter(player_name) or self._get_default_batter_stats()
+
         if not self.enabled:
             return self._get_default_batter_stats()
 
@@ -172,6 +205,17 @@ class SimpleStatcastFetcher:
 
     def get_pitcher_stats(self, player_name: str) -> Dict:
         """Get real pitcher stats from Statcast"""
+        if self.slate is not None:
+            window = self.slate.pitcher(player_name)
+            if window is None:
+                return self._get_default_pitcher_stats()
+            pitches, strikeouts = window
+            mlbam = self.slate.pitcher_ids.get(dk_name_key(player_name))
+            stats = self._season_pitcher_stats(player_name, mlbam) or \
+                self._estimate_pitcher_stats(pitches, strikeouts)
+            stats['has_recent_data'] = True
+            return stats
+
         if not self.enabled:
             return self._get_default_pitcher_stats()
 
@@ -234,62 +278,14 @@ class SimpleStatcastFetcher:
             if data.empty:
                 return self._get_default_pitcher_stats()
 
-            # Try to get real K/9 from recent games
-            # Method 1: Use playerid_lookup to get season stats
-            try:
-                from pybaseball import playerid_lookup, pitching_stats
-
-                # Get player ID for season stats
-                name_parts = player_name.split()
-                if len(name_parts) >= 2:
-                    first_name = name_parts[0]
-                    last_name = name_parts[-1]
-
-                    # Look up player
-                    player_lookup = playerid_lookup(last_name, first_name)
-                    if not player_lookup.empty:
-                        player_id = player_lookup.iloc[0]['key_mlbam']
-
-                        # Get 2024 season stats
-                        season_stats = pitching_stats(2024, 2024, qual=1)
-                        player_stats = season_stats[season_stats['IDfg'] == player_id]
-
-                        if not player_stats.empty:
-                            # Get real K/9
-                            k9 = player_stats.iloc[0].get('K/9', 8.0)
-                            era = player_stats.iloc[0].get('ERA', 4.00)
-                            whip = player_stats.iloc[0].get('WHIP', 1.30)
-
-                            logger.debug(f"✅ Real season stats for {player_name}: K/9 {k9:.1f}, ERA {era:.2f}")
-
-                            return {
-                                'k_rate': float(k9),
-                                'era': float(era),
-                                'whip': float(whip),
-                                'quality_score': 1.15 if k9 >= 10.0 else 1.05 if k9 >= 8.5 else 1.0,
-                                'has_recent_data': True
-                            }
-
-            except Exception as e:
-                logger.debug(f"Season stats lookup failed for {player_name}: {e}")
+            # Method 1: Season stats
+            stats = self._season_pitcher_stats(player_name)
+            if stats:
+                return stats
 
             # Method 2: Estimate from Statcast data
             if 'events' in data.columns:
-                total_batters = len(data)
-                strikeouts = len(data[data['events'] == 'strikeout'])
-
-                if total_batters > 10:  # Need reasonable sample
-                    # Rough K/9 estimate: (K / BF) * 27 (outs per game) / 3 (outs per inning)
-                    k_rate = (strikeouts / total_batters) * 9
-                    k_rate = min(max(k_rate, 4.0), 15.0)  # Cap between 4-15
-
-                    return {
-                        'k_rate': k_rate,
-                        'era': 4.00,  # Default
-                        'whip': 1.30,  # Default
-                        'quality_score': 1.15 if k_rate >= 10.0 else 1.05 if k_rate >= 8.5 else 1.0,
-                        'has_recent_data': True
-                    }
+                return self._estimate_pitcher_stats(len(data), int((data['events'] == 'strikeout').sum()))
 
             # Fallback to defaults
             return self._get_default_pitcher_stats()
@@ -298,6 +294,46 @@ class SimpleStatcastFetcher:
             logger.debug(f"Pitcher stats calculation failed for {player_name}: {e}")
             return self._get_default_pitcher_stats()
 
+    def _season_pitcher_stats(self, player_name: str, mlbam: Optional[int] = None) -> Optional[Dict]:
+        """Real K/9, ERA and WHIP from the season table (None if not found)"""
+        try:
+            row = season_pitching_stats().pitcher(player_name, mlbam)
+            if row is None:
+                return None
+
+            k9 = row.get('K/9', 8.0)
+            era = row.get('ERA', 4.00)
+            whip = row.get('WHIP', 1.30)
+            logger.debug(f"✅ Real season stats for {player_name}: K/9 {k9:.1f}, ERA {era:.2f}")
+
+            return {
+                'k_rate': float(k9),
+                'era': float(era),
+                'whip': float(whip),
+                'quality_score': 1.15 if k9 >= 10.0 else 1.05 if k9 >= 8.5 else 1.0,
+                'has_recent_data': True
+            }
+
+        except Exception as e:
+            logger.debug(f"Season stats lookup failed for {player_name}: {e}")
+            return None
+
+    def _estimate_pitcher_stats(self, total_batters: int, strikeouts: int) -> Dict:
+        """K/9 estimate from a pitcher's recent pitches (defaults for small samples)"""
+        if total_batters > 10:  # Need reasonable sample
+            # Rough K/9 estimate: (K / BF) * 27 (outs per game) / 3 (outs per inning)
+            k_rate = (strikeouts / total_batters) * 9
+            k_rate = min(max(k_rate, 4.0), 15.0)  # Cap between 4-15
+
+            return {
+                'k_rate': k_rate,
+                'era': 4.00,  # Default
+                'whip': 1.30,  # Default
+                'quality_score': 1.15 if k_rate >= 10.0 else 1.05 if k_rate >= 8.5 else 1.0,
+                'has_recent_data': True
+            }
+        return self._get_default_pitcher_stats()
+
     def _get_default_pitcher_stats(self) -> Dict:
         """Return default pitcher stats when real data unavailable"""
         return {
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+DRAFTKINGS SLATE LOADER
+=======================
+Vectorized salary-file parsing with a binary snapshot cache
+
+The CSV is parsed column-wise with pandas (csv module fallback) into a
+NumPy structured array: fixed-width strings plus numeric columns. The
+array is saved as "slate_<content hash>.npy" in the cache directory, so
+reloading an unchanged file is a memory-mapped read with no parsing.
+"""
+
+import csv
+import hashlib
+import logging
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+SNAPSHOT_VERSION = 1  # Bump when the parsed columns change
+STRING_COLUMNS = ('name', 'position', 'team', 'opponent', 'game_info', 'player_id')
+CSV_COLUMNS = {'name': 'Name', 'position': 'Position', 'team': 'TeamAbbrev',
+               'opponent': 'Opponent', 'game_info': 'Game Info'}
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    h.update(str(SNAPSHOT_VERSION).encode())
+    return h.hexdigest()
+
+
+def _clean(values) -> np.ndarray:
+    """Object array of stripped strings ('' for missing)"""
+    return np.array([(v or '').strip() if isinstance(v, str) else '' for v in values], dtype=object)
+
+
+def _parse_pandas(csv_path: str) -> Dict[str, np.ndarray]:
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    n = len(df)
+
+    def text(column: str) -> np.ndarray:
+        if column not in df:
+            return np.full(n, '', dtype=object)
+        return df[column].str.strip().to_numpy(dtype=object)
+
+    columns = {field: text(column) for field, column in CSV_COLUMNS.items()}
+    ids = text('ID')
+    if 'PlayerID' in df:
+        ids = np.where(ids == '', text('PlayerID'), ids)
+    columns['player_id'] = ids
+
+    salary = df['Salary'].str.replace('$', '', regex=False).str.replace(',', '', regex=False) \
+        if 'Salary' in df else pd.Series(['0'] * n)
+    columns['salary'] = pd.to_numeric(salary, errors='coerce').to_numpy(dtype=float)
+
+    # Blank average = 10 points; a missing column = 0 (as the row parser did)
+    points = df['AvgPointsPerGame'] if 'AvgPointsPerGame' in df else pd.Series(['0'] * n)
+    points = points.where(points != '', '10.0')
+    columns['projection'] = pd.to_numeric(points, errors='coerce').to_numpy(dtype=float)
+    return columns
+
+
+def _parse_csv(csv_path: str) -> Dict[str, np.ndarray]:
+    """Row-by-row fallback when pandas is not installed"""
+    with open(csv_path, 'r') as f:
+        rows = list(csv.DictReader(f))
+
+    columns = {field: _clean(row.get(column) for row in rows) for field, column in CSV_COLUMNS.items()}
+    columns['player_id'] = _clean(row.get('ID') or row.get('PlayerID') or '' for row in rows)
+
+    def number(text: str) -> float:
+        try:
+            return float(text)
+        except ValueError:
+            return np.nan
+
+    columns['salary'] = np.array([number(row.get('Salary', '0').replace('$', '').replace(',', ''))
+                                  for row in rows], dtype=float)
+    columns['projection'] = np.array([number(row.get('AvgPointsPerGame', '0') or '10.0')
+                                      for row in rows], dtype=float)
+    return columns
+
+
+def _to_records(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """Structured array with fixed-width string fields (memory-mappable)"""
+    valid = ~np.isnan(columns['salary']) & ~np.isnan(columns['projection'])
+    dtype = [(name, f"U{max(1, max((len(s) for s in columns[name]), default=1))}")
+             for name in STRING_COLUMNS]
+    dtype += [('salary', np.int64), ('projection', np.float64)]
+
+    records = np.zeros(int(valid.sum()), dtype=dtype)
+    for name in STRING_COLUMNS:
+        records[name] = columns[name][valid]
+    records['salary'] = columns['salary'][valid].astype(np.int64)
+    records['projection'] = columns['projection'][valid]
+    return records
+
+
+def load_slate(csv_path: str, cache_dir: Optional[str] = '.dfs_cache') -> np.ndarray:
+    """
+    Parsed salary file as a structured array (see STRING_COLUMNS)
+
+    Rows with an unreadable salary or projection are dropped.
+    """
+    path = None
+    if cache_dir:
+        path = os.path.join(cache_dir, f"slate_{file_hash(csv_path)}.npy")
+        try:
+            records = np.load(path, mmap_mode='r')
+            logger.info(f"Loaded slate snapshot {os.path.basename(path)}")
+            return records
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable slate snapshot: {e}")
+
+    columns = _parse_pandas(csv_path) if PANDAS_AVAILABLE else _parse_csv(csv_path)
+    records = _to_records(columns)
+
+    if path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = path + '.tmp.npy'
+            np.save(tmp, records)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Could not write slate snapshot: {e}")
+    return records
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+LINEUP SOLUTION POOL
+====================
+The K best distinct lineups of a slate, kept for instant re-use
+
+Solved once (DFSOptimizer.solution_pool), then filtered without any new
+solves: when players are scratched, the best surviving lineups are just
+the best rows of the pool that contain none of them.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from compiled_pool import CompiledPool
+
+logger = logging.getLogger(__name__)
+
+
+class SolutionPool:
+    """
+    Ranked lineups over one CompiledPool
+
+    lineups is a K x 10 matrix of pool indices, best lineup first.
+    """
+
+    def __init__(self, pool: CompiledPool, lineups, contest_type: str = 'gpp'):
+        self.pool = pool
+        self.contest_type = contest_type
+        self.lineups = np.asarray(lineups, dtype=np.int64).reshape(-1, 10)
+        self.scores = pool.score[self.lineups].sum(axis=1) if len(self.lineups) else np.zeros(0)
+        # players x lineups incidence, so a scratch is one row lookup
+        self._membership = np.zeros((len(pool), len(self.lineups)), dtype=bool)
+        self._membership[self.lineups, np.arange(len(self.lineups))[:, None]] = True
+
+    def __len__(self) -> int:
+        return len(self.lineups)
+
+    def _player_indices(self, players: Iterable) -> np.ndarray:
+        """Pool indices for player names, Player objects or ints"""
+        names = {}
+        for i, p in enumerate(self.pool.players):
+            names.setdefault(p.name, []).append(i)
+        found = []
+        for p in players:
+            if isinstance(p, (int, np.integer)):
+                found.append(int(p))
+            else:
+                name = p if isinstance(p, str) else p.name
+                if name not in names:
+                    logger.warning(f"Scratched player not in solution pool: {name}")
+                found.extend(names.get(name, []))
+        return np.asarray(found, dtype=np.int64)
+
+    def surviving(self, scratched: Iterable = ()) -> np.ndarray:
+        """Row numbers of lineups containing no scratched player, best first"""
+        scratched = self._player_indices(scratched)
+        if not len(scratched):
+            return np.arange(len(self.lineups))
+        return np.flatnonzero(~self._membership[scratched].any(axis=0))
+
+    def best(self, num_lineups: int = 1, scratched: Iterable = ()) -> List[Dict]:
+        """The num_lineups best lineups that avoid every scratched player"""
+        from optimizer_v2 import DFSOptimizer
+
+        rows = self.surviving(scratched)[:num_lineups]
+        if len(rows) < num_lineups:
+            logger.warning(f"Only {len(rows)}/{num_lineups} pooled lineups survive the scratches")
+        return [DFSOptimizer.build_lineup(self.pool, list(self.lineups[r]), self.contest_type)
+                for r in rows]
+
+    # =====================================
+    # PERSISTENCE
+    # =====================================
+
+    def save(self, path: str):
+        """Write the pool to an .npz file (lineups plus player keys for validation)"""
+        keys = np.array([f"{p.name}|{p.team}|{p.salary}" for p in self.pool.players])
+        np.savez_compressed(path, lineups=self.lineups, keys=keys,
+                            contest_type=np.array(self.contest_type))
+
+    @classmethod
+    def load(cls, path: str, pool: CompiledPool) -> Optional['SolutionPool']:
+        """Read a saved pool; None if it was built from a different player pool"""
+        with np.load(path) as data:
+            keys = [f"{p.name}|{p.team}|{p.salary}" for p in pool.players]
+            if list(data['keys']) != keys:
+                logger.warning(f"Solution pool {path} does not match the current player pool")
+                return None
+            return cls(pool, data['lineups'], str(data['contest_type']))
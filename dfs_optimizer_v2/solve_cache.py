@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SOLVE RESULT CACHE
+==================
+Content-addressed cache of optimizer results
+
+The key hashes everything a solve depends on: player identities,
+positions, teams, salaries, rounded scores, contest type, optimizer
+settings and lineup count, plus the run's own settings (e.g. diversity
+seed and caps). Identical inputs therefore return the stored lineups (as
+pool indices, with the run's exact flag) without a solve; any change is
+a miss.
+
+Two tiers: an in-memory LRU and pickles in .dfs_cache, stored as
+"<category>_<hash>.pkl" files holding {'value', 'timestamp', 'category'}.
+Each write drops the category's expired files and the oldest ones beyond
+max_disk_entries, so loops that solve thousands of distinct pools do not
+fill the directory.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCORE_DECIMALS = 6  # Scores are rounded before hashing to absorb float noise
+UNKEYED_SETTINGS = {'workers', 'cache_size', 'cache_dir'}
+CACHE_FORMAT = 2  # Bumped when the stored value changes shape
+
+
+def solve_key(pool, contest_type: str, config, num_lineups: int, mode: str = 'optimize',
+              run_settings: Optional[Dict] = None) -> str:
+    """Fingerprint of one solve request (run_settings: mode-specific settings)"""
+    h = hashlib.md5()
+    ids = [f"{getattr(p, 'player_id', '') or p.name}|{p.name}" for p in pool.players]
+    h.update('\n'.join(ids).encode())
+    for array in (pool.salary.astype(np.int64),
+                  np.round(pool.score, SCORE_DECIMALS),
+                  pool.eligibility.astype(np.uint8),
+                  pool.team_idx.astype(np.int64)):
+        h.update(np.ascontiguousarray(array).tobytes())
+
+    # Worker count and cache settings change how a result is found, not the result
+    settings = {k: v for k, v in asdict(config).items() if k not in UNKEYED_SETTINGS}
+    settings['positions'] = config.positions
+    run_settings = sorted((run_settings or {}).items())
+    h.update(repr((CACHE_FORMAT, mode, contest_type, num_lineups, sorted(settings.items()),
+                   run_settings)).encode())
+    return h.hexdigest()
+
+
+class SolveCache:
+    """In-memory LRU in front of an optional on-disk pickle tier"""
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[str] = '.dfs_cache',
+                 category: str = 'solve', ttl_seconds: float = 7 * 24 * 3600,
+                 max_disk_entries: int = 512):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.cache_dir = cache_dir
+        self.category = category
+        self.ttl_seconds = ttl_seconds
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{self.category}_{key}.pkl")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached result ({'lineups': pool index lists, 'exact': bool}) or None"""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    entry = pickle.load(f)
+                if time.time() - entry['timestamp'] <= self.ttl_seconds:
+                    self._remember(key, entry['value'])
+                    self.hits += 1
+                    return entry['value']
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable cache entry {key}: {e}")
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Dict):
+        """Store a result in both tiers"""
+        self._remember(key, value)
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry = {'value': value, 'timestamp': time.time(), 'category': self.category}
+            tmp = self._path(key) + '.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump(entry, f)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            logger.debug(f"Could not write cache entry {key}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        """Delete this category's disk entries past the ttl, then the oldest over max_disk_entries"""
+        prefix = f"{self.category}_"
+        now = time.time()
+        entries = []
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if not (entry.name.startswith(prefix) and entry.name.endswith('.pkl')):
+                    continue
+                modified = entry.stat().st_mtime
+                if now - modified > self.ttl_seconds:
+                    os.remove(entry.path)
+                else:
+                    entries.append((modified, entry.path))
+            entries.sort()
+            for _, path in entries[:max(0, len(entries) - self.max_disk_entries)]:
+                os.remove(path)
+        except OSError as e:
+            logger.debug(f"Could not evict cache entries: {e}")
+
+    def _remember(self, key: str, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-memory tier (disk entries expire by ttl)"""
+        self._memory.clear()
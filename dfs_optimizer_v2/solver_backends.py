@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+SOLVER BACKENDS
+===============
+Pluggable MILP backends for the lineup optimizer
+
+- highs: in-process HiGHS through the highspy bindings (incremental)
+- scipy: in-process HiGHS through scipy.optimize.milp (sparse matrix)
+- cbc:   PuLP + CBC subprocess (always available fallback)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pulp
+
+logger = logging.getLogger(__name__)
+
+try:
+    import highspy
+    HIGHSPY_AVAILABLE = True
+except ImportError:
+    HIGHSPY_AVAILABLE = False
+
+try:
+    from scipy.optimize import milp, LinearConstraint, Bounds
+    from scipy.sparse import csr_matrix
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+@dataclass
+class SolveResult:
+    """Outcome of one backend solve"""
+    status: str  # 'optimal', 'feasible' (incumbent at a limit), 'infeasible' or 'error'
+    x: Optional[np.ndarray] = None
+    objective: float = 0.0
+
+
+class SolverBackend:
+    """
+    Backend interface
+
+    A backend creates one session per model. The session keeps whatever
+    solver state it can between solves and syncs model changes (new rows,
+    objective, bounds, row bounds) before each solve.
+
+    Models expose: objective, lb, ub (arrays), rows (list of (cols, coefs)),
+    row_lo / row_hi (lists) and config. Objectives are maximized.
+
+    session.solve(time_limit) stops at the time limit (default: the
+    config's lineup_time_limit or timeout_seconds) or the config's MIP gaps
+    and returns the incumbent as 'feasible' when it cannot prove optimality.
+    """
+
+    name = 'base'
+
+    def create_session(self, model):
+        raise NotImplementedError
+
+
+class _Session:
+    """Shared change tracking for backend sessions"""
+
+    def __init__(self, model):
+        self.model = model
+        self.synced_rows = 0
+        self.objective = None
+        self.lb = None
+        self.ub = None
+        self.row_lo = []
+        self.row_hi = []
+
+    def _objective_changed(self) -> bool:
+        return self.objective is None or not np.array_equal(self.objective, self.model.objective)
+
+    def _bounds_changed(self) -> bool:
+        return (self.lb is None
+                or not np.array_equal(self.lb, self.model.lb)
+                or not np.array_equal(self.ub, self.model.ub))
+
+    def _changed_row_bounds(self):
+        """Indices of already-synced rows whose bounds changed"""
+        return [r for r in range(self.synced_rows)
+                if self.row_lo[r] != self.model.row_lo[r] or self.row_hi[r] != self.model.row_hi[r]]
+
+    def _limits(self, time_limit: Optional[float]):
+        """(time limit, relative gap, absolute gap) for one solve"""
+        config = self.model.config
+        if time_limit is None:
+            time_limit = getattr(config, 'lineup_time_limit', None) or config.timeout_seconds
+        return (float(time_limit), float(getattr(config, 'mip_rel_gap', 0.0)),
+                float(getattr(config, 'mip_abs_gap', 0.0)))
+
+    def _mark_synced(self):
+        m = self.model
+        self.objective = m.objective.copy()
+        self.lb = m.lb.copy()
+        self.ub = m.ub.copy()
+        self.synced_rows = len(m.rows)
+        self.row_lo = list(m.row_lo)
+        self.row_hi = list(m.row_hi)
+
+
+# =====================================
+# CBC (PuLP)
+# =====================================
+
+class _CbcSession(_Session):
+    """Persistent PuLP problem; CBC still runs as a subprocess per solve"""
+
+    def __init__(self, model):
+        super().__init__(model)
+        n = len(model.objective)
+        self.prob = pulp.LpProblem("DFS_Lineup", pulp.LpMaximize)
+        self.vars = [pulp.LpVariable(f"x_{i}", cat="Binary") for i in range(n)]
+        self.constraints = []  # per row: [ge_name or None, le_name or None]
+
+    def _set_side(self, r, side, rhs):
+        """Create, update or drop one side (0: >=, 1: <=) of a row"""
+        m = self.model
+        names = self.constraints[r]
+        if not np.isfinite(rhs):
+            if names[side] is not None:
+                del self.prob.constraints[names[side]]
+                names[side] = None
+            return
+        if names[side] is None:
+            cols, coefs = m.rows[r]
+            expr = pulp.lpSum(c * self.vars[j] for j, c in zip(cols, coefs))
+            name = f"r{r}_{'ge' if side == 0 else 'le'}"
+            self.prob += ((expr >= rhs) if side == 0 else (expr <= rhs)), name
+            names[side] = name
+        else:
+            self.prob.constraints[names[side]].constant = -rhs
+
+    def _sync(self):
+        m = self.model
+        if self._objective_changed():
+            self.prob.setObjective(pulp.lpSum(float(c) * v for c, v in zip(m.objective, self.vars)))
+        if self._bounds_changed():
+            for v, lo, hi in zip(self.vars, m.lb, m.ub):
+                v.lowBound, v.upBound = float(lo), float(hi)
+        for r in self._changed_row_bounds():
+            self._set_side(r, 0, m.row_lo[r])
+            self._set_side(r, 1, m.row_hi[r])
+        for r in range(self.synced_rows, len(m.rows)):
+            self.constraints.append([None, None])
+            self._set_side(r, 0, m.row_lo[r])
+            self._set_side(r, 1, m.row_hi[r])
+        self._mark_synced()
+
+    def solve(self, time_limit: Optional[float] = None) -> SolveResult:
+        self._sync()
+        limit, rel_gap, abs_gap = self._limits(time_limit)
+        solver = pulp.PULP_CBC_CMD(msg=0, timeLimit=limit,
+                                   gapRel=rel_gap, gapAbs=abs_gap)
+        try:
+            self.prob.solve(solver)
+        except pulp.PulpSolverError as e:
+            logger.error(f"CBC solve failed: {e}")
+            return SolveResult('error')
+
+        # CBC reports a time-limited incumbent as Optimal status with an
+        # integer-feasible solution status
+        if self.prob.status != pulp.LpStatusOptimal:
+            return SolveResult('infeasible')
+        status = 'optimal' if self.prob.sol_status == pulp.LpSolutionOptimal else 'feasible'
+
+        x = np.array([v.varValue or 0.0 for v in self.vars])
+        return SolveResult(status, x, float(pulp.value(self.prob.objective) or 0.0))
+
+
+class CbcBackend(SolverBackend):
+    name = 'cbc'
+
+    def create_session(self, model):
+        return _CbcSession(model)
+
+
+# =====================================
+# SCIPY (scipy.optimize.milp)
+# =====================================
+
+class _ScipySession(_Session):
+    """Sparse constraint matrix, extended in place as rows are added"""
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.indptr = [0]
+        self.indices = []
+        self.data = []
+        self.matrix = None
+
+    def _sync(self):
+        m = self.model
+        if self.matrix is None or self.synced_rows < len(m.rows):
+            for cols, coefs in m.rows[self.synced_rows:]:
+                self.indices.extend(cols)
+                self.data.extend(coefs)
+                self.indptr.append(len(self.indices))
+            self.matrix = csr_matrix((self.data, self.indices, self.indptr),
+                                     shape=(len(self.indptr) - 1, len(m.objective)))
+        self._mark_synced()
+
+    def solve(self, time_limit: Optional[float] = None) -> SolveResult:
+        self._sync()
+        m = self.model
+        n = len(m.objective)
+        limit, rel_gap, _ = self._limits(time_limit)  # milp has no absolute gap option
+        options = {'disp': False, 'time_limit': limit, 'mip_rel_gap': rel_gap}
+        try:
+            res = milp(
+                c=-m.objective,
+                constraints=LinearConstraint(self.matrix, np.array(m.row_lo), np.array(m.row_hi)),
+                integrality=np.ones(n),
+                bounds=Bounds(m.lb, m.ub),
+                options=options,
+            )
+        except ValueError as e:
+            logger.error(f"scipy milp failed: {e}")
+            return SolveResult('error')
+
+        if res.x is None or res.status not in (0, 1):
+            return SolveResult('infeasible')
+        # status 1: time/iteration limit reached with an incumbent
+        return SolveResult('optimal' if res.status == 0 else 'feasible', res.x, -float(res.fun))
+
+
+class ScipyMilpBackend(SolverBackend):
+    name = 'scipy'
+
+    def create_session(self, model):
+        return _ScipySession(model)
+
+
+# =====================================
+# HIGHS (highspy)
+# =====================================
+
+class _HighsSession(_Session):
+    """Persistent HiGHS instance updated incrementally between solves"""
+
+    def __init__(self, model):
+        super().__init__(model)
+        n = len(model.objective)
+        self.h = highspy.Highs()
+        self.h.setOptionValue('output_flag', False)
+        # Fixed seed: identical models give identical answers without discarding warm state
+        self.h.setOptionValue('random_seed', 0)
+        self.h.addVars(n, model.lb, model.ub)
+        self.h.changeColsIntegrality(n, np.arange(n, dtype=np.int32),
+                                     np.array([highspy.HighsVarType.kInteger] * n))
+        self.h.changeObjectiveSense(highspy.ObjSense.kMaximize)
+
+    @staticmethod
+    def _inf(value):
+        return value if np.isfinite(value) else (highspy.kHighsInf if value > 0 else -highspy.kHighsInf)
+
+    def _sync(self):
+        m = self.model
+        n = len(m.objective)
+        idx = np.arange(n, dtype=np.int32)
+        if self._objective_changed():
+            self.h.changeColsCost(n, idx, m.objective.astype(float))
+        if self._bounds_changed():
+            self.h.changeColsBounds(n, idx, m.lb.astype(float), m.ub.astype(float))
+        for r in self._changed_row_bounds():
+            self.h.changeRowBounds(r, self._inf(m.row_lo[r]), self._inf(m.row_hi[r]))
+        for r in range(self.synced_rows, len(m.rows)):
+            cols, coefs = m.rows[r]
+            self.h.addRow(self._inf(m.row_lo[r]), self._inf(m.row_hi[r]), len(cols),
+                          np.asarray(cols, dtype=np.int32), np.asarray(coefs, dtype=float))
+        self._mark_synced()
+
+    def solve(self, time_limit: Optional[float] = None) -> SolveResult:
+        self._sync()
+        limit, rel_gap, abs_gap = self._limits(time_limit)
+        self.h.setOptionValue('time_limit', limit)
+        self.h.setOptionValue('mip_rel_gap', rel_gap)
+        self.h.setOptionValue('mip_abs_gap', abs_gap)
+        self.h.run()
+
+        status = self.h.getModelStatus()
+        if status == highspy.HighsModelStatus.kOptimal:
+            result = 'optimal'
+        elif self.h.getInfo().primal_solution_status == 2:  # feasible incumbent at a limit
+            result = 'feasible'
+        else:
+            return SolveResult('infeasible')
+        x = np.array(self.h.getSolution().col_value)
+        return SolveResult(result, x, float(self.h.getInfo().objective_function_value))
+
+
+class HighsBackend(SolverBackend):
+    name = 'highs'
+
+    def create_session(self, model):
+        return _HighsSession(model)
+
+
+# =====================================
+# REGISTRY
+# =====================================
+
+BACKENDS = {
+    'highs': (HighsBackend, lambda: HIGHSPY_AVAILABLE),
+    'scipy': (ScipyMilpBackend, lambda: SCIPY_AVAILABLE),
+    'cbc': (CbcBackend, lambda: True),
+}
+
+
+def available_backends() -> list:
+    """Names of backends usable in this environment, fastest first"""
+    return [name for name, (_, check) in BACKENDS.items() if check()]
+
+
+def get_backend(name: str = 'auto') -> SolverBackend:
+    """Resolve a backend by name; 'auto' picks the fastest available one"""
+    if name == 'auto':
+        name = available_backends()[0]
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown solver backend: {name}")
+
+    backend_cls, check = BACKENDS[name]
+    if not check():
+        logger.warning(f"Solver backend '{name}' not available - falling back to CBC")
+        backend_cls = CbcBackend
+
+    return backend_cls()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+TEAM STACK CATALOG
+==================
+Every valid 3/4/5-man hitter stack of a slate, enumerated once
+
+A stack is a window of consecutive batting-order spots (wrapping 9 -> 1)
+filled by the best-scoring hitter at each spot. Windows are built for all
+teams at once with index arithmetic; a stack is kept only if its players
+can share a DraftKings roster (checked per distinct eligibility combo).
+Teams without batting orders (confirmations not fetched) get one stack
+per size from their best-scoring rosterable hitters instead.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from compiled_pool import CompiledPool, DK_SLOTS, POSITION_BITS
+
+logger = logging.getLogger(__name__)
+
+BATTING_SPOTS = 9
+HITTER_SLOTS = [POSITION_BITS[pos] for pos in DK_SLOTS if pos != 'P']
+_ROSTER_FIT: Dict[Tuple[int, ...], bool] = {}
+
+
+def _fits_roster(masks: Tuple[int, ...]) -> bool:
+    """Can hitters with these eligibility masks fill distinct hitter slots?"""
+    if masks not in _ROSTER_FIT:
+        used = [False] * len(HITTER_SLOTS)
+
+        def place(k: int) -> bool:
+            if k == len(masks):
+                return True
+            for s, bit in enumerate(HITTER_SLOTS):
+                if not used[s] and masks[k] & bit:
+                    used[s] = True
+                    if place(k + 1):
+                        return True
+                    used[s] = False
+            return False
+
+        _ROSTER_FIT[masks] = place(0)
+    return _ROSTER_FIT[masks]
+
+
+class StackCatalog:
+    """
+    Stacks as parallel arrays (one entry per stack)
+
+    members is a (num_stacks, 5) matrix of pool indices padded with -1.
+    """
+
+    def __init__(self, pool: CompiledPool, sizes: Iterable[int] = (3, 4, 5)):
+        self.pool = pool
+        self.sizes = tuple(sorted(sizes))
+        self.members, self.team_idx, self.size = self._enumerate(pool, self.sizes)
+
+        filled = np.where(self.members >= 0, self.members, 0)
+        valid = self.members >= 0
+        self.salary = (pool.salary[filled] * valid).sum(axis=1)
+        self.score = (pool.score[filled] * valid).sum(axis=1)
+        logger.info(f"Stack catalog: {len(self)} stacks over {len(set(self.team_idx.tolist()))} teams")
+
+    def __len__(self) -> int:
+        return len(self.size)
+
+    @staticmethod
+    def _enumerate(pool: CompiledPool, sizes: Tuple[int, ...]):
+        """(members, team_idx, size) arrays for every rosterable window"""
+        num_teams = len(pool.teams)
+        width = max(sizes) if sizes else 0
+        order = np.array([getattr(p, 'batting_order', 0) or 0 for p in pool.players], dtype=np.int64)
+        hitters = np.flatnonzero(~pool.is_pitcher & (order >= 1) & (order <= BATTING_SPOTS))
+
+        # spot_player[team, spot]: best-scoring hitter batting there (-1 if none)
+        spot_player = np.full((num_teams, BATTING_SPOTS), -1, dtype=np.int64)
+        for i in hitters[np.argsort(pool.score[hitters], kind='stable')]:
+            spot_player[pool.team_idx[i], order[i] - 1] = i
+
+        members, team_idx, size = [], [], []
+        for k in sizes:
+            # windows[team, start, j] = player at spot (start + j) mod 9
+            spots = (np.arange(BATTING_SPOTS)[:, None] + np.arange(k)[None, :]) % BATTING_SPOTS
+            windows = spot_player[:, spots]
+            complete = (windows >= 0).all(axis=2)
+            for t, start in zip(*np.nonzero(complete)):
+                window = windows[t, start]
+                masks = tuple(sorted(int(pool.eligibility[i]) for i in window))
+                if not _fits_roster(masks):
+                    continue
+                members.append(np.pad(window, (0, width - k), constant_values=-1))
+                team_idx.append(t)
+                size.append(k)
+
+        # Teams with no batting orders stack their best hitters that share a roster
+        all_hitters = np.flatnonzero(~pool.is_pitcher)
+        ranked = all_hitters[np.argsort(-pool.score[all_hitters], kind='stable')]
+        unordered = sorted(set(pool.team_idx[all_hitters].tolist())
+                           - set(pool.team_idx[hitters].tolist()))
+        if unordered:
+            logger.warning(f"No batting orders for {len(unordered)} teams - stacking their "
+                           f"best-scoring hitters instead (fetch confirmations for order stacks)")
+        for t in unordered:
+            chosen = []
+            for i in ranked[pool.team_idx[ranked] == t]:
+                if _fits_roster(tuple(sorted(int(pool.eligibility[j]) for j in chosen + [i]))):
+                    chosen.append(int(i))
+                    if len(chosen) == width:
+                        break
+            for k in sizes:
+                if len(chosen) >= k:
+                    members.append(np.pad(chosen[:k], (0, width - k), constant_values=-1))
+                    team_idx.append(t)
+                    size.append(k)
+
+        if not members:
+            return (np.zeros((0, width), dtype=np.int64), np.zeros(0, dtype=np.int64),
+                    np.zeros(0, dtype=np.int64))
+        return np.array(members), np.array(team_idx), np.array(size)
+
+    def players(self, stack: int) -> List[int]:
+        """Pool indices of one stack"""
+        return [int(i) for i in self.members[stack] if i >= 0]
+
+    def team(self, stack: int) -> str:
+        return self.pool.teams[self.team_idx[stack]]
+
+    def best(self, num_stacks: int = 10, sizes: Optional[Iterable[int]] = None,
+             teams: Optional[Iterable[str]] = None, max_salary: Optional[int] = None) -> List[int]:
+        """Stack numbers by score, optionally filtered by size, team and salary"""
+        keep = np.ones(len(self), dtype=bool)
+        if sizes is not None:
+            keep &= np.isin(self.size, list(sizes))
+        if teams is not None:
+            codes = [self.pool.teams.index(t) for t in teams if t in self.pool.teams]
+            keep &= np.isin(self.team_idx, codes)
+        if max_salary is not None:
+            keep &= self.salary <= max_salary
+        candidates = np.flatnonzero(keep)
+        ranked = candidates[np.argsort(-self.score[candidates], kind='stable')]
+        return [int(s) for s in ranked[:num_stacks]]
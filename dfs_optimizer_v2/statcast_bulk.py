@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+BULK STATCAST AGGREGATES
+========================
+Slate-wide Statcast stats from one pitch-level pull
+
+Instead of a playerid_lookup plus a statcast_batter/statcast_pitcher
+request per player, the last 30 days of Statcast are pulled once
+(league-wide, or only the slate's teams) and reduced with one groupby
+per side: barrel%, xwOBA, hard-hit% and exit velocity per batter,
+pitches and strikeouts per pitcher. Names are resolved for all player
+IDs in the frame with a single playerid_reverse_lookup. The pull is
+kept for the rest of the day, so later lookups are dictionary accesses.
+With a StatcastStore the pitches come from the local database instead,
+which only downloads the days it has not stored yet.
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pybaseball import statcast, playerid_reverse_lookup
+    PYBASEBALL_AVAILABLE = True
+except ImportError:
+    PYBASEBALL_AVAILABLE = False
+
+# DraftKings abbreviations that Baseball Savant spells differently
+SAVANT_TEAMS = {'WAS': 'WSH', 'ARI': 'AZ', 'CHW': 'CWS', 'KCR': 'KC', 'SDP': 'SD',
+                'SFG': 'SF', 'TBR': 'TB'}
+
+# Same fallbacks as SimpleStatcastFetcher when a batter has no batted balls
+BATTER_FALLBACKS = {'barrel%': 8.5, 'xwoba': 0.320, 'hard_hit%': 40.0, 'avg_exit_velo': 88.0}
+
+_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+
+def name_key(first: str, last: str) -> str:
+    """Accent/punctuation-insensitive 'first last' key ('J.D.' == 'J. D.')"""
+    def fold(text: str) -> str:
+        text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode()
+        return re.sub(r"[.'\s]", '', text.lower())
+
+    surname = [t for t in str(last).split() if fold(t) not in _SUFFIXES]
+    return f"{fold(first)} {fold(surname[-1] if surname else last)}"
+
+
+def dk_name_key(full_name: str) -> str:
+    """name_key of a DraftKings 'First [Middle] Last [Jr.]' name"""
+    parts = [p for p in full_name.split() if p.lower().strip('.') not in _SUFFIXES]
+    if len(parts) < 2:
+        return name_key(full_name, '')
+    return name_key(parts[0], parts[-1])
+
+
+def batter_aggregates(frame: pd.DataFrame) -> pd.DataFrame:
+    """barrel%, xwoba, hard_hit%, avg_exit_velo and pitches seen per batter ID"""
+    speed = frame['launch_speed']
+    angle = frame['launch_angle']
+    columns = pd.DataFrame({
+        'batter': frame['batter'],
+        'batted': speed.notna(),
+        'barrel': (speed >= 98) & (angle >= 26) & (angle <= 30),
+        'hard': speed >= 95,
+        'speed': speed,
+        'xwoba': frame['estimated_woba_using_speedangle'],
+    })
+    agg = columns.groupby('batter').agg(pitches=('batted', 'size'), batted=('batted', 'sum'),
+                                        barrels=('barrel', 'sum'), hard=('hard', 'sum'),
+                                        avg_exit_velo=('speed', 'mean'), xwoba=('xwoba', 'mean'))
+
+    batted = agg['batted'].where(agg['batted'] > 0)
+    stats = pd.DataFrame({
+        'barrel%': agg['barrels'] / batted * 100,
+        'xwoba': agg['xwoba'],
+        'hard_hit%': agg['hard'] / batted * 100,
+        'avg_exit_velo': agg['avg_exit_velo'],
+    }).fillna(BATTER_FALLBACKS)
+    stats['pitches'] = agg['pitches']
+    return stats
+
+
+def pitcher_aggregates(frame: pd.DataFrame) -> pd.DataFrame:
+    """pitches and strikeouts per pitcher ID"""
+    columns = pd.DataFrame({'pitcher': frame['pitcher'],
+                            'strikeout': frame['events'] == 'strikeout'})
+    return columns.groupby('pitcher').agg(pitches=('strikeout', 'size'),
+                                          strikeouts=('strikeout', 'sum'))
+
+
+class SlateStatcast:
+    """Per-player Statcast aggregates for one pull, looked up by player name"""
+
+    def __init__(self, batters: pd.DataFrame, pitchers: pd.DataFrame, names: Dict[int, str]):
+        self.batters = batters
+        self.pitchers = pitchers
+        self.batter_ids = self._index(batters, names)
+        self.pitcher_ids = self._index(pitchers, names)
+
+    @staticmethod
+    def _index(stats: pd.DataFrame, names: Dict[int, str]) -> Dict[str, int]:
+        """name key -> ID; shared keys go to the player with the most pitches"""
+        index = {}
+        for mlbam in stats.sort_values('pitches').index:
+            key = names.get(int(mlbam))
+            if key:
+                index[key] = int(mlbam)
+        return index
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, names: Optional[Dict[int, str]] = None) -> 'SlateStatcast':
+        """Aggregate a pitch-level frame (names: MLBAM ID -> name_key, looked up if omitted)"""
+        batters = batter_aggregates(frame)
+        pitchers = pitcher_aggregates(frame)
+        if names is None:
+            names = lookup_names(set(batters.index) | set(pitchers.index))
+        return cls(batters, pitchers, names)
+
+    def batter(self, player_name: str) -> Optional[Dict]:
+        mlbam = self.batter_ids.get(dk_name_key(player_name))
+        if mlbam is None:
+            return None
+        row = self.batters.loc[mlbam]
+        return {stat: float(row[stat]) for stat in BATTER_FALLBACKS}
+
+    def pitcher(self, player_name: str) -> Optional[Tuple[int, int]]:
+        """(pitches, strikeouts) in the window"""
+        mlbam = self.pitcher_ids.get(dk_name_key(player_name))
+        if mlbam is None:
+            return None
+        row = self.pitchers.loc[mlbam]
+        return int(row['pitches']), int(row['strikeouts'])
+
+
+def lookup_names(ids: Iterable[int]) -> Dict[int, str]:
+    """MLBAM ID -> name_key for every ID, from one reverse lookup"""
+    people = playerid_reverse_lookup([int(i) for i in ids], key_type='mlbam')
+    return {int(row.key_mlbam): name_key(row.name_first, row.name_last)
+            for row in people.itertuples(index=False)}
+
+
+def fetch_window(start: date, end: date, teams: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Pitch-level Statcast rows for the dates (all games, or games of the teams)"""
+    start_dt, end_dt = start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+    if not teams:
+        return statcast(start_dt=start_dt, end_dt=end_dt, verbose=False)
+
+    frames = [statcast(start_dt=start_dt, end_dt=end_dt, team=SAVANT_TEAMS.get(team, team), verbose=False)
+              for team in sorted(set(teams))]
+    frame = pd.concat(frames, ignore_index=True)
+    # A game between two slate teams comes back once per team
+    return frame.drop_duplicates(['game_pk', 'at_bat_number', 'pitch_number'])
+
+
+_windows: Dict[tuple, SlateStatcast] = {}
+_windows_lock = threading.Lock()
+
+
+def load_window(days: int = 30, teams: Optional[Iterable[str]] = None,
+                store=None, offline: bool = False) -> SlateStatcast:
+    """
+    Aggregates for the last days
+
+    From the store when given (offline = stored data only), otherwise
+    pulled at most once per day per team set.
+    """
+    if store is not None:
+        return store.slate(days, teams, offline)
+
+    end = date.today()
+    key = (end, days, tuple(sorted(set(teams))) if teams else None)
+    with _windows_lock:
+        if key not in _windows:
+            scope = f"{len(key[2])} teams" if key[2] else 'league-wide'
+            logger.info(f"Pulling {days} days of Statcast ({scope})...")
+            frame = fetch_window(end - timedelta(days=days), end, teams)
+            _windows.clear()  # Older days are stale
+            _windows[key] = SlateStatcast.from_frame(frame)
+            logger.info(f"Statcast window: {len(frame):,} pitches, "
+                        f"{len(_windows[key].batters)} batters, {len(_windows[key].pitchers)} pitchers")
+        return _windows[key]
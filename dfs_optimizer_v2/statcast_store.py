@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+PERSISTENT STATCAST STORE
+=========================
+Local SQLite copy of league-wide Statcast pitches plus derived aggregates
+
+Tables:
+- pitches:    raw pitch-level rows (the columns the aggregates use), keyed
+              by (game_pk, at_bat_number, pitch_number)
+- players:    MLBAM ID -> name key, filled once per new ID
+- aggregates: per-player window aggregates (JSON rows), cleared whenever
+              new pitches arrive
+- meta:       last complete date and last refresh time
+
+A refresh only downloads the dates after the last complete stored date
+(today is always re-fetched, its games may still be in progress), and
+not more than once per TTL. Offline mode never touches the network and
+serves whatever is stored.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from datetime import date, timedelta
+from io import StringIO
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+
+from statcast_bulk import SAVANT_TEAMS, SlateStatcast, batter_aggregates, fetch_window, \
+    lookup_names, pitcher_aggregates
+
+logger = logging.getLogger(__name__)
+
+RAW_COLUMNS = ('game_pk', 'at_bat_number', 'pitch_number', 'game_date', 'home_team', 'away_team',
+               'batter', 'pitcher', 'events', 'launch_speed', 'launch_angle',
+               'estimated_woba_using_speedangle')
+REFRESH_TTL = 3600.0  # Seconds between network refreshes
+HISTORY_DAYS = 30     # Days fetched into an empty store
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pitches (
+    game_pk INTEGER, at_bat_number INTEGER, pitch_number INTEGER, game_date TEXT,
+    home_team TEXT, away_team TEXT, batter INTEGER, pitcher INTEGER, events TEXT,
+    launch_speed REAL, launch_angle REAL, estimated_woba_using_speedangle REAL,
+    PRIMARY KEY (game_pk, at_bat_number, pitch_number)
+);
+CREATE INDEX IF NOT EXISTS pitches_date ON pitches (game_date);
+CREATE TABLE IF NOT EXISTS players (mlbam INTEGER PRIMARY KEY, name_key TEXT);
+CREATE TABLE IF NOT EXISTS aggregates (
+    end_date TEXT, days INTEGER, scope TEXT, role TEXT, stats TEXT,
+    PRIMARY KEY (end_date, days, scope, role)
+);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class StatcastStore:
+    """SQLite Statcast store with incremental daily refresh"""
+
+    def __init__(self, path: str = os.path.join('.dfs_cache', 'statcast.sqlite'),
+                 ttl: float = REFRESH_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection committed on success, rolled back on error, always closed"""
+        with closing(sqlite3.connect(self.path, timeout=30)) as db, db:
+            yield db
+
+    def _meta(self, db, key: str) -> Optional[str]:
+        row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def last_date(self) -> Optional[date]:
+        """Last date whose games are completely stored"""
+        with self._connect() as db:
+            value = self._meta(db, 'last_date')
+        return date.fromisoformat(value) if value else None
+
+    def latest_date(self) -> Optional[date]:
+        """Date of the newest stored pitch"""
+        with self._connect() as db:
+            value = db.execute("SELECT MAX(game_date) FROM pitches").fetchone()[0]
+        return date.fromisoformat(value) if value else None
+
+    def refresh(self, today: Optional[date] = None, force: bool = False) -> int:
+        """Download the dates after the last complete stored date; returns rows added"""
+        today = today or date.today()
+        with self._lock, self._connect() as db:
+            refreshed = float(self._meta(db, 'refreshed_at') or 0)
+            if not force and time.time() - refreshed < self.ttl:
+                return 0
+
+            last = self._meta(db, 'last_date')
+            start = date.fromisoformat(last) + timedelta(days=1) if last \
+                else today - timedelta(days=HISTORY_DAYS)
+            added = 0
+            if start <= today:
+                logger.info(f"Statcast store: fetching {start} to {today}")
+                frame = fetch_window(start, today)
+                added = self._insert(db, frame)
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('last_date', ?)",
+                       ((today - timedelta(days=1)).isoformat(),))
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('refreshed_at', ?)", (str(time.time()),))
+            if added:
+                db.execute("DELETE FROM aggregates")  # Windows changed
+            logger.info(f"Statcast store: {added:,} new pitches")
+            return added
+
+    def _insert(self, db, frame: pd.DataFrame) -> int:
+        if frame is None or frame.empty:
+            return 0
+        frame = frame.reindex(columns=list(RAW_COLUMNS))
+        frame['game_date'] = pd.to_datetime(frame['game_date']).dt.strftime('%Y-%m-%d')
+        rows = frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+        before = db.total_changes
+        db.executemany(f"INSERT OR REPLACE INTO pitches VALUES ({', '.join('?' * len(RAW_COLUMNS))})",
+                       rows)
+        return db.total_changes - before
+
+    def pitches(self, start: date, end: date, teams: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Stored rows for the dates (all games, or games of the teams)"""
+        query = "SELECT * FROM pitches WHERE game_date BETWEEN ? AND ?"
+        params = [start.isoformat(), end.isoformat()]
+        if teams:
+            teams = sorted({SAVANT_TEAMS.get(team, team) for team in teams})
+            marks = ', '.join('?' * len(teams))
+            query += f" AND (home_team IN ({marks}) OR away_team IN ({marks}))"
+            params += teams + teams
+        with self._connect() as db:
+            return pd.read_sql_query(query, db, params=params)
+
+    def names(self, ids, offline: bool = False) -> dict:
+        """MLBAM ID -> name key; unknown IDs are looked up once (unless offline)"""
+        ids = {int(i) for i in ids}
+        with self._connect() as db:
+            known = dict(db.execute("SELECT mlbam, name_key FROM players").fetchall())
+            missing = ids - set(known)
+            if missing and not offline:
+                found = lookup_names(missing)
+                db.executemany("INSERT OR REPLACE INTO players VALUES (?, ?)", found.items())
+                known.update(found)
+        return known
+
+    def slate(self, days: int = 30, teams: Optional[Iterable[str]] = None,
+              offline: bool = False) -> SlateStatcast:
+        """Aggregates for the last days, refreshing the store first unless offline"""
+        if not offline:
+            self.refresh()
+            end = date.today()
+        else:
+            end = self.latest_date()  # Window ends with the newest stored games
+            if end is None:
+                raise ValueError("Statcast store is empty")
+        scope = ','.join(sorted(set(teams))) if teams else ''
+        key = (end.isoformat(), days, scope)
+
+        with self._connect() as db:
+            stored = dict(db.execute("SELECT role, stats FROM aggregates WHERE end_date = ? "
+                                     "AND days = ? AND scope = ?", key).fetchall())
+        if len(stored) == 2:
+            batters = pd.read_json(StringIO(stored['batter']), orient='split')
+            pitchers = pd.read_json(StringIO(stored['pitcher']), orient='split')
+        else:
+            frame = self.pitches(end - timedelta(days=days), end, teams)
+            if frame.empty:
+                raise ValueError("No stored Statcast pitches for the window")
+            batters, pitchers = batter_aggregates(frame), pitcher_aggregates(frame)
+            with self._connect() as db:
+                db.executemany("INSERT OR REPLACE INTO aggregates VALUES (?, ?, ?, ?, ?)",
+                               [key + ('batter', batters.to_json(orient='split')),
+                                key + ('pitcher', pitchers.to_json(orient='split'))])
+
+        names = self.names(set(batters.index) | set(pitchers.index), offline)
+        return SlateStatcast(batters, pitchers, names)
@@ -20,8 +20,10 @@ from typing import List, Tuple
 import logging
 try:
     from .statcast_value_engine import StatcastValueEngine
+    from .player_table import set_extra
 except ImportError:
     from statcast_value_engine import StatcastValueEngine
+    from player_table import set_extra
 
 logger = logging.getLogger(__name__)
 
@@ -149,8 +151,8 @@ class StrategyManager:
                 # OPTIMIZED: Higher value threshold (3.5 vs 3.0) with Statcast enhancement
                 if statcast_value >= 3.5 and team_total >= 5.0:  # OPTIMIZED thresholds
                     player.optimization_score *= 1.08  # OPTIMIZED boost
-                    player.value_play = True
-                    player.statcast_value = statcast_value  # Store for analysis
+                    set_extra(player, 'value_play', True)
+                    set_extra(player, 'statcast_value', statcast_value)  # Store for analysis
 
                 # OPTIMIZED: Team total boost (only if not already a value play)
                 elif team_total >= 5.0:  # OPTIMIZED threshold
@@ -276,8 +278,8 @@ class StrategyManager:
                 # Boost value plays in good spots (using Statcast value)
                 if statcast_value >= 3.0 and team_total >= 4.5:
                     player.optimization_score *= 1.08
-                    player.value_play = True
-                    player.statcast_value = statcast_value  # Store for analysis
+                    set_extra(player, 'value_play', True)
+                    set_extra(player, 'statcast_value', statcast_value)  # Store for analysis
 
         return players
 
@@ -304,6 +306,35 @@ class StrategyManager:
 
 
 
+    # Stack shapes the stacking strategies build around (team total threshold
+    # matches each strategy's hitter boost)
+    STACK_PREFERENCES = {
+        'tournament_winner_gpp': {'sizes': (4, 5), 'min_team_total': 5.0},
+        'optimized_tournament_winner_gpp': {'sizes': (4, 5), 'min_team_total': 5.2},
+    }
+
+    def select_stacks(self, catalog, strategy: str, num_stacks: int = 10) -> List[int]:
+        """
+        Catalog stacks a strategy wants to build around, best first
+
+        Teams at or above the strategy's implied total come first; returns
+        [] for strategies that do not stack.
+        """
+        prefs = self.STACK_PREFERENCES.get(strategy)
+        if prefs is None:
+            return []
+
+        team_totals = {}
+        for player in catalog.pool.players:
+            team_totals.setdefault(player.team, getattr(player, 'implied_team_score', 4.5))
+        hot = [t for t, total in team_totals.items() if total >= prefs['min_team_total']]
+
+        stacks = catalog.best(num_stacks, prefs['sizes'], teams=hot)
+        if len(stacks) < num_stacks:
+            rest = [s for s in catalog.best(num_stacks * 2, prefs['sizes']) if s not in stacks]
+            stacks += rest[:num_stacks - len(stacks)]
+        return stacks
+
     def get_all_strategies(self) -> dict:
         """Get all available strategies with descriptions"""
 
@@ -22,6 +22,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import your actual DFS system
 sys.path.append('dfs_optimizer_v2')
 from data_pipeline_v2 import DFSPipeline, Player
+from player_table import PlayerTable, set_extra
 from strategies_v2 import StrategyManager
 
 # Import simulation components
@@ -90,8 +91,8 @@ class StrategyTournament:
             player.park_factor = 1.0  # Simulated default
 
             # Add attributes for your DFS insights
-            player.hr_rate = getattr(sim_player, 'hr_rate', 0.03)  # HR rate for power targeting
-            player.win_probability = getattr(sim_player, 'win_probability', 0.5)  # Win prob for pitchers
+            set_extra(player, 'hr_rate', getattr(sim_player, 'hr_rate', 0.03))  # HR rate for power targeting
+            set_extra(player, 'win_probability', getattr(sim_player, 'win_probability', 0.5))  # Win prob for pitchers
             
             your_players.append(player)
             
@@ -141,17 +142,14 @@ class StrategyTournament:
             lineups = self.pipeline.optimize_lineups(contest_type, 1)
             
             if lineups and len(lineups) > 0:
-                # Convert back to simulation format
-                lineup_players = []
-                for player in lineups[0]['players']:
-                    # Find corresponding sim player
-                    for sim_player in slate_players:
-                        if (sim_player.name == player.name and 
-                            sim_player.position == player.position):
-                            lineup_players.append(sim_player)
-                            break
-                
-                return lineup_players
+                # Convert back to simulation format: the pipeline's table has
+                # one row per converted player, in slate order
+                _, rows = PlayerTable.backing(self.pipeline.compiled_pool.players)
+                lineup = [slate_players[rows[i]] for i in lineups[0]['indices']]
+                if len(lineup) != 10:
+                    print(f"Lineup with {strategy_name} has {len(lineup)} players, expected 10")
+                    return None
+                return lineup
             
             return None
             
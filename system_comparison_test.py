@@ -10,6 +10,7 @@ import os
 sys.path.append('dfs_optimizer_v2')
 
 from data_pipeline_v2 import Player
+from player_table import get_extra
 from strategies_v2 import StrategyManager
 from statcast_value_engine import StatcastValueEngine
 
@@ -170,7 +171,7 @@ class SystemComparison:
         for player in enhanced_players:
             if player.position not in ['P', 'SP', 'RP']:
                 new_boost = player.optimization_score / player.projection
-                new_value_play = getattr(player, 'value_play', False)
+                new_value_play = get_extra(player, 'value_play', False)
                 
                 if old_idx < len(old_results):
                     old_name, old_boost, old_value_play = old_results[old_idx]